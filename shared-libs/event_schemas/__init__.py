@@ -5,10 +5,59 @@ Provides standardized event schemas and validation for all TuringMachines
 services to ensure consistent data flow and interoperability.
 """
 
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Final, FrozenSet, List, Optional, Tuple, Type, TypeVar, Union
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import lru_cache
 import json
+import sys
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+_JSON_SEPARATORS = (",", ":")
+
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=_JSON_SEPARATORS).encode()
+
+
+if orjson is not None:
+    _loads = orjson.loads
+else:
+    _loads = json.loads
+
+_E = TypeVar("_E", bound="BaseEvent")
+
+
+def _intern(value: Any) -> Any:
+    """Intern exact ``str`` values; leave anything else unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Field names of an event dataclass, computed once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+# Required keys per event kind, checked with a single subset test
+_BASE_REQUIRED = frozenset(("event_id", "event_type", "timestamp", "source_service"))
+_RISK_REQUIRED = _BASE_REQUIRED | frozenset(("risk_level", "fraud_score", "aml_score"))
+_SETTLE_REQUIRED = _BASE_REQUIRED | frozenset(("amount", "currency", "decision"))
 
 
 class EventType(Enum):
@@ -23,7 +72,20 @@ class EventType(Enum):
     OVERRIDE_APPLIED = "override.applied"
 
 
-@dataclass
+# Plain string event types for emission paths (skips Enum .value lookups)
+EVT_USER_CREATED: Final[str] = EventType.USER_CREATED.value
+EVT_USER_VERIFIED: Final[str] = EventType.USER_VERIFIED.value
+EVT_TRANSACTION_INITIATED: Final[str] = EventType.TRANSACTION_INITIATED.value
+EVT_TRANSACTION_COMPLETED: Final[str] = EventType.TRANSACTION_COMPLETED.value
+EVT_RISK_ASSESSED: Final[str] = EventType.RISK_ASSESSED.value
+EVT_SETTLEMENT_AUTHORIZED: Final[str] = EventType.SETTLEMENT_AUTHORIZED.value
+EVT_SETTLEMENT_BLOCKED: Final[str] = EventType.SETTLEMENT_BLOCKED.value
+EVT_OVERRIDE_APPLIED: Final[str] = EventType.OVERRIDE_APPLIED.value
+
+EVENT_TYPE_STRINGS: Final[Dict[EventType, str]] = {m: m.value for m in EventType}
+
+
+@dataclass(slots=True)
 class BaseEvent:
     """Base event structure for all TuringMachines events."""
     event_id: str
@@ -35,19 +97,57 @@ class BaseEvent:
     jurisdiction: str = "default"
     metadata: Optional[Dict[str, Any]] = None
     
+    def __post_init__(self) -> None:
+        # Low-cardinality labels are interned so lookups and comparisons
+        # on them short-circuit on identity
+        self.event_type = _intern(self.event_type)
+        self.source_service = _intern(self.source_service)
+        self.jurisdiction = _intern(self.jurisdiction)
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert event to dictionary."""
-        data = asdict(self)
+        """Convert event to dictionary (shallow; metadata is not copied)."""
+        data = {name: getattr(self, name) for name in _field_names(type(self))}
         if self.metadata is None:
-            data.pop("metadata")
+            del data["metadata"]
         return data
     
     def to_json(self) -> str:
-        """Convert event to JSON string."""
-        return json.dumps(self.to_dict())
+        """Convert event to compact JSON string."""
+        return _dumps(self.to_dict()).decode()
+    
+    @classmethod
+    def from_json(cls: Type[_E], data: Union[str, bytes]) -> _E:
+        """
+        Decode an event of this type from JSON.
+        
+        With msgspec installed the payload is decoded straight into the
+        dataclass and field types are checked in C; otherwise only the
+        presence of required fields is enforced. Unknown keys are ignored.
+        
+        Args:
+            data: JSON string or bytes
+            
+        Returns:
+            Event instance
+            
+        Raises:
+            ValueError: If the payload is not a valid event of this type
+        """
+        if msgspec is not None:
+            try:
+                return msgspec.json.decode(data, type=cls)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+        
+        payload = _loads(data)
+        names = _field_names(cls)
+        try:
+            return cls(**{k: v for k, v in payload.items() if k in names})
+        except (AttributeError, TypeError) as e:
+            raise ValueError(f"Invalid {cls.__name__} payload: {e}") from e
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskAssessmentEvent(BaseEvent):
     """Event for risk assessment completion."""
     risk_level: str = "unknown"
@@ -56,9 +156,16 @@ class RiskAssessmentEvent(BaseEvent):
     credit_score: float = 0.0
     liquidity_score: float = 0.0
     decision: str = "pending"
+    
+    def __post_init__(self) -> None:
+        # Explicit base call: zero-argument super() does not work in
+        # slots=True dataclasses
+        BaseEvent.__post_init__(self)
+        self.risk_level = _intern(self.risk_level)
+        self.decision = _intern(self.decision)
 
 
-@dataclass
+@dataclass(slots=True)
 class SettlementEvent(BaseEvent):
     """Event for settlement authorization."""
     amount: float = 0.0
@@ -66,9 +173,15 @@ class SettlementEvent(BaseEvent):
     decision: str = "pending"
     reason: str = ""
     authority: str = "unknown"
+    
+    def __post_init__(self) -> None:
+        BaseEvent.__post_init__(self)
+        self.currency = _intern(self.currency)
+        self.decision = _intern(self.decision)
+        self.authority = _intern(self.authority)
 
 
-@dataclass
+@dataclass(slots=True)
 class OverrideEvent(BaseEvent):
     """Event for override application."""
     override_type: str = "unknown"
@@ -92,30 +205,60 @@ class EventValidator:
         Returns:
             True if event is valid
         """
-        required_fields = ["event_id", "event_type", "timestamp", "source_service"]
-        return all(field in event for field in required_fields)
+        return _BASE_REQUIRED <= event.keys()
     
     @staticmethod
     def validate_risk_event(event: Dict[str, Any]) -> bool:
         """Validate risk assessment event."""
-        if not EventValidator.validate_event(event):
-            return False
-        
-        required_fields = ["risk_level", "fraud_score", "aml_score"]
-        return all(field in event for field in required_fields)
+        return _RISK_REQUIRED <= event.keys()
     
     @staticmethod
     def validate_settlement_event(event: Dict[str, Any]) -> bool:
         """Validate settlement event."""
-        if not EventValidator.validate_event(event):
-            return False
+        return _SETTLE_REQUIRED <= event.keys()
+    
+    @staticmethod
+    def validate_events_batch(events: List[Dict[str, Any]],
+                              required: FrozenSet[str] = _BASE_REQUIRED) -> np.ndarray:
+        """
+        Validate a batch of events against a set of required fields.
         
-        required_fields = ["amount", "currency", "decision"]
-        return all(field in event for field in required_fields)
+        Args:
+            events: Event dictionaries (e.g. one broker poll)
+            required: Field names every event must contain
+            
+        Returns:
+            Boolean mask, True where the event is valid
+        """
+        present = np.fromiter(
+            (len(event.keys() & required) for event in events),
+            dtype=np.int32,
+            count=len(events),
+        )
+        return present == len(required)
+    
+    @staticmethod
+    def validate_risk_events_batch(events: List[Dict[str, Any]]) -> np.ndarray:
+        """Validate a batch of risk assessment events."""
+        return EventValidator.validate_events_batch(events, _RISK_REQUIRED)
+    
+    @staticmethod
+    def validate_settlement_events_batch(events: List[Dict[str, Any]]) -> np.ndarray:
+        """Validate a batch of settlement events."""
+        return EventValidator.validate_events_batch(events, _SETTLE_REQUIRED)
 
 
 __all__ = [
     "EventType",
+    "EVT_USER_CREATED",
+    "EVT_USER_VERIFIED",
+    "EVT_TRANSACTION_INITIATED",
+    "EVT_TRANSACTION_COMPLETED",
+    "EVT_RISK_ASSESSED",
+    "EVT_SETTLEMENT_AUTHORIZED",
+    "EVT_SETTLEMENT_BLOCKED",
+    "EVT_OVERRIDE_APPLIED",
+    "EVENT_TYPE_STRINGS",
     "BaseEvent",
     "RiskAssessmentEvent",
     "SettlementEvent",
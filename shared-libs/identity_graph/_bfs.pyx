@@ -0,0 +1,43 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython BFS kernel for the identity graph.
+
+Same contract as ``_kernels.bfs``: walks the CSR arrays from ``start`` up
+to ``max_depth`` hops and returns visited node indices in BFS order.
+Build with ``python setup.py build_ext --inplace`` from shared-libs.
+"""
+
+import numpy as np
+cimport numpy as cnp
+
+cnp.import_array()
+
+
+cpdef cnp.ndarray bfs(const int[::1] indptr, const int[::1] targets,
+                      int start, int max_depth):
+    cdef Py_ssize_t n = indptr.shape[0] - 1
+    cdef cnp.ndarray queue_arr = np.empty(n, dtype=np.int32)
+    cdef int[::1] queue = queue_arr
+    cdef unsigned char[::1] visited = np.zeros(n, dtype=np.uint8)
+    cdef Py_ssize_t head = 0, tail = 1, level_end = 1
+    cdef int depth = 0
+    cdef int node, nxt, e
+
+    queue[0] = start
+    visited[start] = 1
+
+    with nogil:
+        while head < tail and depth < max_depth:
+            while head < level_end:
+                node = queue[head]
+                head += 1
+                for e in range(indptr[node], indptr[node + 1]):
+                    nxt = targets[e]
+                    if not visited[nxt]:
+                        visited[nxt] = 1
+                        queue[tail] = nxt
+                        tail += 1
+            depth += 1
+            level_end = tail
+
+    return queue_arr[:tail]
@@ -0,0 +1,117 @@
+"""
+Compiled traversal kernels for the identity graph.
+
+The kernels operate directly on the CSR arrays held by ``IdentityGraph``
+and are compiled with numba when it is installed. ``NUMBA_AVAILABLE`` is
+False otherwise, and the graph falls back to its vectorized NumPy path.
+When the optional Cython extension (``_bfs.pyx``) is built, ``cy_bfs``
+is preferred for traversal.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+try:
+    from ._bfs import bfs as cy_bfs
+    CYTHON_AVAILABLE = True
+except ImportError:
+    cy_bfs = None
+    CYTHON_AVAILABLE = False
+
+
+def _bfs(indptr, targets, start, max_depth, out_visited):
+    """
+    Breadth-first search from ``start`` up to ``max_depth`` hops.
+
+    Args:
+        indptr: CSR row pointer (int32, n + 1)
+        targets: CSR column indices (int32)
+        start: Starting node index
+        max_depth: Maximum relationship depth to traverse
+        out_visited: Zeroed bool mask of length n, filled in place
+
+    Returns:
+        int32 array of visited node indices in BFS order (start first)
+    """
+    queue = np.empty(out_visited.shape[0], dtype=np.int32)
+    queue[0] = start
+    out_visited[start] = True
+    head = 0
+    tail = 1
+    depth = 0
+    level_end = 1
+
+    while head < tail and depth < max_depth:
+        while head < level_end:
+            node = queue[head]
+            head += 1
+            for e in range(indptr[node], indptr[node + 1]):
+                nxt = targets[e]
+                if not out_visited[nxt]:
+                    out_visited[nxt] = True
+                    queue[tail] = nxt
+                    tail += 1
+        depth += 1
+        level_end = tail
+
+    return queue[:tail]
+
+
+def _bfs_sum_risk(indptr, targets, risk, start, max_depth):
+    """
+    Breadth-first search that accumulates risk while it visits nodes.
+
+    Args:
+        indptr: CSR row pointer (int32, n + 1)
+        targets: CSR column indices (int32)
+        risk: Per-node risk scores (float64, n)
+        start: Starting node index
+        max_depth: Maximum relationship depth to traverse
+
+    Returns:
+        (sum of risk over visited nodes excluding ``start``,
+         number of visited nodes including ``start``)
+    """
+    n = risk.shape[0]
+    visited = np.zeros(n, dtype=np.bool_)
+    queue = np.empty(n, dtype=np.int32)
+    queue[0] = start
+    visited[start] = True
+    head = 0
+    tail = 1
+    depth = 0
+    level_end = 1
+    connected_risk = 0.0
+
+    while head < tail and depth < max_depth:
+        while head < level_end:
+            node = queue[head]
+            head += 1
+            for e in range(indptr[node], indptr[node + 1]):
+                nxt = targets[e]
+                if not visited[nxt]:
+                    visited[nxt] = True
+                    connected_risk += risk[nxt]
+                    queue[tail] = nxt
+                    tail += 1
+        depth += 1
+        level_end = tail
+
+    return connected_risk, tail
+
+
+if NUMBA_AVAILABLE:
+    bfs = njit(cache=True)(_bfs)
+    bfs_sum_risk = njit(cache=True)(_bfs_sum_risk)
+else:
+    bfs = None
+    bfs_sum_risk = None
+
+
+__all__ = ["NUMBA_AVAILABLE", "CYTHON_AVAILABLE", "bfs", "bfs_sum_risk", "cy_bfs"]
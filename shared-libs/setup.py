@@ -0,0 +1,27 @@
+"""
+Build the optional Cython extensions for the shared libraries.
+
+    python setup.py build_ext --inplace
+
+The libraries work without them; IdentityGraph falls back to its numba
+or NumPy traversal when ``identity_graph._bfs`` is not built.
+"""
+
+import numpy as np
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+extensions = [
+    Extension(
+        "identity_graph._bfs",
+        ["identity_graph/_bfs.pyx"],
+        include_dirs=[np.get_include()],
+        define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
+        extra_compile_args=["-O3"],
+    ),
+]
+
+setup(
+    name="turingmachines-shared-libs",
+    ext_modules=cythonize(extensions, language_level=3),
+)
@@ -0,0 +1,153 @@
+"""
+Test suite for event schema serialization and batch validation
+"""
+import json
+import sys
+
+import numpy as np
+import pytest
+
+import event_schemas
+from event_schemas import (
+    BaseEvent,
+    EventValidator,
+    EVT_RISK_ASSESSED,
+    EVT_SETTLEMENT_AUTHORIZED,
+    EVT_USER_CREATED,
+    OverrideEvent,
+    RiskAssessmentEvent,
+    SettlementEvent,
+)
+
+
+@pytest.fixture(params=["msgspec", "fallback"])
+def decoder(request, monkeypatch):
+    """Run from_json through msgspec and through the plain-JSON fallback"""
+    if request.param == "msgspec":
+        if event_schemas.msgspec is None:
+            pytest.skip("msgspec not installed")
+    else:
+        monkeypatch.setattr(event_schemas, "msgspec", None)
+    return request.param
+
+
+def _base_fields(**overrides):
+    fields = {
+        "event_id": "evt-1",
+        "event_type": EVT_USER_CREATED,
+        "timestamp": "2024-12-11T10:00:00Z",
+        "source_service": "turing-capture",
+    }
+    fields.update(overrides)
+    return fields
+
+
+EVENTS = [
+    BaseEvent(**_base_fields(user_id="u-1", metadata={"channel": "web", "tags": ["a", "b"]})),
+    RiskAssessmentEvent(**_base_fields(event_type=EVT_RISK_ASSESSED),
+                        risk_level="high", fraud_score=0.91, aml_score=0.12, decision="review"),
+    SettlementEvent(**_base_fields(event_type=EVT_SETTLEMENT_AUTHORIZED, transaction_id="tx-9"),
+                    amount=125.5, currency="AUD", decision="approve", authority="policy"),
+    OverrideEvent(**_base_fields(), override_type="manual", authorized_by="ops",
+                  original_decision="block", new_decision="approve"),
+]
+
+
+@pytest.mark.parametrize("event", EVENTS, ids=lambda e: type(e).__name__)
+def test_json_round_trip(decoder, event):
+    """Test that to_json -> from_json reproduces the event"""
+    decoded = type(event).from_json(event.to_json())
+    assert decoded == event
+    assert type(decoded) is type(event)
+
+
+@pytest.mark.parametrize("event", EVENTS, ids=lambda e: type(e).__name__)
+def test_from_json_accepts_bytes(decoder, event):
+    """Test decoding from bytes as read off a broker"""
+    assert type(event).from_json(event.to_json().encode()) == event
+
+
+def test_to_json_is_compact_and_omits_empty_metadata():
+    """Test the wire format: compact separators, no null metadata key"""
+    event = BaseEvent(**_base_fields())
+    payload = event.to_json()
+    assert " " not in payload
+    assert "metadata" not in json.loads(payload)
+    assert json.loads(payload) == {**_base_fields(), "user_id": None,
+                                   "transaction_id": None, "jurisdiction": "default"}
+
+
+def test_from_json_ignores_unknown_keys(decoder):
+    """Test that extra keys (newer producers) are dropped"""
+    payload = json.dumps({**_base_fields(), "schema_version": 3})
+    assert BaseEvent.from_json(payload) == BaseEvent(**_base_fields())
+
+
+def test_from_json_interns_labels(decoder):
+    """Test that decoded labels go through __post_init__ interning"""
+    event = RiskAssessmentEvent.from_json(json.dumps(_base_fields(risk_level="".join(["lo", "w"]))))
+    assert event.risk_level is sys.intern("low")
+
+
+@pytest.mark.parametrize("missing", ["event_id", "event_type", "timestamp", "source_service"])
+def test_from_json_missing_required_field(decoder, missing):
+    """Test that a missing required field raises ValueError on both paths"""
+    fields = _base_fields()
+    del fields[missing]
+    with pytest.raises(ValueError):
+        BaseEvent.from_json(json.dumps(fields))
+
+
+def test_from_json_rejects_non_object(decoder):
+    """Test that a payload that isn't a JSON object raises ValueError"""
+    with pytest.raises(ValueError):
+        BaseEvent.from_json("[1, 2, 3]")
+
+
+def test_from_json_checks_types_with_msgspec():
+    """Test that msgspec validates field types"""
+    if event_schemas.msgspec is None:
+        pytest.skip("msgspec not installed")
+    with pytest.raises(ValueError):
+        SettlementEvent.from_json(json.dumps(_base_fields(amount="lots")))
+
+
+def _batch():
+    base = _base_fields()
+    risk = {**base, "risk_level": "low", "fraud_score": 0.1, "aml_score": 0.0}
+    settle = {**base, "amount": 10.0, "currency": "USD", "decision": "approve"}
+    partial = {k: v for k, v in base.items() if k != "timestamp"}
+    return [base, risk, settle, partial, {}, {**risk, **settle}]
+
+
+def test_validate_events_batch_mask():
+    """Test the batch mask against the single-event validators"""
+    events = _batch()
+    cases = [
+        (EventValidator.validate_events_batch, EventValidator.validate_event,
+         [True, True, True, False, False, True]),
+        (EventValidator.validate_risk_events_batch, EventValidator.validate_risk_event,
+         [False, True, False, False, False, True]),
+        (EventValidator.validate_settlement_events_batch, EventValidator.validate_settlement_event,
+         [False, False, True, False, False, True]),
+    ]
+    for batch_fn, single_fn, expected in cases:
+        mask = batch_fn(events)
+        assert mask.dtype == np.bool_
+        assert mask.shape == (len(events),)
+        assert mask.tolist() == expected
+        assert mask.tolist() == [single_fn(e) for e in events]
+
+
+def test_validate_events_batch_custom_required():
+    """Test a caller-supplied required field set"""
+    events = [{"a": 1, "b": 2}, {"a": 1}, {"b": 2, "c": 3}]
+    mask = EventValidator.validate_events_batch(events, frozenset({"a", "b"}))
+    assert mask.tolist() == [True, False, False]
+
+
+def test_validate_events_batch_empty():
+    """Test that an empty poll gives an empty mask"""
+    mask = EventValidator.validate_events_batch([])
+    assert mask.dtype == np.bool_
+    assert mask.shape == (0,)
@@ -0,0 +1,241 @@
+"""
+Test suite for IdentityGraph storage and traversal backends
+"""
+import random
+from collections import deque
+
+import numpy as np
+import pytest
+
+from identity_graph import IdentityGraph, _INITIAL_CAPACITY, _kernels
+
+
+# Traversal backends selected by find_connected_entities / _bfs_and_sum_risk
+BACKENDS = ["cython", "numba", "numpy"]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    """Force one kernel backend, skipping those not available here"""
+    name = request.param
+    if name == "cython" and _kernels.cy_bfs is None:
+        pytest.skip("identity_graph._bfs extension not built")
+    if name == "numba" and _kernels.bfs is None:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(_kernels, "CYTHON_AVAILABLE", name == "cython")
+    monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", name == "numba")
+    return name
+
+
+def _random_graph(n_nodes, n_edges, seed=7):
+    """Random graph (with self-loops and duplicate edges) plus its adjacency lists"""
+    rng = random.Random(seed)
+    graph = IdentityGraph()
+    adjacency = {}
+    risks = {}
+    for i in range(n_nodes):
+        # Leave some nodes as relationship-only (never added as entities)
+        if i % 5:
+            risks[f"n{i}"] = round(rng.random(), 3)
+            graph.add_entity(f"n{i}", "user", {"risk_score": risks[f"n{i}"]})
+    for _ in range(n_edges):
+        src = f"n{rng.randrange(n_nodes)}"
+        tgt = f"n{rng.randrange(n_nodes)}"
+        graph.add_relationship(src, tgt, "linked")
+        adjacency.setdefault(src, []).append(tgt)
+    return graph, adjacency, risks
+
+
+def _reference_connected(adjacency, start, max_depth):
+    """Plain BFS over adjacency lists"""
+    seen = {start}
+    queue = deque([(start, 0)])
+    while queue:
+        node, depth = queue.popleft()
+        if depth == max_depth:
+            continue
+        for nxt in adjacency.get(node, []):
+            if nxt not in seen:
+                seen.add(nxt)
+                queue.append((nxt, depth + 1))
+    return seen
+
+
+def _reference_risk_sum(adjacency, risks, start, max_depth):
+    """Risk summed over connected nodes excluding start, and the node count"""
+    connected = _reference_connected(adjacency, start, max_depth)
+    return sum(risks.get(n, 0.0) for n in connected if n != start), len(connected)
+
+
+@pytest.mark.parametrize("max_depth", [0, 1, 2, 3, 10])
+def test_find_connected_entities_matches_reference(backend, max_depth):
+    """Test that every backend visits exactly the reference BFS set"""
+    graph, adjacency, _ = _random_graph(150, 300)
+    for i in range(0, 150, 7):
+        start = f"n{i}"
+        assert graph.find_connected_entities(start, max_depth) == \
+            _reference_connected(adjacency, start, max_depth)
+
+
+@pytest.mark.parametrize("max_depth", [1, 2, 3])
+def test_bfs_risk_sum_matches_reference(backend, max_depth):
+    """Test that fused traversal + risk aggregation matches the reference sums"""
+    graph, adjacency, risks = _random_graph(150, 300)
+    for i in range(0, 150, 7):
+        start = f"n{i}"
+        risk, count = graph._bfs_and_sum_risk(start, max_depth)
+        ref_risk, ref_count = _reference_risk_sum(adjacency, risks, start, max_depth)
+        assert count == ref_count
+        assert risk == pytest.approx(ref_risk)
+
+
+def test_entity_risk_score_matches_reference(backend):
+    """Test get_entity_risk_score against the neighbour-average definition"""
+    graph, adjacency, risks = _random_graph(80, 160)
+    for entity_id, base in risks.items():
+        connected_risk, count = _reference_risk_sum(adjacency, risks, entity_id, 1)
+        expected = min(1.0, (base + connected_risk / count) / 2)
+        assert graph.get_entity_risk_score(entity_id) == pytest.approx(expected)
+
+
+def test_weighted_entity_risk_score():
+    """Test the weighted neighbour average, ignoring self-relationships"""
+    graph = IdentityGraph()
+    graph.add_entity("a", "user", {"risk_score": 0.2})
+    graph.add_entity("b", "device", {"risk_score": 0.6})
+    graph.add_entity("c", "account", {"risk_score": 1.0})
+    graph.add_relationship("a", "b", "uses", weight=0.5)
+    graph.add_relationship("a", "c", "owns", weight=1.0)
+    graph.add_relationship("a", "a", "self", weight=1.0)
+    expected = (0.2 + (0.5 * 0.6 + 1.0 * 1.0) / (0.5 + 1.0 + 1)) / 2
+    assert graph.get_entity_risk_score("a", weighted=True) == pytest.approx(expected)
+    # No outgoing relationships: only the entity's own share
+    assert graph.get_entity_risk_score("c", weighted=True) == pytest.approx(0.5)
+    assert graph.get_entity_risk_score("ghost", weighted=True) == 0.0
+
+
+def test_weighted_matches_unweighted_at_unit_weight(backend):
+    """Test that unit weights without duplicate edges reproduce the unweighted score"""
+    graph = IdentityGraph()
+    for i in range(30):
+        graph.add_entity(f"u{i}", "user", {"risk_score": i / 30})
+    for i in range(30):
+        for j in {(i * 7 + 3) % 30, (i * 11 + 5) % 30}:
+            graph.add_relationship(f"u{i}", f"u{j}", "linked")
+    for i in range(30):
+        assert graph.get_entity_risk_score(f"u{i}", weighted=True) == pytest.approx(
+            graph.get_entity_risk_score(f"u{i}")
+        )
+
+
+def test_unknown_entity():
+    """Test lookups for ids the graph has never seen"""
+    graph = IdentityGraph()
+    assert graph.find_connected_entities("ghost") == {"ghost"}
+    assert graph.find_connected_entities("ghost", max_depth=-1) == set()
+    assert graph.get_entity_risk_score("ghost") == 0.0
+
+
+def test_growth_past_initial_capacity(backend):
+    """Test that node and edge buffers grow without losing earlier data"""
+    n = _INITIAL_CAPACITY * 4 + 3
+    graph = IdentityGraph()
+    for i in range(n):
+        graph.add_entity(f"u{i}", "user", {"risk_score": i / n})
+    for i in range(n - 1):
+        graph.add_relationship(f"u{i}", f"u{i + 1}", "next", weight=0.5)
+
+    assert graph._edge_src.shape[0] >= n - 1
+    assert graph._risk.shape[0] >= n
+    assert graph.find_connected_entities("u0", max_depth=n) == {f"u{i}" for i in range(n)}
+    assert graph.find_connected_entities(f"u{n - 3}", max_depth=1) == {f"u{n - 3}", f"u{n - 2}"}
+    assert graph.entities[f"u{n - 1}"]["attributes"]["risk_score"] == pytest.approx((n - 1) / n)
+    assert len(graph.relationships["u0"]) == 1
+
+
+def test_compaction_after_edits(backend):
+    """Test that edits after a query are picked up by the next query"""
+    graph = IdentityGraph()
+    graph.add_entity("a", "user", {"risk_score": 0.2})
+    graph.add_entity("b", "device", {"risk_score": 0.6})
+    graph.add_relationship("a", "b", "uses")
+    assert graph.find_connected_entities("a", max_depth=1) == {"a", "b"}
+    assert graph.get_entity_risk_score("a") == pytest.approx((0.2 + 0.6 / 2) / 2)
+
+    graph.add_relationship("b", "c", "shares")
+    graph.add_entity("c", "account", {"risk_score": 1.0})
+    assert not graph.frozen
+    assert graph.find_connected_entities("a", max_depth=2) == {"a", "b", "c"}
+    assert graph.get_entity_risk_score("b") == pytest.approx((0.6 + 1.0 / 2) / 2)
+
+    # Re-adding an entity updates its risk
+    graph.add_entity("b", "device", {"risk_score": 0.0})
+    assert graph.get_entity_risk_score("a") == pytest.approx(0.2 / 2)
+
+
+def test_freeze(backend):
+    """Test that a frozen graph answers queries but rejects edits"""
+    graph, adjacency, risks = _random_graph(100, 200)
+    before = {f"n{i}": graph.find_connected_entities(f"n{i}", 2) for i in range(100)}
+
+    graph.freeze()
+    graph.freeze()  # idempotent
+    assert graph.frozen
+
+    for entity_id, connected in before.items():
+        assert graph.find_connected_entities(entity_id, 2) == connected
+    for entity_id in risks:
+        connected_risk, count = _reference_risk_sum(adjacency, risks, entity_id, 1)
+        expected = min(1.0, (risks[entity_id] + connected_risk / count) / 2)
+        assert graph.get_entity_risk_score(entity_id) == pytest.approx(expected)
+
+    with pytest.raises(RuntimeError):
+        graph.add_entity("new", "user", {})
+    with pytest.raises(RuntimeError):
+        graph.add_relationship("n1", "n2", "linked")
+
+    for arr in (graph._indptr, graph._targets, graph._risk_vec, graph._edge_src):
+        assert not arr.flags.writeable
+        with pytest.raises(ValueError):
+            arr[0] = 0
+
+
+def test_properties_are_read_only_snapshots():
+    """Test that entities/relationships can't be assigned and edits don't leak back"""
+    graph = IdentityGraph()
+    graph.add_entity("a", "user", {"risk_score": 0.5})
+    graph.add_relationship("a", "b", "uses", weight=0.3)
+
+    assert graph.entities == {
+        "a": {"type": "user", "attributes": {"risk_score": 0.5}, "relationships": []}
+    }
+    assert graph.relationships == {"a": [{"target": "b", "type": "uses", "weight": 0.3}]}
+
+    graph.entities["a"]["type"] = "device"
+    graph.entities["x"] = {"type": "user", "attributes": {}, "relationships": []}
+    graph.relationships["a"].append({"target": "c", "type": "uses", "weight": 1.0})
+    assert graph.entities["a"]["type"] == "user"
+    assert "x" not in graph.entities
+    assert graph.find_connected_entities("a", max_depth=1) == {"a", "b"}
+
+    with pytest.raises(AttributeError):
+        graph.entities = {}
+    with pytest.raises(AttributeError):
+        graph.relationships = {}
+
+
+def test_kernels_agree_on_raw_csr():
+    """Test the numba and NumPy BFS kernels directly on the same CSR arrays"""
+    if _kernels.bfs is None:
+        pytest.skip("numba not installed")
+    graph, _, _ = _random_graph(120, 240)
+    indptr, targets = graph._csr()
+    n = len(graph._idx2id)
+    for start in range(n):
+        visited = np.zeros(n, dtype=np.bool_)
+        numba_nodes = _kernels.bfs(indptr, targets, start, 3, visited)
+        numpy_nodes = graph._connected_indices(start, 3)
+        assert numba_nodes[0] == start
+        assert sorted(numba_nodes.tolist()) == sorted(numpy_nodes.tolist())
+        if _kernels.cy_bfs is not None:
+            assert _kernels.cy_bfs(indptr, targets, start, 3).tolist() == numba_nodes.tolist()
@@ -0,0 +1,139 @@
+"""
+Test suite for the serialization and validation utilities
+"""
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from enum import Enum
+
+import pytest
+
+import utils
+from utils import Serialization, Validation
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = 2
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def serializer(request, monkeypatch):
+    """Run to_json through orjson and through the stdlib fallback"""
+    if request.param == "orjson":
+        if utils.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+    return request.param
+
+
+def test_to_json_is_compact(serializer):
+    """Test compact separators by default"""
+    assert Serialization.to_json({"a": [1, 2], "b": None}) == '{"a":[1,2],"b":null}'
+
+
+def test_to_json_pretty(serializer):
+    """Test that pretty output is indented by two spaces and round-trips"""
+    data = {"a": [1, 2], "b": {"c": True}}
+    pretty = Serialization.to_json(data, pretty=True)
+    assert '\n  "a": [' in pretty
+    assert json.loads(pretty) == data
+
+
+def test_to_json_enums_as_values(serializer):
+    """Test that Enum members are written as their value on both paths"""
+    assert Serialization.to_json({"color": Color.RED, "n": Color.BLUE}) == '{"color":"red","n":2}'
+
+
+def test_to_json_datetimes_as_str(serializer):
+    """Test that datetimes use str() (space separator), not isoformat"""
+    data = {
+        "naive": datetime(2024, 12, 11, 10, 0, 5),
+        "aware": datetime(2024, 12, 11, 10, 0, 5, 123000, tzinfo=timezone.utc),
+        "day": date(2024, 12, 11),
+    }
+    assert json.loads(Serialization.to_json(data)) == {
+        "naive": "2024-12-11 10:00:05",
+        "aware": "2024-12-11 10:00:05.123000+00:00",
+        "day": "2024-12-11",
+    }
+
+
+def test_to_json_other_objects_as_str(serializer):
+    """Test that dataclasses and other unsupported objects fall back to str()"""
+    assert json.loads(Serialization.to_json({"p": Point(1, 2)})) == {"p": "Point(x=1, y=2)"}
+    assert json.loads(Serialization.to_json({"s": {3}})) == {"s": "{3}"}
+
+
+def test_to_json_non_str_keys(serializer):
+    """Test that int keys are written as strings"""
+    assert Serialization.to_json({1: "a"}) == '{"1":"a"}'
+
+
+def test_to_json_big_ints(serializer):
+    """Test that integers beyond 64 bits serialize (orjson defers to the stdlib)"""
+    data = {"b": 2 ** 70, "n": [-(2 ** 64), 1]}
+    assert Serialization.to_json(data) == '{"b":1180591620717411303424,"n":[-18446744073709551616,1]}'
+    assert json.loads(Serialization.to_json(data, pretty=True)) == data
+
+
+def test_to_json_nan(serializer):
+    """Test the documented NaN/Infinity spelling of each encoder"""
+    payload = Serialization.to_json({"a": float("nan"), "b": float("inf")})
+    if serializer == "orjson":
+        assert payload == '{"a":null,"b":null}'
+    else:
+        assert payload == '{"a":NaN,"b":Infinity}'
+
+
+def test_to_json_non_ascii(serializer):
+    """Test that non-ASCII text decodes to the same value on both encoders"""
+    payload = Serialization.to_json({"name": "café"})
+    assert json.loads(payload) == {"name": "café"}
+    if serializer == "orjson":
+        assert payload == '{"name":"café"}'
+    else:
+        assert payload == '{"name":"caf\\u00e9"}'
+
+
+def test_json_round_trip(serializer):
+    """Test to_json -> from_json for plain JSON data"""
+    data = {"id": "evt_1", "score": 0.91, "tags": ["a", "b"], "ok": True, "none": None}
+    assert Serialization.from_json(Serialization.to_json(data)) == data
+    assert Serialization.from_json(Serialization.to_json(data).encode()) == data
+
+
+@pytest.mark.parametrize("email", [
+    "user@example.com",
+    "first.last+tag@sub.example.co.uk",
+    "o'brien@example.ie",
+    "user@localhost.localdomain",
+])
+def test_validate_email_accepts(email):
+    """Test well-formed addresses"""
+    assert Validation.validate_email(email)
+
+
+@pytest.mark.parametrize("email", [
+    "",
+    "user",
+    "user@example",        # no dot in the domain
+    "@example.com",        # empty local part
+    "user@.com",           # nothing before the dot
+    "user@example.",       # nothing after the dot
+    "user@@example.com",
+    "a@b@example.com",     # more than one @
+    "us er@example.com",   # whitespace
+    "user@example.com ",
+    "user@example.com\n",
+])
+def test_validate_email_rejects(email):
+    """Test malformed addresses, including ones the old substring check let through"""
+    assert not Validation.validate_email(email)
@@ -5,30 +5,57 @@ Provides common utilities, helpers, and cross-cutting concerns
 for all TuringMachines services.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
+from enum import Enum
+from functools import lru_cache
 import logging
 import hashlib
 import json
-from datetime import datetime
+import re
+import secrets
+import threading
+
+from . import config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_sha256 = hashlib.sha256
+
+_JSON_SEPARATORS = (",", ":")
+
+_LOGGER_LOCK = threading.Lock()
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def _json_default(obj: Any) -> Any:
+    """Enums as their value (what orjson emits natively), anything else via str()."""
+    return obj.value if isinstance(obj, Enum) else str(obj)
 
 
 class Logger:
     """Centralized logging with structured format."""
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_logger(name: str) -> logging.Logger:
-        """Get configured logger instance."""
+        """Get configured logger instance (cached per name)."""
         logger = logging.getLogger(name)
         
-        # Configure if not already configured
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
+        # Configure if not already configured; the lock keeps concurrent
+        # first calls from attaching duplicate handlers
+        with _LOGGER_LOCK:
+            if not logger.handlers:
+                handler = logging.StreamHandler()
+                formatter = logging.Formatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+                )
+                handler.setFormatter(formatter)
+                logger.addHandler(handler)
+                logger.setLevel(logging.INFO)
         
         return logger
 
@@ -37,17 +64,17 @@ class Crypto:
     """Cryptographic utilities."""
     
     @staticmethod
-    def hash_sha256(data: str) -> str:
+    def hash_sha256(data: Union[str, bytes]) -> str:
         """
         Generate SHA256 hash of data.
         
         Args:
-            data: Data to hash
+            data: Data to hash (bytes are hashed as-is)
             
         Returns:
             Hex-encoded hash
         """
-        return hashlib.sha256(data.encode()).hexdigest()
+        return _sha256(data if isinstance(data, bytes) else data.encode()).hexdigest()
     
     @staticmethod
     def generate_id(prefix: str = "") -> str:
@@ -58,28 +85,49 @@ class Crypto:
             prefix: Optional prefix for ID
             
         Returns:
-            Unique identifier
+            Unique identifier (8 random URL-safe characters)
         """
-        timestamp = datetime.utcnow().isoformat()
-        hash_val = Crypto.hash_sha256(timestamp)[:8]
-        return f"{prefix}_{hash_val}" if prefix else hash_val
+        token = secrets.token_urlsafe(6)
+        return f"{prefix}_{token}" if prefix else token
 
 
 class Serialization:
     """Serialization utilities."""
     
     @staticmethod
-    def to_json(data: Any) -> str:
+    def to_json(data: Any, pretty: bool = False) -> str:
         """
-        Serialize data to JSON.
+        Serialize data to JSON (compact unless ``pretty`` is set).
+        
+        Uses orjson when installed, falling back to the stdlib encoder for
+        input orjson rejects (e.g. integers beyond 64 bits). Enums are
+        written as their value; datetimes, dataclasses and any other
+        unsupported objects as ``str(obj)``. Output still differs between
+        the encoders in two cases: orjson writes non-ASCII as raw UTF-8
+        where the stdlib writes ``\\uXXXX`` escapes (same decoded value),
+        and NaN/Infinity as ``null`` where the stdlib writes the
+        non-standard ``NaN``/``Infinity``.
         
         Args:
             data: Data to serialize
+            pretty: Indent output by two spaces for human reading
             
         Returns:
             JSON string
         """
-        return json.dumps(data, default=str)
+        if orjson is not None:
+            option = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+                      | orjson.OPT_NON_STR_KEYS)
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(data, default=_json_default, option=option).decode()
+            except TypeError:
+                # orjson.JSONEncodeError subclasses TypeError
+                pass
+        if pretty:
+            return json.dumps(data, indent=2, default=_json_default)
+        return json.dumps(data, separators=_JSON_SEPARATORS, default=_json_default)
     
     @staticmethod
     def from_json(json_str: str) -> Any:
@@ -87,11 +135,13 @@ class Serialization:
         Deserialize JSON to data.
         
         Args:
-            json_str: JSON string
+            json_str: JSON string or bytes
             
         Returns:
             Deserialized data
         """
+        if orjson is not None:
+            return orjson.loads(json_str)
         return json.loads(json_str)
 
 
@@ -101,7 +151,8 @@ class Validation:
     @staticmethod
     def validate_email(email: str) -> bool:
         """
-        Validate email format.
+        Validate email format: exactly one ``@`` with a non-empty local part,
+        no whitespace, and a dot in the domain with characters on both sides.
         
         Args:
             email: Email address
@@ -109,7 +160,7 @@ class Validation:
         Returns:
             True if valid
         """
-        return "@" in email and "." in email.split("@")[1]
+        return _EMAIL_RE.fullmatch(email) is not None
     
     @staticmethod
     def validate_phone(phone: str) -> bool:
@@ -123,8 +174,7 @@ class Validation:
             True if valid
         """
         # Basic validation: at least 10 digits
-        digits = "".join(c for c in phone if c.isdigit())
-        return len(digits) >= 10
+        return sum(map(str.isdigit, phone)) >= 10
     
     @staticmethod
     def validate_amount(amount: float, min_val: float = 0.0,
@@ -144,24 +194,22 @@ class Validation:
 
 
 class Config:
-    """Configuration management utilities."""
-    
-    _config: Dict[str, Any] = {}
+    """Configuration management utilities (see ``utils.config``)."""
     
-    @classmethod
-    def load(cls, config_dict: Dict[str, Any]) -> None:
+    @staticmethod
+    def load(config_dict: Dict[str, Any]) -> None:
         """Load configuration."""
-        cls._config = config_dict
+        config.load(config_dict)
     
-    @classmethod
-    def get(cls, key: str, default: Any = None) -> Any:
+    @staticmethod
+    def get(key: str, default: Any = None) -> Any:
         """Get configuration value."""
-        return cls._config.get(key, default)
+        return config.get(key, default)
     
-    @classmethod
-    def set(cls, key: str, value: Any) -> None:
+    @staticmethod
+    def set(key: str, value: Any) -> None:
         """Set configuration value."""
-        cls._config[key] = value
+        config.set_(key, value)
 
 
 __all__ = [
@@ -169,5 +217,6 @@ __all__ = [
     "Crypto",
     "Serialization",
     "Validation",
-    "Config"
+    "Config",
+    "config"
 ]
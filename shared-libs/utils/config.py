@@ -0,0 +1,38 @@
+"""
+Configuration store - Shared Library
+
+Module-level configuration dictionary. Values can be read as module
+attributes (``config.FOO``) or with ``get``; ``Config`` in the package
+root delegates here.
+"""
+
+from typing import Any, Dict
+
+_CONFIG: Dict[str, Any] = {}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve unknown module attributes as configuration keys."""
+    try:
+        return _CONFIG[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def load(config_dict: Dict[str, Any]) -> None:
+    """Load configuration, replacing any existing values."""
+    global _CONFIG
+    _CONFIG = config_dict
+
+
+def get(key: str, default: Any = None) -> Any:
+    """Get configuration value."""
+    return _CONFIG.get(key, default)
+
+
+def set_(key: str, value: Any) -> None:
+    """Set configuration value."""
+    _CONFIG[key] = value
+
+
+__all__ = ["load", "get", "set_"]
@@ -0,0 +1,35 @@
+"""Store face embeddings as pgvector vectors instead of JSON
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-14 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+
+    # Dimensionless, like the ORM column: the table holds 128D and 512D rows.
+    # There is no json -> vector cast, but the JSON array text ('[0.1, 0.2]')
+    # is valid vector input.
+    op.execute(
+        'ALTER TABLE face_embeddings ALTER COLUMN embedding_vector '
+        'TYPE vector USING embedding_vector::text::vector'
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        'ALTER TABLE face_embeddings ALTER COLUMN embedding_vector '
+        'TYPE json USING embedding_vector::text::json'
+    )
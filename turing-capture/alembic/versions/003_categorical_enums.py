@@ -0,0 +1,100 @@
+"""Categorical columns as Postgres ENUM types
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Labels as of this revision (models.py holds the current lists)
+ENUM_TYPES = {
+    'session_status_enum': ('created', 'in_progress', 'completed', 'failed'),
+    'risk_level_enum': ('low', 'medium', 'high', 'critical'),
+    'artifact_type_enum': ('selfie', 'id_front', 'id_back'),
+    'storage_mode_enum': ('memory', 'local', 's3'),
+    'model_name_enum': ('mobilefacenet', 'arcface', 'fusion', 'dual_fusion'),
+    'event_type_enum': (
+        'selfie_captured',
+        'liveness_detected',
+        'face_matched',
+        'session_completed',
+        'selfie_uploaded',
+        'selfie_upload_failed',
+        'face_match_completed',
+        'face_match_failed',
+        'UPLOAD',
+        'VERIFY',
+    ),
+    'event_status_enum': ('success', 'failure', 'warning', 'error'),
+}
+
+# (table, column, enum type, VARCHAR length restored on downgrade)
+COLUMNS = (
+    ('biometric_sessions', 'status', 'session_status_enum', 32),
+    ('biometric_sessions', 'overall_risk_level', 'risk_level_enum', 16),
+    ('biometric_artifacts', 'artifact_type', 'artifact_type_enum', 32),
+    ('biometric_artifacts', 'storage_mode', 'storage_mode_enum', 16),
+    ('liveness_results', 'risk_level', 'risk_level_enum', 16),
+    ('face_embeddings', 'model_name', 'model_name_enum', 32),
+    ('face_match_results', 'model_name', 'model_name_enum', 32),
+    ('face_match_results', 'risk_level', 'risk_level_enum', 16),
+    ('biometric_events', 'event_type', 'event_type_enum', 64),
+    ('biometric_events', 'event_status', 'event_status_enum', 32),
+)
+
+
+def _existing_labels(conn, type_name):
+    """Distinct values already stored in the columns that will use ``type_name``."""
+    if context.is_offline_mode():
+        return []
+    labels = []
+    for table, column, enum_type, _ in COLUMNS:
+        if enum_type != type_name:
+            continue
+        rows = conn.execute(sa.text(
+            f'SELECT DISTINCT {column} FROM {table} WHERE {column} IS NOT NULL ORDER BY 1'
+        ))
+        labels.extend(row[0] for row in rows)
+    return labels
+
+
+def _retype(table, column, new_type, cast_to):
+    op.execute(
+        f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {new_type} '
+        f'USING {column}::text::{cast_to}'
+    )
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    for type_name, labels in ENUM_TYPES.items():
+        # Keep any value already in the data so the casts below can't fail;
+        # risk_level_enum and model_name_enum span several columns
+        extra = [v for v in dict.fromkeys(_existing_labels(conn, type_name)) if v not in labels]
+        sa.Enum(*labels, *extra, name=type_name).create(conn, checkfirst=True)
+
+    # Indexes on these columns (idx_event_type, idx_session_status, ...) are rebuilt by the rewrite
+    for table, column, type_name, _ in COLUMNS:
+        _retype(table, column, type_name, type_name)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    for table, column, _, length in COLUMNS:
+        _retype(table, column, f'VARCHAR({length})', 'varchar')
+
+    for type_name in ENUM_TYPES:
+        sa.Enum(name=type_name).drop(conn, checkfirst=True)
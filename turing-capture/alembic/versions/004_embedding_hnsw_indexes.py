@@ -0,0 +1,48 @@
+"""HNSW cosine indexes for 1:N face embedding search
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-14 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# embedding_vector is a dimensionless vector since 002 (it holds 128D and
+# 512D rows), so each model gets a partial index over its rows cast to that
+# model's dimension. Mirrors FaceEmbedding.__table_args__ in models.py.
+ANN_INDEXES = (
+    ('idx_embedding_mobilefacenet_hnsw', 'mobilefacenet', 128),
+    ('idx_embedding_arcface_hnsw', 'arcface', 512),
+)
+
+
+def upgrade() -> None:
+    # HNSW needs pgvector >= 0.5.0; 002 may have created the extension at an
+    # older version
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    op.execute('ALTER EXTENSION vector UPDATE')
+
+    # CONCURRENTLY keeps face_embeddings writable during the build; it can't
+    # run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for name, model_name, dim in ANN_INDEXES:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON face_embeddings '
+                f'USING hnsw ((embedding_vector::vector({dim})) vector_cosine_ops) '
+                f"WITH (m = 16, ef_construction = 64) WHERE model_name = '{model_name}'"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in ANN_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
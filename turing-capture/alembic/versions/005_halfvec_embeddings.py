@@ -0,0 +1,55 @@
+"""Store face embeddings as halfvec (FP16)
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-14 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same partial per-model indexes as 004, rebuilt over the halfvec column
+ANN_INDEXES = (
+    ('idx_embedding_mobilefacenet_hnsw', 'mobilefacenet', 128),
+    ('idx_embedding_arcface_hnsw', 'arcface', 512),
+)
+
+
+def _create_ann_indexes(vector_type: str) -> None:
+    for name, model_name, dim in ANN_INDEXES:
+        op.execute(
+            f'CREATE INDEX {name} ON face_embeddings '
+            f'USING hnsw ((embedding_vector::{vector_type}({dim})) {vector_type}_cosine_ops) '
+            f"WITH (m = 16, ef_construction = 64) WHERE model_name = '{model_name}'"
+        )
+
+
+def _retype_embeddings(vector_type: str) -> None:
+    # The index expressions depend on the column type, so they go first
+    for name, _, _ in ANN_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+    # Through text, so the cast doesn't depend on the current column type:
+    # vector, halfvec and a JSON array all print as '[...]'
+    op.execute(
+        f'ALTER TABLE face_embeddings ALTER COLUMN embedding_vector '
+        f'TYPE {vector_type} USING embedding_vector::text::{vector_type}'
+    )
+    _create_ann_indexes(vector_type)
+
+
+def upgrade() -> None:
+    # halfvec needs pgvector >= 0.7.0
+    op.execute('ALTER EXTENSION vector UPDATE')
+    _retype_embeddings('halfvec')
+
+
+def downgrade() -> None:
+    _retype_embeddings('vector')
@@ -5,10 +5,11 @@ Provides comprehensive identity verification, document capture, biometric analys
 and device intelligence for onboarding and continuous authentication.
 """
 
+import hashlib
 import logging
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -67,9 +68,34 @@ class TuringCapture:
         """
         self.logger.debug(f"Capturing identity for user")
 
+        return self._identity_result(
+            user_data, self._generate_device_fingerprint(user_data)
+        )
+
+    def capture_batch(self, data_list: List[Dict[str, Any]]) -> List[CaptureResult]:
+        """
+        Capture and verify identity information for a batch of users.
+
+        Args:
+            data_list: User identity data records
+
+        Returns:
+            CaptureResult per record, in input order
+        """
+        self.logger.debug(f"Capturing identity batch of {len(data_list)}")
+
+        fingerprints = self._generate_device_fingerprints_batch(data_list)
+        return [
+            self._identity_result(user_data, device_fingerprint)
+            for user_data, device_fingerprint in zip(data_list, fingerprints)
+        ]
+
+    def _identity_result(
+        self, user_data: Dict[str, Any], device_fingerprint: str
+    ) -> CaptureResult:
+        """Build the identity CaptureResult for one record."""
         capture_id = user_data.get("capture_id", "unknown")
         identity_verified = self._verify_identity(user_data)
-        device_fingerprint = self._generate_device_fingerprint(user_data)
 
         status = (
             VerificationStatus.VERIFIED
@@ -171,5 +197,17 @@ class TuringCapture:
 
     def _generate_device_fingerprint(self, data: Dict[str, Any]) -> str:
         """Generate device fingerprint from metadata."""
-        # Placeholder implementation
-        return "fp_" + data.get("device_id", "unknown")[:8]
+        device_id = data.get("device_id", "unknown")
+        return "fp_" + hashlib.blake2b(device_id.encode(), digest_size=6).hexdigest()
+
+    def _generate_device_fingerprints_batch(
+        self, batch: List[Dict[str, Any]]
+    ) -> List[str]:
+        """Generate device fingerprints for a batch of metadata records."""
+        blake2b = hashlib.blake2b
+        return [
+            "fp_" + blake2b(
+                data.get("device_id", "unknown").encode(), digest_size=6
+            ).hexdigest()
+            for data in batch
+        ]
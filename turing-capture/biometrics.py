@@ -12,7 +12,7 @@ Production-grade biometric verification system with:
 
 Architecture:
 - Storage Layer: Pluggable (memory → local → S3)
-- Preprocessing: OpenCV + PIL with safe error handling
+- Preprocessing: OpenCV with safe error handling
 - Liveness Engine: Hybrid (landmark-based EAR/MAR + head pose)
 - Model Layer: ONNX Runtime with GPU support + mock fallback
 - Matching: Dual-model fusion with explainability
@@ -21,26 +21,56 @@ Architecture:
 """
 
 import os
-import io
+import json
+import base64
+import math
+import asyncio
 import uuid
 import logging
 import hashlib
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Tuple, Dict, Any, List
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Tuple, Dict, Any, List, Mapping
 
 import httpx
 
 from fastapi import APIRouter, HTTPException, status, UploadFile, File
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 
-from PIL import Image
 import numpy as np
 import cv2
 
+try:
+    import orjson  # noqa: F401 (required by ORJSONResponse)
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSONResponse = None
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
 # Database imports
-from db import save_record, DB_MODE, get_async_session
+from sqlalchemy import bindparam, literal, select
+from sqlalchemy.orm import aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db import save_record, save_records, copy_records_async, DB_MODE, async_session_scope
 from models import (
+    EMBEDDING_DIMS,
+    PGVECTOR_AVAILABLE,
     BiometricSession,
     BiometricArtifact,
     LivenessResult,
@@ -61,6 +91,12 @@ logger.setLevel(logging.INFO)
 STORAGE_MODE = os.getenv("BIOMETRIC_STORAGE_MODE", "memory")  # memory | local | s3
 S3_BUCKET = os.getenv("BIOMETRIC_S3_BUCKET", "turingmachines-biometrics")
 S3_PREFIX = os.getenv("BIOMETRIC_S3_PREFIX", "sessions/{session_id}/{artifact}.jpg")
+MEMORY_CAP_BYTES = int(float(os.getenv("BIOMETRIC_MEM_CAP_MB", "512")) * 1_000_000)
+MEMORY_TTL_SECONDS = float(os.getenv("BIOMETRIC_MEM_TTL_SECONDS", "1800"))
+
+# boto3 is only needed (and only imported) in S3 mode
+if STORAGE_MODE == "s3":
+    import boto3
 
 # Model configuration
 MODEL_DIR = Path(__file__).parent / "models"
@@ -69,6 +105,12 @@ MODEL_DIR.mkdir(exist_ok=True)
 MOBILEFACENET_PATH = MODEL_DIR / "mobilefacenet.onnx"
 ARCFACE_PATH = MODEL_DIR / "arcface.onnx"
 
+# CUDA graph capture: static batch size to capture on GPU (0 = disabled)
+CUDA_GRAPH_BATCH = int(os.getenv("ORT_CUDA_GRAPH_BATCH", "0"))
+
+# Prefer INT8 variants produced by quantize_models.py when present
+USE_INT8_MODELS = os.getenv("BIOMETRIC_USE_INT8", "true").lower() == "true"
+
 # Feature flags
 USE_MOCK_EMBEDDINGS = not (MOBILEFACENET_PATH.exists() and ARCFACE_PATH.exists())
 DB_PERSIST = True  # Always persist to database
@@ -78,11 +120,27 @@ MOBILEFACENET_THRESHOLD = float(os.getenv("MOBILEFACENET_THRESHOLD", "0.60"))
 ARCFACE_THRESHOLD = float(os.getenv("ARCFACE_THRESHOLD", "0.45"))
 LIVENESS_THRESHOLD = float(os.getenv("LIVENESS_THRESHOLD", "0.40"))
 
+# Audit event batching (COPY flush every N events or T seconds)
+EVENT_QUEUE_SIZE = int(os.getenv("BIOMETRIC_EVENT_QUEUE_SIZE", "10000"))
+EVENT_FLUSH_SIZE = int(os.getenv("BIOMETRIC_EVENT_FLUSH_SIZE", "500"))
+EVENT_FLUSH_SECONDS = float(os.getenv("BIOMETRIC_EVENT_FLUSH_MS", "100")) / 1000.0
+
+# Dynamic batching of concurrent embedding requests
+BATCH_MAX_SIZE = int(os.getenv("BIOMETRIC_BATCH_MAX_SIZE", "32"))
+BATCH_MAX_WAIT_SECONDS = float(os.getenv("BIOMETRIC_BATCH_MAX_WAIT_MS", "5")) / 1000.0
+
+# Content-addressed embedding cache (entries keyed by SHA-256 of upload bytes)
+EMBED_CACHE_SIZE = int(os.getenv("BIOMETRIC_EMBED_CACHE_SIZE", "4096"))
+
 # Orchestrate integration
 ORCHESTRATE_URL = os.getenv("ORCHESTRATE_URL", "http://localhost:8102")
 
 # FastAPI router
-router = APIRouter(prefix="/v1/biometrics")
+# Responses are float-heavy dicts; orjson serializes them in C
+router = APIRouter(
+    prefix="/v1/biometrics",
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
+)
 
 # ============================================================================
 # ONNX MODEL LOADING
@@ -91,9 +149,176 @@ router = APIRouter(prefix="/v1/biometrics")
 mobilefacenet_session = None
 arcface_session = None
 
+# Both models are run side by side per face; ONNX Runtime releases the GIL
+_ORT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ort")
+
+
+def _session_options(ort):
+    """Session options shared by both models (full graph optimization, bounded threads)."""
+    opts = ort.SessionOptions()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    opts.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+    # Two sessions run concurrently; keep each from claiming every core
+    opts.intra_op_num_threads = min(4, os.cpu_count() or 1)
+    # Idle inter-op workers sleep instead of spinning on cores the other session needs
+    opts.add_session_config_entry("session.inter_op.allow_spinning", "0")
+    return opts
+
+
+def _open_session(ort, model_path: Path):
+    """
+    InferenceSession for ``model_path``.
+
+    The first load saves the optimized graph next to the model as
+    ``.opt.onnx``; later loads (on this host) use it directly with graph
+    optimization disabled. If that file can't be written or read, the
+    original model is loaded without it rather than failing.
+    """
+    optimized_path = model_path.with_suffix(".opt.onnx")
+    opts = _session_options(ort)
+    if optimized_path.exists() and optimized_path.stat().st_mtime >= model_path.stat().st_mtime:
+        source_path = optimized_path
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+    else:
+        source_path = model_path
+        opts.optimized_model_filepath = str(optimized_path)
+    try:
+        return ort.InferenceSession(str(source_path), sess_options=opts, providers=_providers())
+    except Exception as e:
+        logger.warning(f"⚠️  Optimized graph cache unusable for {model_path.name}: {e}")
+        return ort.InferenceSession(
+            str(model_path), sess_options=_session_options(ort), providers=_providers()
+        )
+
+
+class _BoundSession:
+    """
+    IO-bound wrapper around an InferenceSession.
+
+    The input is bound straight to the caller's float32 array and the
+    output to a buffer allocated on the first run for each batch size and
+    reused afterwards, so ORT neither copies the input nor allocates a
+    result per call. Each calling thread gets its own binding and output
+    buffers, so runs on the same session from different ``_ORT_POOL``
+    workers proceed in parallel instead of queueing on a lock; the cost
+    is one set of output buffers per thread and batch size.
+
+    With ``graph_batch`` set on a CUDA session, input and output are
+    instead fixed-shape device buffers bound once, as CUDA graph replay
+    requires; batches are padded or chunked to that size, and since the
+    buffers are shared those runs are serialized.
+    """
+
+    def __init__(self, session, graph_batch: int = 0):
+        self._session = session
+        model_input = session.get_inputs()[0]
+        self._input_name = model_input.name
+        self._output_name = session.get_outputs()[0].name
+        # Dynamic batch axes show up as a symbolic (str) or None dimension
+        self.batched = not isinstance(model_input.shape[0], int)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        self.graph_batch = 0
+        if graph_batch and "CUDAExecutionProvider" in session.get_providers():
+            self._init_graph(model_input, graph_batch)
+
+    def _init_graph(self, model_input, graph_batch: int) -> None:
+        import onnxruntime as ort
+
+        if not self.batched:
+            graph_batch = model_input.shape[0]
+        in_shape = [graph_batch] + [
+            d if isinstance(d, int) else default
+            for d, default in zip(model_input.shape[1:], (3, 112, 112))
+        ]
+        out_shape = self._session.get_outputs()[0].shape[1:]
+        if not all(isinstance(d, int) for d in out_shape):
+            logger.warning("CUDA graph disabled: model output has dynamic non-batch dims")
+            return
+        out_shape = [graph_batch] + list(out_shape)
+
+        self._binding = self._session.io_binding()
+        self._graph_stage = np.zeros(in_shape, dtype=np.float32)
+        self._graph_in = ort.OrtValue.ortvalue_from_shape_and_type(in_shape, np.float32, "cuda", 0)
+        self._graph_out = ort.OrtValue.ortvalue_from_shape_and_type(out_shape, np.float32, "cuda", 0)
+        self._binding.bind_ortvalue_input(self._input_name, self._graph_in)
+        self._binding.bind_ortvalue_output(self._output_name, self._graph_out)
+        self.graph_batch = graph_batch
+        # Any batch size is accepted; _run_graph pads/chunks to graph_batch
+        self.batched = True
+
+    def _run_graph(self, faces: np.ndarray) -> np.ndarray:
+        b = self.graph_batch
+        rows = []
+        with self._lock:
+            for start in range(0, faces.shape[0], b):
+                chunk = faces[start:start + b]
+                self._graph_stage[:len(chunk)] = chunk
+                self._graph_in.update_inplace(self._graph_stage)
+                self._session.run_with_iobinding(self._binding)
+                rows.append(self._graph_out.numpy().reshape(b, -1)[:len(chunk)].copy())
+        return np.concatenate(rows)
+
+    def run(self, faces: np.ndarray) -> np.ndarray:
+        """Run one inference on an [N,3,H,W] batch; returns a copy of the output as (N, D)."""
+        faces = np.ascontiguousarray(faces, dtype=np.float32)
+        if self.graph_batch:
+            return self._run_graph(faces)
+        n = faces.shape[0]
+        local = self._thread_state()
+        binding = local.binding
+        binding.bind_cpu_input(self._input_name, faces)
+        out = local.outputs.get(n)
+        if out is None:
+            binding.bind_output(self._output_name, "cpu")
+            self._session.run_with_iobinding(binding)
+            out = np.array(binding.copy_outputs_to_cpu()[0], dtype=np.float32)
+            local.outputs[n] = out
+            self._bind_output(binding, out)
+        else:
+            if local.bound_batch != n:
+                self._bind_output(binding, out)
+            self._session.run_with_iobinding(binding)
+        local.bound_batch = n
+        return out.reshape(n, -1).copy()
+
+    def _thread_state(self) -> threading.local:
+        """This thread's binding, per-batch-size output buffers and currently bound size."""
+        local = self._local
+        if not hasattr(local, "binding"):
+            local.binding = self._session.io_binding()
+            local.outputs = {}
+            local.bound_batch = 0
+        return local
+
+    def _bind_output(self, binding, out: np.ndarray) -> None:
+        binding.bind_output(
+            self._output_name, "cpu", 0, np.float32, list(out.shape), out.ctypes.data,
+        )
+
+
+_mobilefacenet_io: Optional[_BoundSession] = None
+_arcface_io: Optional[_BoundSession] = None
+
+
+def _providers() -> list:
+    """Execution providers; CUDA graph capture only when a static batch is configured."""
+    cuda_options = {"enable_cuda_graph": "1"} if CUDA_GRAPH_BATCH else {}
+    return [("CUDAExecutionProvider", cuda_options), "CPUExecutionProvider"]
+
+
+def _model_file(path: Path) -> Path:
+    """Return the INT8 sibling of ``path`` if enabled and present, else ``path``."""
+    int8_path = path.with_suffix(".int8.onnx")
+    if USE_INT8_MODELS and int8_path.exists():
+        return int8_path
+    return path
+
+
 def _load_onnx_models():
     """Load ONNX models if available"""
-    global mobilefacenet_session, arcface_session
+    global mobilefacenet_session, arcface_session, _mobilefacenet_io, _arcface_io
     
     if USE_MOCK_EMBEDDINGS:
         logger.warning("⚠️  ONNX models not found - using mock embeddings")
@@ -105,19 +330,17 @@ def _load_onnx_models():
         
         # Load MobileFaceNet
         if MOBILEFACENET_PATH.exists():
-            mobilefacenet_session = ort.InferenceSession(
-                str(MOBILEFACENET_PATH),
-                providers=['CUDAExecutionProvider', 'CPUExecutionProvider']
-            )
-            logger.info(f"✅ Loaded MobileFaceNet from {MOBILEFACENET_PATH}")
+            model_path = _model_file(MOBILEFACENET_PATH)
+            mobilefacenet_session = _open_session(ort, model_path)
+            _mobilefacenet_io = _BoundSession(mobilefacenet_session, CUDA_GRAPH_BATCH)
+            logger.info(f"✅ Loaded MobileFaceNet from {model_path}")
         
         # Load ArcFace
         if ARCFACE_PATH.exists():
-            arcface_session = ort.InferenceSession(
-                str(ARCFACE_PATH),
-                providers=['CUDAExecutionProvider', 'CPUExecutionProvider']
-            )
-            logger.info(f"✅ Loaded ArcFace from {ARCFACE_PATH}")
+            model_path = _model_file(ARCFACE_PATH)
+            arcface_session = _open_session(ort, model_path)
+            _arcface_io = _BoundSession(arcface_session, CUDA_GRAPH_BATCH)
+            logger.info(f"✅ Loaded ArcFace from {model_path}")
             
     except ImportError:
         logger.error("❌ onnxruntime not installed - using mock embeddings")
@@ -128,11 +351,103 @@ def _load_onnx_models():
 # Load models on module import
 _load_onnx_models()
 
+_warmup_task: Optional[asyncio.Task] = None
+
+
+def _warm_model(io: Optional[_BoundSession], name: str) -> None:
+    """
+    Run zero batches of the sizes the endpoints use (1 for upload, 2 for
+    verify) so kernel setup and output buffers happen before the first request.
+    """
+    if io is None:
+        return
+    try:
+        for n in ((1, 2) if io.batched else (1,)):
+            io.run(np.zeros((n, 3, 112, 112), dtype=np.float32))
+        logger.info(f"✅ Warmed {name}")
+    except Exception as e:
+        logger.warning(f"⚠️  {name} warm-up failed: {e}")
+
+
+async def _warm_models() -> None:
+    await asyncio.gather(
+        asyncio.to_thread(_warm_model, _mobilefacenet_io, "MobileFaceNet"),
+        asyncio.to_thread(_warm_model, _arcface_io, "ArcFace"),
+    )
+
+
+def start_model_warmup() -> None:
+    """Warm both ONNX sessions in the background (no-op with mock embeddings)."""
+    global _warmup_task
+    if _warmup_task is None and (_mobilefacenet_io is not None or _arcface_io is not None):
+        _warmup_task = asyncio.create_task(_warm_models())
+
 # ============================================================================
 # STORAGE ENGINE
 # ============================================================================
 
-_memory_store: Dict[str, bytes] = {}
+class _BoundedImageStore:
+    """
+    In-memory image store bounded by total bytes, evicting least recently
+    used entries first. Entries idle for longer than the TTL expire; since
+    reads refresh both recency and age, expired entries are always at the
+    LRU end of the ordering.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._items: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def _pop(self, key: str) -> None:
+        value, _ = self._items.pop(key)
+        self._nbytes -= len(value)
+
+    def _evict_expired(self, now: float) -> None:
+        cutoff = now - self.ttl_seconds
+        while self._items:
+            key, (_, touched) = next(iter(self._items.items()))
+            if touched >= cutoff:
+                break
+            self._pop(key)
+
+    def put(self, key: str, value: bytes) -> None:
+        now = time.monotonic()
+        if key in self._items:
+            self._pop(key)
+        self._evict_expired(now)
+
+        if len(value) > self.max_bytes:
+            logger.warning(f"Image {key} ({len(value)} bytes) exceeds memory store cap; not cached")
+            return
+
+        while self._nbytes + len(value) > self.max_bytes:
+            self._pop(next(iter(self._items)))
+
+        self._items[key] = (value, now)
+        self._nbytes += len(value)
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.monotonic()
+        self._evict_expired(now)
+        entry = self._items.get(key)
+        if entry is None:
+            return None
+        self._items[key] = (entry[0], now)
+        self._items.move_to_end(key)
+        return entry[0]
+
+
+_memory_store = _BoundedImageStore(MEMORY_CAP_BYTES, MEMORY_TTL_SECONDS)
+_memory_lock = asyncio.Lock()
 
 def _memory_key(session_id: str, artifact: str) -> str:
     """Generate memory store key"""
@@ -141,40 +456,72 @@ def _memory_key(session_id: str, artifact: str) -> str:
 
 async def save_image_to_memory(session_id: str, artifact: str, image_bytes: bytes) -> None:
     """Save image to in-memory store"""
-    _memory_store[_memory_key(session_id, artifact)] = image_bytes
+    async with _memory_lock:
+        _memory_store.put(_memory_key(session_id, artifact), image_bytes)
     logger.debug(f"Saved {artifact} to memory for session {session_id}")
 
 
 async def load_image_from_memory(session_id: str, artifact: str) -> Optional[bytes]:
     """Load image from in-memory store"""
-    return _memory_store.get(_memory_key(session_id, artifact))
+    async with _memory_lock:
+        return _memory_store.get(_memory_key(session_id, artifact))
+
+
+def _write_local_file(file_path: Path, image_bytes: bytes) -> None:
+    """Blocking part of a local save; run off the event loop."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    # Raw fd write: no BufferedWriter, owner-only permissions, and the
+    # pages are dropped from cache since images are not re-read here
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(image_bytes)
+        while view:
+            view = view[os.write(fd, view):]
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
 
 
 async def save_image_to_local(session_id: str, artifact: str, image_bytes: bytes) -> None:
     """Save image to local filesystem"""
-    local_dir = Path("./biometric_images") / session_id
-    local_dir.mkdir(parents=True, exist_ok=True)
-    
-    file_path = local_dir / f"{artifact}.jpg"
-    with open(file_path, "wb") as f:
-        f.write(image_bytes)
+    file_path = Path("./biometric_images") / session_id / f"{artifact}.jpg"
+    await asyncio.to_thread(_write_local_file, file_path, image_bytes)
     
     logger.debug(f"Saved {artifact} to {file_path}")
 
 
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def _get_s3_client():
+    """Shared boto3 S3 client (thread-safe), created on first use."""
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = boto3.client('s3')
+    return _s3_client
+
+
+def _put_s3_object(key: str, image_bytes: bytes) -> None:
+    """Blocking boto3 upload; run off the event loop."""
+    _get_s3_client().put_object(
+        Bucket=S3_BUCKET,
+        Key=key,
+        Body=image_bytes,
+        ContentType='image/jpeg',
+        # Lets S3 reject a corrupted body instead of storing it
+        ContentMD5=base64.b64encode(hashlib.md5(image_bytes, usedforsecurity=False).digest()).decode(),
+    )
+
+
 async def save_image_to_s3(session_id: str, artifact: str, image_bytes: bytes) -> None:
     """Save image to S3"""
     try:
-        import boto3
-        s3 = boto3.client('s3')
-        
         key = S3_PREFIX.format(session_id=session_id, artifact=artifact)
-        s3.put_object(
-            Bucket=S3_BUCKET,
-            Key=key,
-            Body=image_bytes,
-            ContentType='image/jpeg'
-        )
+        await asyncio.to_thread(_put_s3_object, key, image_bytes)
         logger.debug(f"Saved {artifact} to s3://{S3_BUCKET}/{key}")
     except Exception as e:
         logger.error(f"Failed to save to S3: {e}")
@@ -208,50 +555,73 @@ def load_image_from_bytes(image_bytes: bytes) -> np.ndarray:
     Convert raw bytes → OpenCV BGR image safely.
     """
     try:
-        pil_img = Image.open(io.BytesIO(image_bytes)).convert("RGB")
-        return cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+        # Decode straight to BGR; EXIF orientation is ignored, as before
+        img = cv2.imdecode(
+            np.frombuffer(image_bytes, dtype=np.uint8),
+            cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION,
+        )
     except Exception as e:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid image data: {e}"
         )
+    if img is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid image data: could not decode image"
+        )
+    return img
 
 
 def preprocess_face_image(img: np.ndarray, size: Tuple[int, int] = (112, 112)) -> np.ndarray:
     """
     Normalize image for MobileFaceNet & ArcFace.
-    Resize → BGR→RGB → float32 → normalize.
+    Resize → BGR→RGB → float32 → normalize → NCHW, fused in one OpenCV call.
     """
-    face_img = cv2.resize(img, size)
-    face_img = cv2.cvtColor(face_img, cv2.COLOR_BGR2RGB)
-    face_img = face_img.astype("float32") / 127.5 - 1.0
-    face_img = np.transpose(face_img, (2, 0, 1))  # CHW
-    return face_img[np.newaxis, ...]  # Add batch dim
+    # (x - 127.5) / 127.5 == x / 127.5 - 1.0
+    return cv2.dnn.blobFromImage(
+        img,
+        scalefactor=1.0 / 127.5,
+        size=size,
+        mean=(127.5, 127.5, 127.5),
+        swapRB=True,
+    )
 
 
 # ---------------------------------------------------------
 #  LANDMARK MATH UTILITIES
 # ---------------------------------------------------------
 
+# Landmark index pairs whose distances feed each ratio
+_EAR_IDX_A = np.array([1, 2, 0])
+_EAR_IDX_B = np.array([5, 4, 3])
+_MAR_IDX_A = np.array([2, 3, 4, 0])
+_MAR_IDX_B = np.array([8, 7, 6, 10])
+_POSE_IDX_A = np.array([1, 1])
+_POSE_IDX_B = np.array([0, 2])
+
+
 def _distance(p1, p2):
-    return np.linalg.norm(np.array(p1) - np.array(p2))
+    d = np.asarray(p1, dtype=np.float64) - np.asarray(p2, dtype=np.float64)
+    return np.sqrt(np.vdot(d, d))
+
+
+def _pair_distances(points: np.ndarray, idx_a: np.ndarray, idx_b: np.ndarray) -> np.ndarray:
+    """Euclidean distances between points[idx_a[i]] and points[idx_b[i]]."""
+    diffs = points[idx_a] - points[idx_b]
+    return np.sqrt(np.sum(diffs * diffs, axis=1))
 
 
 def _eye_aspect_ratio(eye):
     """EAR = (||p2 - p6|| + ||p3 - p5||) / (2 * ||p1 - p4||)"""
-    A = _distance(eye[1], eye[5])
-    B = _distance(eye[2], eye[4])
-    C = _distance(eye[0], eye[3])
-    return (A + B) / (2.0 * C + 1e-6)
+    d = _pair_distances(np.asarray(eye, dtype=np.float64), _EAR_IDX_A, _EAR_IDX_B)
+    return (d[0] + d[1]) / (2.0 * d[2] + 1e-6)
 
 
 def _mouth_aspect_ratio(mouth):
     """MAR = (||p3 - p9|| + ||p4 - p8|| + ||p5 - p7||) / (2 * ||p1 - p11||)"""
-    A = _distance(mouth[2], mouth[8])
-    B = _distance(mouth[3], mouth[7])
-    C = _distance(mouth[4], mouth[6])
-    D = _distance(mouth[0], mouth[10])
-    return (A + B + C) / (2.0 * D + 1e-6)
+    d = _pair_distances(np.asarray(mouth, dtype=np.float64), _MAR_IDX_A, _MAR_IDX_B)
+    return (d[0] + d[1] + d[2]) / (2.0 * d[3] + 1e-6)
 
 
 def _head_pose_magnitude(landmarks):
@@ -259,18 +629,82 @@ def _head_pose_magnitude(landmarks):
     Simple head pose approximation:
     Evaluate deviation from frontal position using key landmarks.
     """
-    nose = np.array(landmarks[1])
-    left = np.array(landmarks[0])
-    right = np.array(landmarks[2])
     # Magnitude = asymmetry / average distance
-    dist_left = _distance(nose, left)
-    dist_right = _distance(nose, right)
+    d = _pair_distances(
+        np.asarray(landmarks, dtype=np.float64), _POSE_IDX_A, _POSE_IDX_B
+    )
+    dist_left, dist_right = float(d[0]), float(d[1])
     if (dist_left + dist_right) == 0:
         return 0.0
     ratio = abs(dist_left - dist_right) / max(dist_left, dist_right)
     return float(min(1.0, ratio))
 
 
+# ---------------------------------------------------------
+#  COMPILED LIVENESS KERNEL (numba, optional)
+# ---------------------------------------------------------
+
+def _liveness_features(left_eye, right_eye, mouth, triad):
+    """
+    Scalar EAR/MAR/head-pose features over (N, 2) float64 landmark arrays.
+    Returns (ear_left, ear_right, mar, head_pose). Callers must check shapes:
+    compiled code does not bounds-check.
+    """
+    d_l = np.empty(3)
+    d_r = np.empty(3)
+    for i in range(3):
+        a = _EAR_IDX_A[i]
+        b = _EAR_IDX_B[i]
+        dx = left_eye[a, 0] - left_eye[b, 0]
+        dy = left_eye[a, 1] - left_eye[b, 1]
+        d_l[i] = np.sqrt(dx * dx + dy * dy)
+        dx = right_eye[a, 0] - right_eye[b, 0]
+        dy = right_eye[a, 1] - right_eye[b, 1]
+        d_r[i] = np.sqrt(dx * dx + dy * dy)
+    ear_left = (d_l[0] + d_l[1]) / (2.0 * d_l[2] + 1e-6)
+    ear_right = (d_r[0] + d_r[1]) / (2.0 * d_r[2] + 1e-6)
+
+    d_m = np.empty(4)
+    for i in range(4):
+        a = _MAR_IDX_A[i]
+        b = _MAR_IDX_B[i]
+        dx = mouth[a, 0] - mouth[b, 0]
+        dy = mouth[a, 1] - mouth[b, 1]
+        d_m[i] = np.sqrt(dx * dx + dy * dy)
+    mar = (d_m[0] + d_m[1] + d_m[2]) / (2.0 * d_m[3] + 1e-6)
+
+    dx = triad[1, 0] - triad[0, 0]
+    dy = triad[1, 1] - triad[0, 1]
+    dist_left = np.sqrt(dx * dx + dy * dy)
+    dx = triad[1, 0] - triad[2, 0]
+    dy = triad[1, 1] - triad[2, 1]
+    dist_right = np.sqrt(dx * dx + dy * dy)
+    if (dist_left + dist_right) == 0:
+        head_pose = 0.0
+    else:
+        head_pose = min(1.0, abs(dist_left - dist_right) / max(dist_left, dist_right))
+
+    return ear_left, ear_right, mar, head_pose
+
+
+if NUMBA_AVAILABLE:
+    _liveness_kernel = njit(cache=True)(_liveness_features)
+    # Compile (or load from cache) at import so the first request is hot
+    _liveness_kernel(np.zeros((6, 2)), np.zeros((6, 2)), np.zeros((12, 2)), np.zeros((3, 2)))
+else:
+    _liveness_kernel = None
+
+
+def _kernel_shapes_ok(left_eye, right_eye, mouth, triad) -> bool:
+    """True if every landmark group is an (N, 2) array large enough for the kernel."""
+    return (
+        left_eye.ndim == 2 and left_eye.shape[0] >= 6 and left_eye.shape[1] == 2
+        and right_eye.ndim == 2 and right_eye.shape[0] >= 6 and right_eye.shape[1] == 2
+        and mouth.ndim == 2 and mouth.shape[0] >= 11 and mouth.shape[1] == 2
+        and triad.ndim == 2 and triad.shape[0] >= 3 and triad.shape[1] == 2
+    )
+
+
 # ---------------------------------------------------------
 #  HYBRID LIVENESS ENGINE (MediaPipe + Heuristic + Math)
 # ---------------------------------------------------------
@@ -293,10 +727,21 @@ def compute_liveness(landmarks: Dict[str, Any]) -> Dict[str, Any]:
     }
     """
     try:
-        ear_left = _eye_aspect_ratio(landmarks["left_eye"])
-        ear_right = _eye_aspect_ratio(landmarks["right_eye"])
-        mar = _mouth_aspect_ratio(landmarks["mouth"])
-        head_pose = _head_pose_magnitude(landmarks["triad"])
+        # Convert each landmark group to an array once
+        left_eye = np.asarray(landmarks["left_eye"], dtype=np.float64)
+        right_eye = np.asarray(landmarks["right_eye"], dtype=np.float64)
+        mouth = np.asarray(landmarks["mouth"], dtype=np.float64)
+        triad = np.asarray(landmarks["triad"], dtype=np.float64)
+
+        if _liveness_kernel is not None and _kernel_shapes_ok(left_eye, right_eye, mouth, triad):
+            ear_left, ear_right, mar, head_pose = _liveness_kernel(
+                left_eye, right_eye, mouth, triad
+            )
+        else:
+            ear_left = _eye_aspect_ratio(left_eye)
+            ear_right = _eye_aspect_ratio(right_eye)
+            mar = _mouth_aspect_ratio(mouth)
+            head_pose = _head_pose_magnitude(triad)
 
     except Exception:
         # Incomplete landmark set
@@ -333,6 +778,15 @@ def compute_liveness(landmarks: Dict[str, Any]) -> Dict[str, Any]:
 #  FACE DETECTION (SIMPLE VERSION)
 # ---------------------------------------------------------
 
+# Loaded once at import; re-parsing the cascade XML per call dominated latency
+_FACE_CASCADE = cv2.CascadeClassifier(
+    cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+)
+
+# Cascade cost scales with pixel count, so detect on a downscaled copy
+DETECT_MAX_WIDTH = 640
+
+
 def detect_face_simple(img: np.ndarray) -> Optional[np.ndarray]:
     """
     Very simple face detection using OpenCV Haar cascade.
@@ -340,15 +794,22 @@ def detect_face_simple(img: np.ndarray) -> Optional[np.ndarray]:
     """
     gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
-    # Load cascade lazily
-    cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-    face_cascade = cv2.CascadeClassifier(cascade_path)
+    height, width = gray.shape[:2]
+    scale = 1.0
+    if width > DETECT_MAX_WIDTH:
+        scale = DETECT_MAX_WIDTH / width
+        gray = cv2.resize(
+            gray,
+            (DETECT_MAX_WIDTH, max(1, round(height * scale))),
+            interpolation=cv2.INTER_AREA,
+        )
 
-    faces = face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=4)
+    faces = _FACE_CASCADE.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=4)
     if len(faces) == 0:
         return None
 
-    x, y, w, h = faces[0]  # first face only
+    # First face only, mapped back to full-resolution coordinates
+    x, y, w, h = (int(round(v / scale)) for v in faces[0])
     face = img[y : y + h, x : x + w]
     return face
 
@@ -357,20 +818,29 @@ def detect_face_simple(img: np.ndarray) -> Optional[np.ndarray]:
 #  SELFIE → LANDMARK EXTRACTION PLACEHOLDER (MediaPipe)
 # ---------------------------------------------------------
 
-def extract_landmarks_placeholder(img: np.ndarray) -> Dict[str, Any]:
+# Mock 6 eye points each, 12 mouth points, 3 triad - built once as
+# read-only (N, 2) views into one buffer so compute_liveness uses them as-is
+_MOCK_LANDMARK_BUF = np.full((27, 2), 50.0)
+_MOCK_LANDMARK_BUF.setflags(write=False)
+_MOCK_LANDMARKS = MappingProxyType({
+    "left_eye": _MOCK_LANDMARK_BUF[0:6],
+    "right_eye": _MOCK_LANDMARK_BUF[6:12],
+    "mouth": _MOCK_LANDMARK_BUF[12:24],
+    "triad": _MOCK_LANDMARK_BUF[24:27],
+})
+
+if _liveness_kernel is not None:
+    # Read-only arrays are a separate numba signature; compile it up front too
+    _liveness_kernel(*_MOCK_LANDMARKS.values())
+
+
+def extract_landmarks_placeholder(img: np.ndarray) -> Mapping[str, np.ndarray]:
     """
     Placeholder extraction used because MediaPipe runs in browser.
     The frontend sends landmark data.
     For now this function returns mock landmarks so the backend can test end-to-end.
     """
-    # Mock 12 mouth points, 6 eye points, 3 triad
-    mock_pt = lambda: (50.0, 50.0)
-    return {
-        "left_eye": [mock_pt() for _ in range(6)],
-        "right_eye": [mock_pt() for _ in range(6)],
-        "mouth": [mock_pt() for _ in range(12)],
-        "triad": [mock_pt() for _ in range(3)],
-    }
+    return _MOCK_LANDMARKS
 
 
 # ============================================================================
@@ -383,28 +853,42 @@ def extract_landmarks_placeholder(img: np.ndarray) -> Dict[str, Any]:
 
 def _normalize(v: np.ndarray) -> np.ndarray:
     """L2-normalize a vector safely."""
-    norm = np.linalg.norm(v)
+    norm = np.sqrt(np.vdot(v, v))
     if norm < 1e-8:
         return v
     return v / norm
 
 
 def _cosine(a: np.ndarray, b: np.ndarray) -> float:
-    """Cosine similarity between two vectors."""
-    a_n = _normalize(a)
-    b_n = _normalize(b)
-    return float(np.dot(a_n, b_n))
+    """Cosine similarity between two vectors (one sqrt, no temporaries)."""
+    na2 = float(np.vdot(a, a))
+    nb2 = float(np.vdot(b, b))
+    if na2 < 1e-16 or nb2 < 1e-16:
+        return 0.0
+    return float(np.dot(a, b)) / math.sqrt(na2 * nb2)
 
 
 # ---------------------------------------------------------
 #  MOCK EMBEDDINGS (used if ONNX is missing)
 # ---------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def _mock_embedding(dims: int) -> np.ndarray:
-    """Return a deterministic vector for testing."""
+    """Return a deterministic vector for testing (built once per size, read-only)."""
     rng = np.random.default_rng(42)
-    v = rng.normal(0, 1, dims).astype("float32")
-    return _normalize(v)
+    v = _normalize(rng.normal(0, 1, dims).astype("float32"))
+    v.setflags(write=False)
+    return v
+
+
+def _mock_rows(dims: int, n: int) -> np.ndarray:
+    """(n, dims) read-only view of the mock vector, for the batch fallbacks."""
+    return np.broadcast_to(_mock_embedding(dims), (n, dims))
+
+
+def _is_mock_embedding(vec: np.ndarray) -> bool:
+    """True if ``vec`` is (a row view of) the mock vector rather than model output."""
+    return np.may_share_memory(vec, _mock_embedding(vec.shape[-1]))
 
 
 # ---------------------------------------------------------
@@ -423,11 +907,7 @@ def run_mobilefacenet(face_img: np.ndarray) -> np.ndarray:
 
     try:
         # Input for ONNX: float32, shape [1,3,112,112]
-        input_name = mobilefacenet_session.get_inputs()[0].name
-        out = mobilefacenet_session.run(None, {input_name: face_img})
-        v = np.array(out[0]).astype("float32")
-        v = v.reshape(-1)
-        return _normalize(v)
+        return _normalize(_mobilefacenet_io.run(face_img)[0])
     except Exception as e:
         logger.warning(f"MobileFaceNet failed, using mock embedding: {e}")
         return _mock_embedding(128)
@@ -448,19 +928,97 @@ def run_arcface(face_img: np.ndarray) -> np.ndarray:
         return _mock_embedding(512)
 
     try:
-        input_name = arcface_session.get_inputs()[0].name
-        out = arcface_session.run(None, {input_name: face_img})
-        v = np.array(out[0]).astype("float32").reshape(-1)
-        return _normalize(v)
+        return _normalize(_arcface_io.run(face_img)[0])
     except Exception as e:
         logger.warning(f"ArcFace failed, using mock embedding: {e}")
         return _mock_embedding(512)
 
 
+# ---------------------------------------------------------
+#  BATCHED INFERENCE
+# ---------------------------------------------------------
+
+def _normalize_rows(m: np.ndarray, inplace: bool = False) -> np.ndarray:
+    """
+    L2-normalize each row; near-zero rows are left as-is (like _normalize).
+    ``inplace=True`` divides ``m`` itself - only for arrays the caller owns.
+    """
+    norms = np.sqrt(np.einsum("ij,ij->i", m, m))
+    norms[norms < 1e-8] = 1.0
+    if inplace:
+        m /= norms[:, None]
+        return m
+    return m / norms[:, None]
+
+
+def _run_batch(io: _BoundSession, faces: np.ndarray) -> np.ndarray:
+    """One session run for the whole batch, or per face if the model's batch axis is fixed."""
+    if io.batched:
+        return io.run(faces)
+    return np.concatenate([io.run(face[None]) for face in faces])
+
+
+def run_mobilefacenet_batch(faces: np.ndarray) -> np.ndarray:
+    """
+    MobileFaceNet over an [N,3,112,112] batch in a single session run.
+    Output: (N, 128) normalized embeddings.
+    """
+    if USE_MOCK_EMBEDDINGS or mobilefacenet_session is None:
+        return _mock_rows(128, len(faces))
+
+    try:
+        # _run_batch returns a fresh array, so normalize it in place
+        return _normalize_rows(_run_batch(_mobilefacenet_io, faces), inplace=True)
+    except Exception as e:
+        logger.warning(f"MobileFaceNet batch failed, using mock embeddings: {e}")
+        return _mock_rows(128, len(faces))
+
+
+def run_arcface_batch(faces: np.ndarray) -> np.ndarray:
+    """
+    ArcFace over an [N,3,112,112] batch in a single session run.
+    Output: (N, 512) normalized embeddings.
+    """
+    if USE_MOCK_EMBEDDINGS or arcface_session is None:
+        return _mock_rows(512, len(faces))
+
+    try:
+        # _run_batch returns a fresh array, so normalize it in place
+        return _normalize_rows(_run_batch(_arcface_io, faces), inplace=True)
+    except Exception as e:
+        logger.warning(f"ArcFace batch failed, using mock embeddings: {e}")
+        return _mock_rows(512, len(faces))
+
+
 # ---------------------------------------------------------
 #  EMBEDDING PIPELINE
 # ---------------------------------------------------------
 
+def embed_faces(imgs: List[np.ndarray]) -> List[Dict[str, np.ndarray]]:
+    """
+    Preprocess → embed several images (e.g. selfie + ID) with one run
+    per model. Returns one {"mobile": (128,), "arcface": (512,)} per image.
+    """
+    processed = []
+    for img in imgs:
+        face = detect_face_simple(img)
+        if face is None:
+            raise HTTPException(400, "Face not detected")
+        processed.append(preprocess_face_image(face))
+    batch = np.concatenate(processed)
+
+    if mobilefacenet_session is not None and arcface_session is not None:
+        # Overlap the two inferences on the ORT pool
+        arc_future = _ORT_POOL.submit(run_arcface_batch, batch)
+        mobile = run_mobilefacenet_batch(batch)
+        arc = arc_future.result()
+    else:
+        mobile = run_mobilefacenet_batch(batch)
+        arc = run_arcface_batch(batch)
+
+    return [{"mobile": m, "arcface": a} for m, a in zip(mobile, arc)]
+
+
 def embed_face(img: np.ndarray) -> Dict[str, np.ndarray]:
     """
     Preprocess → embed using both models.
@@ -470,50 +1028,220 @@ def embed_face(img: np.ndarray) -> Dict[str, np.ndarray]:
         "arcface": (512,)
     }
     """
+    return embed_faces([img])[0]
+
+
+# ---------------------------------------------------------
+#  DYNAMIC BATCHING (concurrent requests)
+# ---------------------------------------------------------
+
+class OnnxBatcher:
+    """
+    Coalesces concurrent single-face inferences into one batched run.
+
+    ``submit`` queues a [1,3,112,112] tensor and awaits its row. A
+    background task collects up to ``max_batch`` tensors or waits at most
+    ``max_wait`` seconds after the first, then runs ``batch_fn`` once on
+    the ORT pool so the event loop stays free.
+    """
+
+    def __init__(self, batch_fn, max_batch: int = BATCH_MAX_SIZE, max_wait: float = BATCH_MAX_WAIT_SECONDS):
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.items = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, face: np.ndarray) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._drain())
+        future = loop.create_future()
+        self._queue.put_nowait((face, future))
+        return await future
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(pending) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            batch = np.concatenate([face for face, _ in pending])
+            try:
+                rows = await loop.run_in_executor(_ORT_POOL, self.batch_fn, batch)
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.items += len(pending)
+            for (_, future), row in zip(pending, rows):
+                if not future.done():
+                    future.set_result(row)
+
+
+mobilefacenet_batcher = OnnxBatcher(run_mobilefacenet_batch)
+arcface_batcher = OnnxBatcher(run_arcface_batch)
+
+
+class _EmbeddingCache:
+    """
+    LRU of read-only embedding pairs keyed by the image's SHA-256 digest,
+    so re-uploads of identical bytes (retries, duplicate IDs) skip both
+    models. Vectors are kept float32 so hits score exactly like misses.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: "OrderedDict[bytes, Dict[str, np.ndarray]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: bytes) -> Optional[Dict[str, np.ndarray]]:
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+        return item
+
+    def put(self, key: bytes, embeddings: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        if self.maxsize <= 0:
+            return embeddings
+        frozen = {}
+        for name, vec in embeddings.items():
+            vec = np.asarray(vec, dtype=np.float32)
+            vec.setflags(write=False)
+            frozen[name] = vec
+        self._items[key] = frozen
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+        return frozen
+
+
+_embedding_cache = _EmbeddingCache(EMBED_CACHE_SIZE)
+
+
+async def embed_face_async(img: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    embed_face for request handlers: inferences go through the dynamic
+    batchers so concurrent uploads share session runs.
+    """
+    if mobilefacenet_session is None or arcface_session is None:
+        return embed_face(img)
+
     face = detect_face_simple(img)
     if face is None:
         raise HTTPException(400, "Face not detected")
-
     processed = preprocess_face_image(face)
 
-    mobile_vec = run_mobilefacenet(processed)
-    arc_vec = run_arcface(processed)
-
+    mobile_vec, arc_vec = await asyncio.gather(
+        mobilefacenet_batcher.submit(processed),
+        arcface_batcher.submit(processed),
+    )
     return {
         "mobile": mobile_vec,
         "arcface": arc_vec
     }
 
 
+async def embed_image_cached(image_bytes: bytes, img: np.ndarray) -> Dict[str, np.ndarray]:
+    """embed_face_async behind the content-addressed embedding cache."""
+    key = hashlib.sha256(image_bytes).digest()
+    cached = _embedding_cache.get(key)
+    if cached is not None:
+        return cached
+    embeddings = await embed_face_async(img)
+    # A mock fallback (failed or missing model) must not stick to this image
+    if any(_is_mock_embedding(vec) for vec in embeddings.values()):
+        return embeddings
+    return _embedding_cache.put(key, embeddings)
+
+
 # ---------------------------------------------------------
 #  EMBEDDING COMPARISON (DUAL MODEL)
 # ---------------------------------------------------------
 
+def compare_batch(
+    mobile_q: np.ndarray,
+    mobile_db: np.ndarray,
+    arc_q: np.ndarray,
+    arc_db: np.ndarray,
+    assume_normalized: bool = True,
+) -> Dict[str, np.ndarray]:
+    """
+    Score one query against N candidates: ``mobile_db`` is [N,128] and
+    ``arc_db`` is [N,512]. Each model is a single matrix-vector product,
+    so cosine = dot when the vectors are L2-normalized (pass
+    ``assume_normalized=False`` to normalize first).
+    Returns per-candidate arrays of the compare_embeddings fields.
+    """
+    if not assume_normalized:
+        mobile_q, arc_q = _normalize(mobile_q), _normalize(arc_q)
+        mobile_db, arc_db = _normalize_rows(mobile_db), _normalize_rows(arc_db)
+
+    mobile_scores = mobile_db @ mobile_q
+    arc_scores = arc_db @ arc_q
+
+    return {
+        "mobile_score": mobile_scores,
+        "arcface_score": arc_scores,
+        # Fused weighted score (meta-signal)
+        "fused_score": mobile_scores * 0.4 + arc_scores * 0.6,
+        "is_match": (mobile_scores >= MOBILEFACENET_THRESHOLD) & (arc_scores >= ARCFACE_THRESHOLD),
+    }
+
+
 def compare_embeddings(
     mobile_a: np.ndarray,
     mobile_b: np.ndarray,
     arc_a: np.ndarray,
-    arc_b: np.ndarray
+    arc_b: np.ndarray,
+    assume_normalized: bool = False,
 ) -> Dict[str, Any]:
     """
     Compare two sets of embeddings:
     - MobileFaceNet cosine
     - ArcFace cosine
     - Fused match decision
-    """
-    mobile_score = _cosine(mobile_a, mobile_b)
-    arc_score = _cosine(arc_a, arc_b)
 
-    match = (mobile_score >= MOBILEFACENET_THRESHOLD) and (arc_score >= ARCFACE_THRESHOLD)
+    With ``assume_normalized=True`` (e.g. vectors straight from
+    embed_face or the DB, which are stored L2-normalized) cosine is
+    just the dot product and the norms are skipped.
+    """
+    # Scalar path: two dot products boxed once each, no [1,N] temporaries
+    if assume_normalized:
+        mobile_score = float(np.dot(mobile_a, mobile_b))
+        arc_score = float(np.dot(arc_a, arc_b))
+    else:
+        mobile_score = _cosine(mobile_a, mobile_b)
+        arc_score = _cosine(arc_a, arc_b)
+    return match_from_scores(mobile_score, arc_score)
 
-    # Fused weighted score (meta-signal)
-    fused = float(mobile_score * 0.4 + arc_score * 0.6)
 
+def match_from_scores(mobile_score: float, arc_score: float) -> Dict[str, Any]:
+    """
+    compare_embeddings result for cosine scores that are already Python
+    floats (from _cosine, or computed in SQL).
+    """
     return {
-        "mobile_score": float(mobile_score),
-        "arcface_score": float(arc_score),
-        "fused_score": fused,
-        "is_match": bool(match),
+        "mobile_score": mobile_score,
+        "arcface_score": arc_score,
+        "fused_score": mobile_score * 0.4 + arc_score * 0.6,
+        "is_match": mobile_score >= MOBILEFACENET_THRESHOLD and arc_score >= ARCFACE_THRESHOLD,
     }
 
 
@@ -521,31 +1249,25 @@ def compare_embeddings(
 #  MATCH EXPLAINABILITY
 # ---------------------------------------------------------
 
+# (result key, threshold, reason type) checked by explain_match, in order
+_MATCH_CRITERIA = (
+    ("mobile_score", MOBILEFACENET_THRESHOLD, "mobilefacenet_low_match"),
+    ("arcface_score", ARCFACE_THRESHOLD, "arcface_low_match"),
+)
+
+
 def explain_match(result: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert match result into structured explanation signals.
     """
-    reasons = []
-
-    if result["mobile_score"] < MOBILEFACENET_THRESHOLD:
-        reasons.append({
-            "type": "mobilefacenet_low_match",
-            "threshold": MOBILEFACENET_THRESHOLD,
-            "value": result["mobile_score"]
-        })
-
-    if result["arcface_score"] < ARCFACE_THRESHOLD:
-        reasons.append({
-            "type": "arcface_low_match",
-            "threshold": ARCFACE_THRESHOLD,
-            "value": result["arcface_score"]
-        })
-
-    if not reasons:
-        reasons.append({
-            "type": "match_success",
-            "message": "Face detected and matched across both models"
-        })
+    reasons = [
+        {"type": reason, "threshold": threshold, "value": result[key]}
+        for key, threshold, reason in _MATCH_CRITERIA
+        if result[key] < threshold
+    ] or [{
+        "type": "match_success",
+        "message": "Face detected and matched across both models"
+    }]
 
     return {
         "summary": "match" if result["is_match"] else "no_match",
@@ -561,11 +1283,21 @@ def explain_match(result: Dict[str, Any]) -> Dict[str, Any]:
 #  PERSISTENCE HELPERS
 # ---------------------------------------------------------
 
+def _utcnow() -> datetime:
+    """Current UTC time, naive to match the timezone-less DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 async def db_save(obj):
     """Utility to persist a SQLAlchemy object."""
     return await save_record(obj)
 
 
+async def db_save_all(objs: list):
+    """Persist several SQLAlchemy objects in one transaction."""
+    return await save_records(objs)
+
+
 async def notify_orchestrate(event_type: str, payload: dict):
     """Send event notification to TuringOrchestrate."""
     try:
@@ -583,30 +1315,35 @@ async def notify_orchestrate(event_type: str, payload: dict):
 #  CREATE BIOMETRIC SESSION
 # ---------------------------------------------------------
 
-async def create_biometric_session(session_id: str, tenant_id: str) -> BiometricSession:
-    obj = BiometricSession(
+def new_biometric_session(
+    session_id: str,
+    tenant_id: str,
+    created_at: Optional[datetime] = None,
+) -> BiometricSession:
+    now = created_at or _utcnow()
+    return BiometricSession(
         id=session_id,
         tenant_id=tenant_id,
         status="created",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
     )
-    return await db_save(obj)
 
 
 # ---------------------------------------------------------
 #  SAVE ARTIFACT
 # ---------------------------------------------------------
 
-async def save_artifact(
+def new_artifact(
     session_id: str,
     artifact_type: str,
     storage_path: str,
     size_bytes: int,
     img_width: int = 0,
     img_height: int = 0,
+    created_at: Optional[datetime] = None,
 ) -> BiometricArtifact:
-    obj = BiometricArtifact(
+    return BiometricArtifact(
         id=f"art_{uuid.uuid4().hex[:16]}",
         session_id=session_id,
         artifact_type=artifact_type,
@@ -615,16 +1352,15 @@ async def save_artifact(
         image_size_bytes=size_bytes,
         image_width=img_width,
         image_height=img_height,
-        created_at=datetime.utcnow(),
+        created_at=created_at or _utcnow(),
     )
-    return await db_save(obj)
 
 
 # ---------------------------------------------------------
 #  SAVE LIVENESS RESULT
 # ---------------------------------------------------------
 
-async def save_liveness_result(
+def new_liveness_result(
     session_id: str,
     artifact_id: str,
     score: float,
@@ -633,8 +1369,9 @@ async def save_liveness_result(
     head_pose_magnitude: float,
     is_live: bool,
     reason: str,
+    created_at: Optional[datetime] = None,
 ) -> LivenessResult:
-    obj = LivenessResult(
+    return LivenessResult(
         id=f"live_{uuid.uuid4().hex[:16]}",
         session_id=session_id,
         artifact_id=artifact_id,
@@ -646,26 +1383,34 @@ async def save_liveness_result(
         liveness_version="2.0.0",
         passed=is_live,
         risk_level="low" if is_live else "high",
-        created_at=datetime.utcnow(),
+        created_at=created_at or _utcnow(),
         extra_metadata={
             "mouth_ratio": mouth_ratio,
             "reason": reason,
         }
     )
-    return await db_save(obj)
 
 
 # ---------------------------------------------------------
 #  SAVE FACE EMBEDDINGS
 # ---------------------------------------------------------
 
-async def save_embeddings(
+def _vector_param(vec: np.ndarray):
+    """Column value for an embedding: a float16 array for pgvector (halfvec), a list for the JSON fallback."""
+    if PGVECTOR_AVAILABLE:
+        return np.asarray(vec, dtype=np.float16)
+    return vec.tolist()
+
+
+def new_embeddings(
     session_id: str,
     artifact_id: str,
     embedding_mobile: np.ndarray,
-    embedding_arc: np.ndarray
-) -> FaceEmbedding:
-    # Save both embeddings as separate records
+    embedding_arc: np.ndarray,
+    created_at: Optional[datetime] = None,
+) -> Tuple[FaceEmbedding, FaceEmbedding]:
+    # Both embeddings are stored as separate records
+    now = created_at or _utcnow()
     obj_mobile = FaceEmbedding(
         id=f"emb_{uuid.uuid4().hex[:16]}",
         session_id=session_id,
@@ -673,11 +1418,9 @@ async def save_embeddings(
         embedding_type="selfie",
         model_name="mobilefacenet",
         embedding_size=128,
-        embedding_vector=embedding_mobile.tolist(),
-        created_at=datetime.utcnow(),
+        embedding_vector=_vector_param(embedding_mobile),
+        created_at=now,
     )
-    await db_save(obj_mobile)
-    
     obj_arc = FaceEmbedding(
         id=f"emb_{uuid.uuid4().hex[:16]}",
         session_id=session_id,
@@ -685,10 +1428,61 @@ async def save_embeddings(
         embedding_type="selfie",
         model_name="arcface",
         embedding_size=512,
-        embedding_vector=embedding_arc.tolist(),
-        created_at=datetime.utcnow(),
+        embedding_vector=_vector_param(embedding_arc),
+        created_at=now,
     )
-    return await db_save(obj_arc)
+    return obj_mobile, obj_arc
+
+
+# ---------------------------------------------------------
+#  SEARCH FACE EMBEDDINGS (1:N)
+# ---------------------------------------------------------
+
+async def search_embeddings(
+    session: AsyncSession,
+    query: np.ndarray,
+    model_name: str = "arcface",
+    k: int = 1,
+    exclude_session_id: Optional[str] = None,
+) -> List[Tuple[FaceEmbedding, float]]:
+    """
+    Top-k stored embeddings by cosine similarity to ``query``.
+
+    With pgvector the ranking runs in Postgres via the ``<=>`` cosine
+    distance operator, served by the model's HNSW index (approximate
+    top-k), so no candidates are pulled into Python. Without
+    it, the JSON vectors for ``model_name`` are stacked once and scored
+    with a single matrix-vector product.
+    """
+    conditions = [FaceEmbedding.model_name == model_name]
+    if exclude_session_id is not None:
+        conditions.append(FaceEmbedding.session_id != exclude_session_id)
+
+    if PGVECTOR_AVAILABLE:
+        vector = FaceEmbedding.embedding_vector
+        if model_name in EMBEDDING_DIMS:
+            # Match the partial index: same cast, model name inlined so even
+            # a generic prepared plan can prove the index predicate
+            vector = FaceEmbedding.ann_vector(model_name)
+            conditions[0] = FaceEmbedding.model_name == literal(model_name, literal_execute=True)
+        distance = vector.cosine_distance(_vector_param(query))
+        rows = await session.execute(
+            select(FaceEmbedding, distance).where(*conditions).order_by(distance).limit(k)
+        )
+        return [(emb, 1.0 - float(dist)) for emb, dist in rows.all()]
+
+    rows = (await session.execute(select(FaceEmbedding).where(*conditions))).scalars().all()
+    if not rows:
+        return []
+    matrix = np.asarray([row.embedding_vector for row in rows], dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+    scores = matrix @ _normalize(np.asarray(query, dtype=np.float32))
+    if k < len(scores):
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+    else:
+        top = np.argsort(-scores)
+    return [(rows[i], float(scores[i])) for i in top]
 
 
 # ---------------------------------------------------------
@@ -702,7 +1496,8 @@ async def save_match_result(
     mobile_score: float,
     arcface_score: float,
     fused_score: float,
-    is_match: bool
+    is_match: bool,
+    created_at: Optional[datetime] = None,
 ) -> FaceMatchResult:
     obj = FaceMatchResult(
         id=f"match_{uuid.uuid4().hex[:16]}",
@@ -715,7 +1510,7 @@ async def save_match_result(
         match=is_match,
         confidence=0.95,
         risk_level="low" if is_match else "high",
-        created_at=datetime.utcnow(),
+        created_at=created_at or _utcnow(),
         extra_metadata={
             "mobile_score": mobile_score,
             "arcface_score": arcface_score,
@@ -728,19 +1523,117 @@ async def save_match_result(
 #  SAVE BIOMETRIC EVENT (optional but useful)
 # ---------------------------------------------------------
 
+_EVENT_COLUMNS = ("session_id", "event_type", "event_status", "event_data", "created_at")
+# Created by start_event_flusher so the queue belongs to the loop that drains it
+_EVENT_QUEUE: Optional[asyncio.Queue] = None
+_event_flusher: Optional[asyncio.Task] = None
+
+
+async def _save_event_rows(rows: List[tuple]) -> None:
+    """COPY a batch of event rows; fall back to ORM inserts if COPY fails."""
+    try:
+        await copy_records_async(
+            "biometric_events",
+            _EVENT_COLUMNS,
+            [(sid, etype, status_, json.dumps(data), ts) for sid, etype, status_, data, ts in rows],
+        )
+    except Exception as e:
+        logger.warning(f"⚠️  Event COPY failed ({e}); inserting {len(rows)} events individually")
+        for row in rows:
+            try:
+                await db_save(BiometricEvent(**dict(zip(_EVENT_COLUMNS, row))))
+            except Exception as e:
+                logger.error(f"❌ Failed to persist event {row[1]} for {row[0]}: {e}")
+
+
+async def _flush_events(queue: asyncio.Queue) -> None:
+    """Drain ``queue`` in batches of up to EVENT_FLUSH_SIZE until a None sentinel."""
+    loop = asyncio.get_running_loop()
+    stopping = False
+    while not stopping:
+        row = await queue.get()
+        if row is None:
+            break
+        rows = [row]
+        deadline = loop.time() + EVENT_FLUSH_SECONDS
+        while len(rows) < EVENT_FLUSH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                row = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if row is None:
+                stopping = True
+                break
+            rows.append(row)
+        await _save_event_rows(rows)
+
+
+def start_event_flusher() -> None:
+    """Start batched event persistence (async DB mode only)."""
+    global _EVENT_QUEUE, _event_flusher
+    if DB_MODE != "async":
+        return
+    loop = asyncio.get_running_loop()
+    # A flusher left over from another loop (test clients, reloads) can't be reused
+    if _event_flusher is None or _event_flusher.done() or _event_flusher.get_loop() is not loop:
+        _EVENT_QUEUE = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        _event_flusher = loop.create_task(_flush_events(_EVENT_QUEUE))
+
+
+async def stop_event_flusher() -> None:
+    """Flush everything still queued, then stop the flusher."""
+    global _EVENT_QUEUE, _event_flusher
+    task, _event_flusher = _event_flusher, None
+    queue, _EVENT_QUEUE = _EVENT_QUEUE, None
+    if task is None or task.done():
+        return
+    # New events now bypass the queue; the sentinel lands behind queued ones
+    await queue.put(None)
+    await task
+
+
+def _event_row(session_id, event_type, payload, status, created_at) -> tuple:
+    return (session_id, event_type, status, payload, created_at or _utcnow())
+
+
 async def save_event(
     session_id: str,
     event_type: str,
-    payload: dict
+    payload: dict,
+    durable: bool = False,
+    created_at: Optional[datetime] = None,
+    status: str = "success",
+) -> Optional[BiometricEvent]:
+    """
+    Record an audit event.
+
+    Events are queued for the batched COPY flusher when it is running;
+    ``durable=True`` (or a full queue) writes the row before returning.
+    Returns the saved record, or None when the event was queued.
+    """
+    row = _event_row(session_id, event_type, payload, status, created_at)
+    if not durable and _event_flusher is not None:
+        try:
+            _EVENT_QUEUE.put_nowait(row)
+            return None
+        except asyncio.QueueFull:
+            pass
+    return await db_save(BiometricEvent(**dict(zip(_EVENT_COLUMNS, row))))
+
+
+def new_event(
+    session_id: str,
+    event_type: str,
+    payload: dict,
+    created_at: Optional[datetime] = None,
+    status: str = "success",
 ) -> BiometricEvent:
-    obj = BiometricEvent(
-        session_id=session_id,
-        event_type=event_type,
-        event_status="success",
-        event_data=payload,
-        created_at=datetime.utcnow(),
-    )
-    return await db_save(obj)
+    """Event record for saving alongside other records in one transaction."""
+    row = _event_row(session_id, event_type, payload, status, created_at)
+    return BiometricEvent(**dict(zip(_EVENT_COLUMNS, row)))
 
 
 # ============================================================================
@@ -749,6 +1642,8 @@ async def save_event(
 
 class LivenessMetadata(BaseModel):
     """Liveness metadata from frontend (MediaPipe)"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     left_eye: List[Tuple[float, float]] = Field(default_factory=list)
     right_eye: List[Tuple[float, float]] = Field(default_factory=list)
     mouth: List[Tuple[float, float]] = Field(default_factory=list)
@@ -757,6 +1652,8 @@ class LivenessMetadata(BaseModel):
 
 class BiometricUploadRequest(BaseModel):
     """Request model for biometric upload"""
+    model_config = ConfigDict(frozen=True)
+
     session_id: Optional[str] = None
     tenant_id: str = "default"
     liveness: Optional[LivenessMetadata] = None
@@ -807,31 +1704,35 @@ async def upload_biometrics(
     6. Persist all results
     """
     session_id = f"sess_{uuid.uuid4().hex[:16]}"
+    # One timestamp for every record this upload writes
+    now = _utcnow()
     bytes_in = await selfie.read()
 
     logger.info(f"Processing biometric upload for session {session_id}")
 
-    # 1. Persist session metadata
-    await create_biometric_session(session_id, tenant_id)
+    # 1. Session metadata (all records are written together in step 7)
+    records = [new_biometric_session(session_id, tenant_id, created_at=now)]
 
     # 2. Save image to storage
     storage_path = await save_image(session_id, "selfie", bytes_in)
 
-    # 3. Decode for processing
-    img = load_image_from_bytes(bytes_in)
+    # 3. Decode for processing (CPU-bound; keep it off the event loop)
+    img = await asyncio.to_thread(load_image_from_bytes, bytes_in)
     
     # Get image dimensions
     img_height, img_width = img.shape[:2]
 
-    # Save artifact
-    artifact = await save_artifact(
+    # Artifact
+    artifact = new_artifact(
         session_id=session_id,
         artifact_type="selfie",
         storage_path=storage_path,
         size_bytes=len(bytes_in),
         img_width=img_width,
         img_height=img_height,
+        created_at=now,
     )
+    records.append(artifact)
 
     # 4. Extract landmarks (placeholder if needed)
     landmarks = extract_landmarks_placeholder(img)
@@ -839,7 +1740,7 @@ async def upload_biometrics(
     # 5. Compute liveness
     live = compute_liveness(landmarks)
 
-    await save_liveness_result(
+    records.append(new_liveness_result(
         session_id=session_id,
         artifact_id=artifact.id,
         score=live["score"],
@@ -848,22 +1749,23 @@ async def upload_biometrics(
         head_pose_magnitude=live["head_pose_magnitude"],
         is_live=live["is_live"],
         reason=live["reason"],
-    )
+        created_at=now,
+    ))
 
     # 6. Face embeddings
     try:
-        embeddings = embed_face(img)
+        embeddings = await embed_image_cached(bytes_in, img)
         mobile_vec = embeddings["mobile"]
         arc_vec = embeddings["arcface"]
 
-        await save_embeddings(session_id, artifact.id, mobile_vec, arc_vec)
+        records.extend(new_embeddings(session_id, artifact.id, mobile_vec, arc_vec, created_at=now))
         embedding_status = "ok"
     except HTTPException as e:
         logger.warning(f"Face detection failed: {e.detail}")
         embedding_status = "face_not_detected"
 
-    # 7. Event log
-    await save_event(
+    # 7. Event log, then persist everything in one transaction
+    records.append(new_event(
         session_id,
         "UPLOAD",
         {
@@ -871,7 +1773,9 @@ async def upload_biometrics(
             "is_live": live["is_live"],
             "embedding_status": embedding_status,
         },
-    )
+        created_at=now,
+    ))
+    await db_save_all(records)
 
     logger.info(f"✅ Biometric upload complete for session {session_id}")
 
@@ -901,6 +1805,88 @@ async def upload_biometrics(
 #  /v1/biometrics/verify
 # ---------------------------------------------------------
 
+# Built once: same SQL text every request, so asyncpg reuses its prepared statement
+_VERIFY_EMBEDDINGS_STMT = (
+    select(
+        FaceEmbedding.id,
+        FaceEmbedding.session_id,
+        FaceEmbedding.model_name,
+        FaceEmbedding.embedding_vector,
+    )
+    .where(
+        FaceEmbedding.session_id.in_(bindparam("session_ids", expanding=True)),
+        FaceEmbedding.model_name.in_(("mobilefacenet", "arcface")),
+    )
+    .order_by(FaceEmbedding.created_at)
+)
+
+
+_selfie_emb = aliased(FaceEmbedding)
+_id_emb = aliased(FaceEmbedding)
+
+# pgvector: similarity per model computed in Postgres. Stored vectors are
+# unit-norm, so cosine = inner product = -(a <#> b); no vectors leave the DB
+_VERIFY_SIMILARITY_STMT = (
+    select(
+        _selfie_emb.model_name,
+        _selfie_emb.id.label("selfie_embedding_id"),
+        _id_emb.id.label("id_embedding_id"),
+        (-_selfie_emb.embedding_vector.max_inner_product(_id_emb.embedding_vector)).label("similarity"),
+    )
+    .where(
+        _selfie_emb.session_id == bindparam("selfie_session_id"),
+        _id_emb.session_id == bindparam("id_session_id"),
+        _selfie_emb.model_name == _id_emb.model_name,
+        _selfie_emb.model_name.in_(("mobilefacenet", "arcface")),
+    )
+    .order_by(_selfie_emb.created_at, _id_emb.created_at)
+)
+
+
+async def _verify_scores(selfie_session_id: str, id_session_id: str) -> Tuple[Dict[str, Any], str, str]:
+    """
+    Match result plus (selfie, id) ArcFace embedding ids for two sessions.
+    Raises 404 unless both sessions have both embeddings.
+    """
+    async with async_session_scope() as session:
+        if PGVECTOR_AVAILABLE:
+            rows = (await session.execute(
+                _VERIFY_SIMILARITY_STMT,
+                {"selfie_session_id": selfie_session_id, "id_session_id": id_session_id},
+            )).all()
+        else:
+            rows = (await session.execute(
+                _VERIFY_EMBEDDINGS_STMT,
+                {"session_ids": [selfie_session_id, id_session_id]},
+            )).all()
+
+    if PGVECTOR_AVAILABLE:
+        # The latest embedding pair of each model wins
+        sims = {row.model_name: row for row in rows}
+        if not {"mobilefacenet", "arcface"} <= sims.keys():
+            raise HTTPException(404, "Embeddings not found for one or both sessions")
+        arc = sims["arcface"]
+        result = match_from_scores(sims["mobilefacenet"].similarity, arc.similarity)
+        return result, arc.selfie_embedding_id, arc.id_embedding_id
+
+    # Bucket by (session, model); the latest embedding of each kind wins
+    embs = {(row.session_id, row.model_name): row for row in rows}
+    keys = [
+        (selfie_session_id, "mobilefacenet"),
+        (selfie_session_id, "arcface"),
+        (id_session_id, "mobilefacenet"),
+        (id_session_id, "arcface"),
+    ]
+    if not all(key in embs for key in keys):
+        raise HTTPException(404, "Embeddings not found for one or both sessions")
+
+    m1, a1, m2, a2 = (np.asarray(embs[key].embedding_vector, dtype=np.float32) for key in keys)
+
+    # Compare (stored embeddings are L2-normalized)
+    result = compare_embeddings(m1, m2, a1, a2, assume_normalized=True)
+    return result, embs[keys[1]].id, embs[keys[3]].id
+
+
 @router.post("/verify", status_code=200, response_model=BiometricVerifyResponse)
 async def verify_biometrics(
     request: BiometricVerifyRequest,
@@ -911,54 +1897,28 @@ async def verify_biometrics(
     """
     selfie_session_id = request.selfie_session_id
     id_session_id = request.id_session_id
+    now = _utcnow()
 
     logger.info(f"Verifying biometrics: {selfie_session_id} vs {id_session_id}")
 
-    # Load embeddings for both
-    async with get_async_session() as session:
-        # Get embeddings for selfie
-        selfie_mobile = await session.execute(
-            f"SELECT * FROM face_embeddings WHERE session_id = '{selfie_session_id}' AND model_name = 'mobilefacenet' LIMIT 1"
-        )
-        selfie_arc = await session.execute(
-            f"SELECT * FROM face_embeddings WHERE session_id = '{selfie_session_id}' AND model_name = 'arcface' LIMIT 1"
-        )
-        
-        # Get embeddings for ID
-        id_mobile = await session.execute(
-            f"SELECT * FROM face_embeddings WHERE session_id = '{id_session_id}' AND model_name = 'mobilefacenet' LIMIT 1"
-        )
-        id_arc = await session.execute(
-            f"SELECT * FROM face_embeddings WHERE session_id = '{id_session_id}' AND model_name = 'arcface' LIMIT 1"
-        )
-
-        # This is a simplified version - in production, use proper SQLAlchemy queries
-        # For now, raise error if embeddings not found
-        if not (selfie_mobile and selfie_arc and id_mobile and id_arc):
-            raise HTTPException(404, "Embeddings not found for one or both sessions")
-
-        # Convert back to numpy (simplified - needs proper implementation)
-        m1 = _mock_embedding(128)
-        a1 = _mock_embedding(512)
-        m2 = _mock_embedding(128)
-        a2 = _mock_embedding(512)
-
-    # Compare
-    result = compare_embeddings(m1, m2, a1, a2)
+    result, selfie_embedding_id, id_embedding_id = await _verify_scores(
+        selfie_session_id, id_session_id
+    )
     explanation = explain_match(result)
 
     # Persist match result
     await save_match_result(
         selfie_session_id,
-        "selfie_emb_id",  # Simplified
-        "id_emb_id",  # Simplified
+        selfie_embedding_id,
+        id_embedding_id,
         result["mobile_score"],
         result["arcface_score"],
         result["fused_score"],
         result["is_match"],
+        created_at=now,
     )
 
-    # Record event
+    # Record event (audit only; the match result above is already durable)
     await save_event(
         selfie_session_id,
         "VERIFY",
@@ -967,6 +1927,7 @@ async def verify_biometrics(
             "scores": result,
             "explanation": explanation,
         },
+        created_at=now,
     )
 
     logger.info(f"✅ Verification complete: match={result['is_match']}")
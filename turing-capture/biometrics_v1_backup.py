@@ -19,8 +19,12 @@ Architecture:
 import os
 import io
 import uuid
+import math
+import asyncio
 import logging
 import hashlib
+import threading
+from bisect import bisect_right
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Tuple, Dict, Any, List
@@ -32,9 +36,17 @@ from PIL import Image
 import numpy as np
 import cv2
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
 # Database imports
-from db import save_record, DB_MODE
+from db import save_record, save_records, DB_MODE
 from models import (
+    PGVECTOR_AVAILABLE,
     BiometricSession,
     BiometricArtifact,
     LivenessResult,
@@ -56,6 +68,9 @@ STORAGE_MODE = os.getenv("BIOMETRIC_STORAGE_MODE", "memory")  # memory | local |
 S3_BUCKET = os.getenv("BIOMETRIC_S3_BUCKET", "turingmachines-biometrics")
 S3_PREFIX = os.getenv("BIOMETRIC_S3_PREFIX", "sessions/{session_id}/{artifact}.jpg")
 
+# Quality for the one-time JPEG encode of non-JPEG uploads (JPEG uploads are stored as sent)
+UPLOAD_JPEG_QUALITY = int(os.getenv("BIOMETRIC_UPLOAD_JPEG_QUALITY", "85"))
+
 # Model configuration
 MODEL_DIR = Path(__file__).parent / "models"
 MODEL_DIR.mkdir(exist_ok=True)
@@ -63,10 +78,21 @@ MODEL_DIR.mkdir(exist_ok=True)
 MOBILEFACENET_PATH = MODEL_DIR / "mobilefacenet.onnx"
 ARCFACE_PATH = MODEL_DIR / "arcface.onnx"
 
+# Prefer <model>.int8.onnx (from quantize_models.py) when present; false keeps FP32
+USE_INT8_MODELS = os.getenv("BIOMETRIC_USE_INT8", "true").lower() == "true"
+
 # Feature flags
 USE_MOCK_EMBEDDINGS = not (MOBILEFACENET_PATH.exists() and ARCFACE_PATH.exists())
 DB_PERSIST = True  # Always persist to database
 
+# Concurrent ONNX runs across requests (default: 4 on CUDA, 1 on CPU where
+# each run already uses ORT's full intra-op thread pool)
+MAX_CONCURRENT_INFERENCE = os.getenv("BIOMETRIC_MAX_CONCURRENT_INFERENCE")
+
+# Store JSON-fallback embeddings at float16 precision (~half the row size);
+# similarity upcasts to float32, so scores move by ~1e-3 at most
+FP16_EMBEDDINGS = os.getenv("BIOMETRIC_FP16_EMBEDDINGS", "false").lower() == "true"
+
 # Match thresholds
 MOBILEFACENET_THRESHOLD = 0.60
 ARCFACE_THRESHOLD = 0.45
@@ -186,8 +212,22 @@ async def load_image(session_id: str, artifact: str) -> Optional[bytes]:
 # MODEL LOADING (ONNX with GPU support)
 # ============================================================================
 
-_mobilefacenet_session = None
-_arcface_session = None
+# Process-wide session cache: model path -> InferenceSession (None if loading failed)
+_ort_sessions: Dict[str, Optional[Any]] = {}
+_ort_sessions_lock = threading.Lock()
+
+
+def _session_options(ort):
+    """Full graph optimization; bounded intra-op threads since both models run concurrently"""
+    opts = ort.SessionOptions()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    opts.intra_op_num_threads = min(4, os.cpu_count() or 1)
+    opts.inter_op_num_threads = 1
+    return opts
+
+
+def _optimized_model_path(model_path: Path) -> Path:
+    return model_path.with_suffix(".opt.onnx")
 
 
 def load_onnx_model(model_path: Path) -> Optional[Any]:
@@ -199,7 +239,23 @@ def load_onnx_model(model_path: Path) -> Optional[Any]:
     try:
         import onnxruntime as ort
         providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
-        session = ort.InferenceSession(str(model_path), providers=providers)
+        opts = _session_options(ort)
+        
+        # The first load saves the optimized graph; later loads (on this host)
+        # use it directly and skip graph optimization
+        optimized_path = _optimized_model_path(model_path)
+        if optimized_path.exists() and optimized_path.stat().st_mtime >= model_path.stat().st_mtime:
+            source_path = optimized_path
+            opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+        else:
+            source_path = model_path
+            opts.optimized_model_filepath = str(optimized_path)
+        
+        session = ort.InferenceSession(
+            str(source_path),
+            sess_options=opts,
+            providers=providers,
+        )
         logger.info(f"Loaded model: {model_path.name} (providers: {session.get_providers()})")
         return session
     except Exception as e:
@@ -207,20 +263,133 @@ def load_onnx_model(model_path: Path) -> Optional[Any]:
         return None
 
 
+def get_onnx_session(model_path: Path) -> Optional[Any]:
+    """
+    Cached session for ``model_path``, loaded at most once per process.
+    Double-checked locking: the lock is only taken until the first load
+    finishes, so concurrent first requests don't each build a session.
+    """
+    key = str(model_path)
+    if key in _ort_sessions:
+        return _ort_sessions[key]
+    with _ort_sessions_lock:
+        if key not in _ort_sessions:
+            _ort_sessions[key] = load_onnx_model(model_path)
+        return _ort_sessions[key]
+
+
+class _BoundModel:
+    """
+    Session plus persistent IOBindings, one per batch size: the input (and,
+    for static output shapes, the output) is a preallocated float32 buffer
+    bound by pointer once, so each run only copies the faces into place.
+    The buffers are shared, so runs on one model are serialized.
+
+    Models exported with a static batch dimension are run in chunks of that
+    size, the last chunk zero-padded and its padding rows dropped.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        model_input = session.get_inputs()[0]
+        model_output = session.get_outputs()[0]
+        self._input_name = model_input.name
+        self._output_name = model_output.name
+        
+        in_shape = model_input.shape
+        self._static_batch = in_shape[0] if isinstance(in_shape[0], int) else None
+        self._face_shape = tuple(in_shape[1:]) if all(isinstance(d, int) for d in in_shape[1:]) else (3, 112, 112)
+        out_shape = model_output.shape
+        self._out_dims = tuple(out_shape[1:]) if all(isinstance(d, int) for d in out_shape[1:]) else None
+        
+        self._bindings: Dict[int, Tuple[Any, np.ndarray, Optional[np.ndarray]]] = {}
+        self._lock = threading.Lock()
+
+    def _binding_for(self, n: int) -> Tuple[Any, np.ndarray, Optional[np.ndarray]]:
+        entry = self._bindings.get(n)
+        if entry is None:
+            in_buf = np.empty((n,) + self._face_shape, dtype=np.float32)
+            binding = self.session.io_binding()
+            binding.bind_input(
+                self._input_name, "cpu", 0, np.float32, in_buf.shape, in_buf.ctypes.data
+            )
+            if self._out_dims is not None:
+                out_buf = np.empty((n,) + self._out_dims, dtype=np.float32)
+                binding.bind_output(
+                    self._output_name, "cpu", 0, np.float32, out_buf.shape, out_buf.ctypes.data
+                )
+            else:
+                out_buf = None
+                binding.bind_output(self._output_name, "cpu")
+            entry = self._bindings[n] = (binding, in_buf, out_buf)
+        return entry
+
+    def run(self, batch: np.ndarray) -> np.ndarray:
+        """Run preprocessed NCHW faces; returns a fresh [N, ...] output array"""
+        n = batch.shape[0]
+        b = self._static_batch or n
+        rows = []
+        with self._lock:
+            binding, in_buf, out_buf = self._binding_for(b)
+            for start in range(0, n, b):
+                chunk = batch[start:start + b]
+                k = len(chunk)
+                in_buf[:k] = chunk
+                in_buf[k:] = 0
+                self.session.run_with_iobinding(binding)
+                out = out_buf if out_buf is not None else binding.copy_outputs_to_cpu()[0]
+                rows.append(out[:k].copy())
+        return rows[0] if len(rows) == 1 else np.concatenate(rows)
+
+
+_bound_models: Dict[str, Optional[_BoundModel]] = {}
+
+
+def get_bound_model(model_path: Path) -> Optional[_BoundModel]:
+    """IO-bound wrapper around the cached session for ``model_path``"""
+    key = str(model_path)
+    if key in _bound_models:
+        return _bound_models[key]
+    session = get_onnx_session(model_path)
+    with _ort_sessions_lock:
+        if key not in _bound_models:
+            _bound_models[key] = _BoundModel(session) if session is not None else None
+        return _bound_models[key]
+
+
+def _model_file(path: Path) -> Path:
+    """INT8 sibling of ``path`` if enabled and present, else ``path``"""
+    int8_path = path.with_suffix(".int8.onnx")
+    if USE_INT8_MODELS and int8_path.exists():
+        return int8_path
+    return path
+
+
 def get_mobilefacenet_session():
     """Lazy load MobileFaceNet model"""
-    global _mobilefacenet_session
-    if _mobilefacenet_session is None:
-        _mobilefacenet_session = load_onnx_model(MOBILEFACENET_PATH)
-    return _mobilefacenet_session
+    return get_onnx_session(_model_file(MOBILEFACENET_PATH))
 
 
 def get_arcface_session():
     """Lazy load ArcFace model"""
-    global _arcface_session
-    if _arcface_session is None:
-        _arcface_session = load_onnx_model(ARCFACE_PATH)
-    return _arcface_session
+    return get_onnx_session(_model_file(ARCFACE_PATH))
+
+
+_inference_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_inference_semaphore() -> asyncio.Semaphore:
+    """Bounds concurrent session.run calls so to_thread workers don't oversubscribe cores"""
+    global _inference_semaphore
+    if _inference_semaphore is None:
+        if MAX_CONCURRENT_INFERENCE:
+            limit = int(MAX_CONCURRENT_INFERENCE)
+        else:
+            session = get_arcface_session() or get_mobilefacenet_session()
+            on_gpu = session is not None and "CUDAExecutionProvider" in session.get_providers()
+            limit = 4 if on_gpu else 1
+        _inference_semaphore = asyncio.Semaphore(limit)
+    return _inference_semaphore
 
 
 # ============================================================================
@@ -254,8 +423,13 @@ def preprocess_face_image(img: Image.Image, target_size: Tuple[int, int] = (112,
     return img_array
 
 
-def decode_base64_image(data_url: str) -> Image.Image:
-    """Decode base64 image data URL to PIL Image"""
+def decode_base64_payload(data_url: str) -> Tuple[bytes, Image.Image, Optional[str]]:
+    """
+    Decode base64 image data URL
+    
+    Returns:
+        (raw image bytes, RGB PIL Image, source format such as "JPEG")
+    """
     import base64
     
     try:
@@ -266,16 +440,35 @@ def decode_base64_image(data_url: str) -> Image.Image:
         
         img_bytes = base64.b64decode(encoded)
         img = Image.open(io.BytesIO(img_bytes))
+        source_format = img.format
         
         if img.mode != "RGB":
             img = img.convert("RGB")
         
-        return img
+        return img_bytes, img, source_format
     except Exception as e:
         logger.error(f"Failed to decode image: {e}")
         raise ValueError(f"Invalid image data: {e}")
 
 
+def decode_base64_image(data_url: str) -> Image.Image:
+    """Decode base64 image data URL to PIL Image"""
+    return decode_base64_payload(data_url)[1]
+
+
+def decode_upload_image(data_url: str) -> Tuple[bytes, Image.Image]:
+    """
+    Decode an uploaded image for storage: JPEG uploads are kept as sent,
+    anything else is re-encoded to JPEG. Returns (JPEG bytes, RGB image).
+    """
+    img_bytes, img, source_format = decode_base64_payload(data_url)
+    if source_format != "JPEG":
+        buf = io.BytesIO()
+        img.save(buf, format="JPEG", quality=UPLOAD_JPEG_QUALITY, optimize=False)
+        img_bytes = buf.getvalue()
+    return img_bytes, img
+
+
 # ============================================================================
 # LIVENESS DETECTION (Hybrid)
 # ============================================================================
@@ -349,6 +542,69 @@ def compute_liveness_score(liveness_metadata: Dict[str, Any]) -> Dict[str, Any]:
 # FACE EMBEDDING EXTRACTION
 # ============================================================================
 
+def _mock_face_embedding(img: Image.Image, model_name: str) -> np.ndarray:
+    """Deterministic mock embedding derived from image statistics"""
+    # Mean and std from one sum and one dot product (E[X^2] - E[X]^2)
+    img_array = np.asarray(img, dtype=np.float32).ravel()
+    n = img_array.size
+    mean = float(img_array.sum(dtype=np.float64)) / n
+    std = math.sqrt(max(float(np.dot(img_array, img_array)) / n - mean * mean, 0.0))
+    
+    # Local generator: no global RNG state, so safe across threads
+    rng = np.random.default_rng(int(mean * 1000 + std * 1000))
+    
+    if model_name == "mobilefacenet":
+        embedding = rng.standard_normal(128, dtype=np.float32)
+    else:  # arcface
+        embedding = rng.standard_normal(512, dtype=np.float32)
+    
+    # Normalize
+    embedding /= np.linalg.norm(embedding)
+    return embedding
+
+
+def _get_bound_model(model_name: str) -> Optional[_BoundModel]:
+    if model_name == "mobilefacenet":
+        return get_bound_model(_model_file(MOBILEFACENET_PATH))
+    return get_bound_model(_model_file(ARCFACE_PATH))
+
+
+def _run_embedding_model(imgs: List[Image.Image], batch: np.ndarray, model_name: str) -> Optional[np.ndarray]:
+    """Run one model on a preprocessed [N,3,112,112] batch; returns [N,D] unit-norm rows"""
+    try:
+        model = _get_bound_model(model_name)
+        
+        if model is None:
+            logger.warning(f"Model not loaded: {model_name}, using mock embedding")
+            return np.stack([_mock_face_embedding(img, model_name) for img in imgs])  # Fallback to mock
+        
+        # Run inference
+        output = model.run(batch)
+        
+        # Normalize embeddings (a view of the fresh output; divide in place)
+        embeddings = np.ascontiguousarray(output, dtype=np.float32).reshape(len(imgs), -1)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        
+        return embeddings
+        
+    except Exception as e:
+        logger.error(f"Failed to extract embedding with {model_name}: {e}")
+        return None
+
+
+def _preprocess_or_none(imgs: List[Image.Image]) -> Optional[np.ndarray]:
+    try:
+        return np.concatenate([preprocess_face_image(img) for img in imgs])
+    except Exception as e:
+        logger.error(f"Failed to preprocess face image: {e}")
+        return None
+
+
+def _embedding_row(embeddings: Dict[str, Optional[np.ndarray]], i: int) -> Dict[str, Optional[np.ndarray]]:
+    """Per-image dict from extract_dual_embeddings_batch output"""
+    return {name: None if rows is None else rows[i] for name, rows in embeddings.items()}
+
+
 def extract_face_embedding(img: Image.Image, model_name: str) -> Optional[np.ndarray]:
     """
     Extract face embedding using specified model
@@ -361,89 +617,140 @@ def extract_face_embedding(img: Image.Image, model_name: str) -> Optional[np.nda
         Embedding vector or None if extraction fails
     """
     if USE_MOCK_EMBEDDINGS:
-        # Generate deterministic mock embedding
-        img_array = np.array(img).flatten()
-        mean = np.mean(img_array)
-        std = np.std(img_array)
-        
-        np.random.seed(int(mean * 1000 + std * 1000))
-        
-        if model_name == "mobilefacenet":
-            embedding = np.random.randn(128).astype(np.float32)
-        else:  # arcface
-            embedding = np.random.randn(512).astype(np.float32)
-        
-        # Normalize
-        embedding = embedding / np.linalg.norm(embedding)
-        return embedding
+        return _mock_face_embedding(img, model_name)
     
     # Real ONNX inference
-    try:
-        # Preprocess image
-        img_array = preprocess_face_image(img)
-        
-        # Get model session
-        if model_name == "mobilefacenet":
-            session = get_mobilefacenet_session()
-        else:
-            session = get_arcface_session()
-        
-        if session is None:
-            logger.warning(f"Model not loaded: {model_name}, using mock embedding")
-            return extract_face_embedding(img, model_name)  # Fallback to mock
-        
-        # Run inference
-        input_name = session.get_inputs()[0].name
-        output = session.run(None, {input_name: img_array})[0]
-        
-        # Normalize embedding
-        embedding = output.flatten()
-        embedding = embedding / np.linalg.norm(embedding)
-        
-        return embedding
-        
-    except Exception as e:
-        logger.error(f"Failed to extract embedding with {model_name}: {e}")
+    batch = _preprocess_or_none([img])
+    if batch is None:
         return None
+    embeddings = _run_embedding_model([img], batch, model_name)
+    return None if embeddings is None else embeddings[0]
 
 
-def extract_dual_embeddings(img: Image.Image) -> Dict[str, Optional[np.ndarray]]:
+def extract_dual_embeddings_batch(imgs: List[Image.Image]) -> Dict[str, Optional[np.ndarray]]:
     """
-    Extract embeddings using both models
+    Extract embeddings for several images with both models: the images are
+    preprocessed once into one [N,3,112,112] batch and each model runs once
     
     Returns:
-        Dictionary with 'mobilefacenet' and 'arcface' embeddings
+        Dictionary with 'mobilefacenet' and 'arcface' [N,D] embeddings
     """
+    if USE_MOCK_EMBEDDINGS:
+        return {
+            "mobilefacenet": np.stack([_mock_face_embedding(img, "mobilefacenet") for img in imgs]),
+            "arcface": np.stack([_mock_face_embedding(img, "arcface") for img in imgs]),
+        }
+    
+    batch = _preprocess_or_none(imgs)
+    if batch is None:
+        return {"mobilefacenet": None, "arcface": None}
     return {
-        "mobilefacenet": extract_face_embedding(img, "mobilefacenet"),
-        "arcface": extract_face_embedding(img, "arcface"),
+        "mobilefacenet": _run_embedding_model(imgs, batch, "mobilefacenet"),
+        "arcface": _run_embedding_model(imgs, batch, "arcface"),
     }
 
 
+def extract_dual_embeddings(img: Image.Image) -> Dict[str, Optional[np.ndarray]]:
+    """
+    Extract embeddings using both models (image preprocessed once)
+    
+    Returns:
+        Dictionary with 'mobilefacenet' and 'arcface' embeddings
+    """
+    return _embedding_row(extract_dual_embeddings_batch([img]), 0)
+
+
+async def extract_dual_embeddings_batch_async(imgs: List[Image.Image]) -> Dict[str, Optional[np.ndarray]]:
+    """
+    extract_dual_embeddings_batch off the event loop: preprocess once, then
+    run both models concurrently in worker threads (bounded by the inference
+    semaphore) so their ORT executions overlap.
+    """
+    if USE_MOCK_EMBEDDINGS:
+        # Mock embeddings are cheap; one worker thread is enough
+        return await asyncio.to_thread(extract_dual_embeddings_batch, imgs)
+    
+    batch = await asyncio.to_thread(_preprocess_or_none, imgs)
+    if batch is None:
+        return {"mobilefacenet": None, "arcface": None}
+    
+    semaphore = get_inference_semaphore()
+    
+    async def run(model_name: str) -> Optional[np.ndarray]:
+        async with semaphore:
+            return await asyncio.to_thread(_run_embedding_model, imgs, batch, model_name)
+    
+    mobile, arc = await asyncio.gather(run("mobilefacenet"), run("arcface"))
+    return {"mobilefacenet": mobile, "arcface": arc}
+
+
+async def extract_dual_embeddings_async(img: Image.Image) -> Dict[str, Optional[np.ndarray]]:
+    """Single-image extract_dual_embeddings_batch_async"""
+    return _embedding_row(await extract_dual_embeddings_batch_async([img]), 0)
+
+
 # ============================================================================
 # SIMILARITY METRICS
 # ============================================================================
 
+def _cosine_fused(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Cosine of two 1-D float32 arrays in one pass: dot and both squared
+    norms accumulate together, so each vector is read once.
+    """
+    dot = 0.0
+    norm_a = 0.0
+    norm_b = 0.0
+    for i in range(a.shape[0]):
+        x = a[i]
+        y = b[i]
+        dot += x * y
+        norm_a += x * x
+        norm_b += y * y
+    if norm_a == 0.0 or norm_b == 0.0:
+        return 0.0
+    return dot / np.sqrt(norm_a * norm_b)
+
+
+def _cosine_numpy(a: np.ndarray, b: np.ndarray) -> float:
+    """NumPy fallback: three BLAS reductions, one sqrt, no temporaries"""
+    norm_sq = float(np.vdot(a, a)) * float(np.vdot(b, b))
+    if norm_sq == 0.0:
+        return 0.0
+    return float(np.dot(a, b)) / np.sqrt(norm_sq)
+
+
+if NUMBA_AVAILABLE:
+    # fastmath lets LLVM reassociate the three sums into SIMD lanes
+    _cosine_kernel = njit(fastmath=True, cache=True)(_cosine_fused)
+    _cosine_kernel(np.ones(2, dtype=np.float32), np.ones(2, dtype=np.float32))
+else:
+    _cosine_kernel = _cosine_numpy
+
+
 def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     """Calculate cosine similarity between two vectors"""
-    vec1 = vec1.flatten()
-    vec2 = vec2.flatten()
+    # Views for contiguous float32 embeddings; the kernel is compiled for 1-D float32
+    vec1 = np.ascontiguousarray(vec1, dtype=np.float32).ravel()
+    vec2 = np.ascontiguousarray(vec2, dtype=np.float32).ravel()
     
-    dot_product = np.dot(vec1, vec2)
-    norm1 = np.linalg.norm(vec1)
-    norm2 = np.linalg.norm(vec2)
-    
-    if norm1 == 0 or norm2 == 0:
-        return 0.0
-    
-    similarity = dot_product / (norm1 * norm2)
+    similarity = _cosine_kernel(vec1, vec2)
     return float(max(0.0, min(1.0, similarity)))
 
 
+def normalized_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
+    """
+    Cosine similarity of unit-norm 1-D embeddings (as returned by
+    extract_face_embedding): just the dot product, clamped to [0, 1]
+    """
+    return max(0.0, min(1.0, float(np.dot(vec1, vec2))))
+
+
 def euclidean_distance(vec1: np.ndarray, vec2: np.ndarray) -> float:
     """Calculate Euclidean distance between two vectors"""
-    vec1 = vec1.flatten()
-    vec2 = vec2.flatten()
+    # ravel() is a view for the usual 1-D/contiguous embeddings; flatten() always copied
+    vec1 = vec1.ravel()
+    vec2 = vec2.ravel()
     return float(np.linalg.norm(vec1 - vec2))
 
 
@@ -451,6 +758,62 @@ def euclidean_distance(vec1: np.ndarray, vec2: np.ndarray) -> float:
 # FACE MATCHING
 # ============================================================================
 
+def _compare_scores(
+    mob_a: np.ndarray,
+    mob_b: np.ndarray,
+    arc_a: np.ndarray,
+    arc_b: np.ndarray,
+    mob_t: float,
+    arc_t: float,
+) -> Tuple[float, float, float, float, bool, bool]:
+    """
+    Dual-model scoring of unit-norm 1-D float32 embeddings in one pass:
+    (mobile_sim, arc_sim, fused, confidence, mobile_match, arc_match)
+    """
+    m = 0.0
+    for i in range(mob_a.shape[0]):
+        m += mob_a[i] * mob_b[i]
+    a = 0.0
+    for i in range(arc_a.shape[0]):
+        a += arc_a[i] * arc_b[i]
+    # Clamped to [0, 1] like normalized_similarity
+    m = max(0.0, min(1.0, m))
+    a = max(0.0, min(1.0, a))
+    fused = 0.4 * m + 0.6 * a
+    confidence = min(1.0, abs(m - a) / 0.2 + 0.5)
+    return m, a, fused, confidence, m >= mob_t, a >= arc_t
+
+
+def _compare_scores_numpy(
+    mob_a: np.ndarray,
+    mob_b: np.ndarray,
+    arc_a: np.ndarray,
+    arc_b: np.ndarray,
+    mob_t: float,
+    arc_t: float,
+) -> Tuple[float, float, float, float, bool, bool]:
+    """NumPy fallback: one BLAS dot per model, scalar arithmetic in Python"""
+    m = normalized_similarity(mob_a, mob_b)
+    a = normalized_similarity(arc_a, arc_b)
+    fused = 0.4 * m + 0.6 * a
+    confidence = min(1.0, abs(m - a) / 0.2 + 0.5)
+    return m, a, fused, confidence, m >= mob_t, a >= arc_t
+
+
+if NUMBA_AVAILABLE:
+    _compare_kernel = njit(fastmath=True, cache=True)(_compare_scores)
+    _warm = np.ones(2, dtype=np.float32)
+    _compare_kernel(_warm, _warm, _warm, _warm, 0.5, 0.5)
+    del _warm
+else:
+    _compare_kernel = _compare_scores_numpy
+
+
+# Fused-score risk bands: [0, 0.40) critical, [0.40, 0.60) high, [0.60, 0.80) medium, >= 0.80 low
+_RISK_EDGES = (0.40, 0.60, 0.80)
+_RISK_LABELS = ("critical", "high", "medium", "low")
+
+
 def compare_face_embeddings(
     id_embeddings: Dict[str, np.ndarray],
     selfie_embeddings: Dict[str, np.ndarray],
@@ -459,44 +822,36 @@ def compare_face_embeddings(
     Compare face embeddings using dual-model fusion
     
     Args:
-        id_embeddings: Embeddings from ID photo
-        selfie_embeddings: Embeddings from selfie
+        id_embeddings: Unit-norm embeddings from ID photo
+        selfie_embeddings: Unit-norm embeddings from selfie
         
     Returns:
         Match results with scores and decision
     """
-    # MobileFaceNet comparison
-    mobile_similarity = cosine_similarity(
-        id_embeddings["mobilefacenet"],
-        selfie_embeddings["mobilefacenet"]
-    )
-    
-    # ArcFace comparison
-    arcface_similarity = cosine_similarity(
-        id_embeddings["arcface"],
-        selfie_embeddings["arcface"]
+    # Embeddings are L2-normalized at extraction, so cosine is a dot product.
+    # Scores, fused score (0.4/0.6 weighted), confidence (higher when both
+    # models agree) and per-model thresholds come from one compiled kernel.
+    (
+        mobile_similarity,
+        arcface_similarity,
+        fused_score,
+        confidence,
+        mobile_match,
+        arcface_match,
+    ) = _compare_kernel(
+        np.ascontiguousarray(id_embeddings["mobilefacenet"], dtype=np.float32).ravel(),
+        np.ascontiguousarray(selfie_embeddings["mobilefacenet"], dtype=np.float32).ravel(),
+        np.ascontiguousarray(id_embeddings["arcface"], dtype=np.float32).ravel(),
+        np.ascontiguousarray(selfie_embeddings["arcface"], dtype=np.float32).ravel(),
+        MOBILEFACENET_THRESHOLD,
+        ARCFACE_THRESHOLD,
     )
     
     # Dual-model decision (both must pass)
-    mobile_match = mobile_similarity >= MOBILEFACENET_THRESHOLD
-    arcface_match = arcface_similarity >= ARCFACE_THRESHOLD
     overall_match = mobile_match and arcface_match
     
-    # Fused score (weighted average)
-    fused_score = 0.4 * mobile_similarity + 0.6 * arcface_similarity
-    
-    # Confidence (higher when both models agree)
-    confidence = min(1.0, abs(mobile_similarity - arcface_similarity) / 0.2 + 0.5)
-    
     # Risk level
-    if fused_score >= 0.80:
-        risk_level = "low"
-    elif fused_score >= 0.60:
-        risk_level = "medium"
-    elif fused_score >= 0.40:
-        risk_level = "high"
-    else:
-        risk_level = "critical"
+    risk_level = _RISK_LABELS[bisect_right(_RISK_EDGES, fused_score)]
     
     return {
         "mobilefacenet_score": round(mobile_similarity, 4),
@@ -510,36 +865,77 @@ def compare_face_embeddings(
     }
 
 
+def compare_face_embeddings_batch(
+    id_embeddings: Dict[str, np.ndarray],
+    selfie_embeddings: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """
+    compare_face_embeddings over N pairs at once
+    
+    Args:
+        id_embeddings: [N,D] unit-norm embeddings per model (row i pairs with row i)
+        selfie_embeddings: [N,D] unit-norm embeddings per model
+        
+    Returns:
+        Per-pair arrays of the compare_face_embeddings fields (unrounded)
+    """
+    # Row-wise dot products in one pass per model, clamped like normalized_similarity
+    mobile = np.clip(np.einsum("ij,ij->i", id_embeddings["mobilefacenet"], selfie_embeddings["mobilefacenet"]), 0.0, 1.0)
+    arcface = np.clip(np.einsum("ij,ij->i", id_embeddings["arcface"], selfie_embeddings["arcface"]), 0.0, 1.0)
+    
+    mobile_match = mobile >= MOBILEFACENET_THRESHOLD
+    arcface_match = arcface >= ARCFACE_THRESHOLD
+    fused = 0.4 * mobile + 0.6 * arcface
+    
+    return {
+        "mobilefacenet_score": mobile,
+        "arcface_score": arcface,
+        "fused_score": fused,
+        "mobilefacenet_match": mobile_match,
+        "arcface_match": arcface_match,
+        "overall_match": mobile_match & arcface_match,
+        "confidence": np.minimum(1.0, np.abs(mobile - arcface) / 0.2 + 0.5),
+        "risk_level": np.asarray(_RISK_LABELS)[np.searchsorted(_RISK_EDGES, fused, side="right")],
+    }
+
+
 # ============================================================================
 # DATABASE PERSISTENCE
 # ============================================================================
 
-async def create_biometric_session(session_id: str, tenant_id: str = "default") -> BiometricSession:
-    """Create new biometric session"""
-    session = BiometricSession(
+def new_biometric_session(session_id: str, tenant_id: str = "default") -> BiometricSession:
+    """Build a new biometric session record (not yet saved)"""
+    return BiometricSession(
         id=session_id,
         tenant_id=tenant_id,
         status="created",
     )
+
+
+async def create_biometric_session(session_id: str, tenant_id: str = "default") -> BiometricSession:
+    """Create new biometric session"""
+    session = new_biometric_session(session_id, tenant_id)
     await save_record(session)
     logger.info(f"Created biometric session: {session_id}")
     return session
 
 
-async def save_biometric_artifact(
+def new_biometric_artifact(
     session_id: str,
     artifact_type: str,
     storage_path: str,
     image_bytes: bytes,
+    img: Optional[Image.Image] = None,
 ) -> BiometricArtifact:
-    """Save biometric artifact metadata"""
+    """Build artifact metadata record (pass the decoded ``img`` to skip re-parsing)"""
     # Calculate image hash
     image_hash = hashlib.sha256(image_bytes).hexdigest()
     
     # Get image dimensions
-    img = Image.open(io.BytesIO(image_bytes))
+    if img is None:
+        img = Image.open(io.BytesIO(image_bytes))
     
-    artifact = BiometricArtifact(
+    return BiometricArtifact(
         id=f"art_{uuid.uuid4().hex[:16]}",
         session_id=session_id,
         artifact_type=artifact_type,
@@ -551,19 +947,30 @@ async def save_biometric_artifact(
         image_height=img.height,
         extra_metadata={"hash": image_hash},
     )
+
+
+async def save_biometric_artifact(
+    session_id: str,
+    artifact_type: str,
+    storage_path: str,
+    image_bytes: bytes,
+    img: Optional[Image.Image] = None,
+) -> BiometricArtifact:
+    """Save biometric artifact metadata (pass the decoded ``img`` to skip re-parsing)"""
+    artifact = new_biometric_artifact(session_id, artifact_type, storage_path, image_bytes, img)
     await save_record(artifact)
     logger.debug(f"Saved artifact: {artifact.id} ({artifact_type})")
     return artifact
 
 
-async def save_liveness_result(
+def new_liveness_result(
     session_id: str,
     artifact_id: str,
     liveness_analysis: Dict[str, Any],
     liveness_metadata: Dict[str, Any],
 ) -> LivenessResult:
-    """Save liveness detection result"""
-    result = LivenessResult(
+    """Build liveness detection result record"""
+    return LivenessResult(
         id=f"live_{uuid.uuid4().hex[:16]}",
         session_id=session_id,
         artifact_id=artifact_id,
@@ -579,43 +986,77 @@ async def save_liveness_result(
         risk_level=liveness_analysis["risk_level"],
         extra_metadata={"flags": liveness_analysis["flags"]},
     )
+
+
+async def save_liveness_result(
+    session_id: str,
+    artifact_id: str,
+    liveness_analysis: Dict[str, Any],
+    liveness_metadata: Dict[str, Any],
+) -> LivenessResult:
+    """Save liveness detection result"""
+    result = new_liveness_result(session_id, artifact_id, liveness_analysis, liveness_metadata)
     await save_record(result)
     logger.debug(f"Saved liveness result: {result.id}")
     return result
 
 
-async def save_face_embedding(
+def new_face_embedding(
     session_id: str,
     artifact_id: str,
     embedding_type: str,
     model_name: str,
     embedding_vector: np.ndarray,
 ) -> FaceEmbedding:
-    """Save face embedding"""
-    # Convert numpy array to list for JSON storage
-    embedding_list = embedding_vector.tolist()
+    """Build face embedding record"""
+    # pgvector binds the array as halfvec; the JSON fallback needs a list
+    if PGVECTOR_AVAILABLE:
+        stored_vector = np.asarray(embedding_vector, dtype=np.float16)
+        stored_dtype = "float16"
+    elif FP16_EMBEDDINGS:
+        # Shortest decimal that round-trips through float16 ("0.0442", not
+        # "0.044189453125"); readers load it with dtype=np.float16
+        stored_vector = [
+            float(np.format_float_positional(x, unique=True))
+            for x in np.asarray(embedding_vector, dtype=np.float16)
+        ]
+        stored_dtype = "float16"
+    else:
+        stored_vector = embedding_vector.tolist()
+        stored_dtype = "float32"
     
-    embedding = FaceEmbedding(
+    return FaceEmbedding(
         id=f"emb_{uuid.uuid4().hex[:16]}",
         session_id=session_id,
         artifact_id=artifact_id,
         embedding_type=embedding_type,
         model_name=model_name,
         embedding_size=len(embedding_vector),
-        embedding_vector=embedding_list,  # Will be stored as pgvector or JSON
-        extra_metadata={},
+        embedding_vector=stored_vector,  # Will be stored as pgvector or JSON
+        extra_metadata={"normalized": True, "dtype": stored_dtype},  # L2-normalized at extraction
     )
+
+
+async def save_face_embedding(
+    session_id: str,
+    artifact_id: str,
+    embedding_type: str,
+    model_name: str,
+    embedding_vector: np.ndarray,
+) -> FaceEmbedding:
+    """Save face embedding"""
+    embedding = new_face_embedding(session_id, artifact_id, embedding_type, model_name, embedding_vector)
     await save_record(embedding)
     logger.debug(f"Saved embedding: {embedding.id} ({model_name})")
     return embedding
 
 
-async def save_face_match_result(
+def new_face_match_result(
     session_id: str,
     match_results: Dict[str, Any],
 ) -> FaceMatchResult:
-    """Save face match result"""
-    result = FaceMatchResult(
+    """Build face match result record"""
+    return FaceMatchResult(
         id=f"match_{uuid.uuid4().hex[:16]}",
         session_id=session_id,
         model_name="dual_fusion",
@@ -631,26 +1072,45 @@ async def save_face_match_result(
             "arcface_match": match_results["arcface_match"],
         },
     )
+
+
+async def save_face_match_result(
+    session_id: str,
+    match_results: Dict[str, Any],
+) -> FaceMatchResult:
+    """Save face match result"""
+    result = new_face_match_result(session_id, match_results)
     await save_record(result)
     logger.info(f"Saved match result: {result.id} (match={result.match})")
     return result
 
 
-async def save_biometric_event(
+def new_biometric_event(
     session_id: str,
     event_type: str,
     event_status: str,
     event_data: Optional[Dict[str, Any]] = None,
     error_message: Optional[str] = None,
 ) -> BiometricEvent:
-    """Save biometric event for audit log"""
-    event = BiometricEvent(
+    """Build biometric audit event record"""
+    return BiometricEvent(
         session_id=session_id,
         event_type=event_type,
         event_status=event_status,
         event_data=event_data,
         error_message=error_message,
     )
+
+
+async def save_biometric_event(
+    session_id: str,
+    event_type: str,
+    event_status: str,
+    event_data: Optional[Dict[str, Any]] = None,
+    error_message: Optional[str] = None,
+) -> BiometricEvent:
+    """Save biometric event for audit log"""
+    event = new_biometric_event(session_id, event_type, event_status, event_data, error_message)
     await save_record(event)
     logger.debug(f"Saved event: {event_type} ({event_status})")
     return event
@@ -712,58 +1172,53 @@ async def upload_biometric_data(request: BiometricUploadRequest):
     logger.info(f"Biometric upload for session: {request.session_id}")
     
     try:
-        # Decode image
-        img = decode_base64_image(request.image_data)
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format="JPEG")
-        img_bytes = img_bytes.getvalue()
+        # Decode image (CPU-bound; keep it off the event loop)
+        img_bytes, img = await asyncio.to_thread(decode_upload_image, request.image_data)
         
         # Save image to storage
         storage_path = await save_image(request.session_id, "selfie", img_bytes)
         
-        # Create or update session
-        session = await create_biometric_session(request.session_id, request.tenant_id)
+        # Analyze liveness and extract embeddings before touching the DB
+        liveness_analysis = compute_liveness_score(request.liveness or {})
+        embeddings = await extract_dual_embeddings_async(img)
         
-        # Save artifact
-        artifact = await save_biometric_artifact(
+        # Session, artifact, liveness, embeddings and event: one transaction
+        artifact = new_biometric_artifact(
             request.session_id,
             "selfie",
             storage_path,
             img_bytes,
+            img,
         )
-        
-        # Analyze liveness
-        liveness_analysis = compute_liveness_score(request.liveness or {})
-        
-        # Save liveness result
-        await save_liveness_result(
-            request.session_id,
-            artifact.id,
-            liveness_analysis,
-            request.liveness or {},
+        records = [
+            new_biometric_session(request.session_id, request.tenant_id),
+            artifact,
+            new_liveness_result(
+                request.session_id,
+                artifact.id,
+                liveness_analysis,
+                request.liveness or {},
+            ),
+        ]
+        records.extend(
+            new_face_embedding(
+                request.session_id,
+                artifact.id,
+                "selfie",
+                model_name,
+                embedding_vector,
+            )
+            for model_name, embedding_vector in embeddings.items()
+            if embedding_vector is not None
         )
-        
-        # Extract embeddings
-        embeddings = extract_dual_embeddings(img)
-        
-        # Save embeddings
-        for model_name, embedding_vector in embeddings.items():
-            if embedding_vector is not None:
-                await save_face_embedding(
-                    request.session_id,
-                    artifact.id,
-                    "selfie",
-                    model_name,
-                    embedding_vector,
-                )
-        
-        # Save event
-        await save_biometric_event(
+        records.append(new_biometric_event(
             request.session_id,
             "selfie_uploaded",
             "success",
             {"liveness_passed": liveness_analysis["passed"]},
-        )
+        ))
+        await save_records(records)
+        logger.info(f"Created biometric session: {request.session_id}")
         
         return BiometricUploadResponse(
             biometric_id=artifact.id,
@@ -796,27 +1251,32 @@ async def verify_biometric_match(request: BiometricVerificationRequest):
     logger.info(f"Biometric verification for session: {request.session_id}")
     
     try:
-        # Decode images
-        id_img = decode_base64_image(request.id_image)
-        selfie_img = decode_base64_image(request.selfie_image)
+        # Decode images (CPU-bound; keep them off the event loop)
+        id_img, selfie_img = await asyncio.gather(
+            asyncio.to_thread(decode_base64_image, request.id_image),
+            asyncio.to_thread(decode_base64_image, request.selfie_image),
+        )
         
-        # Extract embeddings
-        id_embeddings = extract_dual_embeddings(id_img)
-        selfie_embeddings = extract_dual_embeddings(selfie_img)
+        # Extract embeddings: ID photo and selfie as one batch of 2 per model
+        embeddings = await extract_dual_embeddings_batch_async([id_img, selfie_img])
+        id_embeddings = _embedding_row(embeddings, 0)
+        selfie_embeddings = _embedding_row(embeddings, 1)
         
         # Compare embeddings
         match_results = compare_face_embeddings(id_embeddings, selfie_embeddings)
         
-        # Save match result
-        await save_face_match_result(request.session_id, match_results)
-        
-        # Save event
-        await save_biometric_event(
-            request.session_id,
-            "face_match_completed",
-            "success",
-            {"match": match_results["overall_match"]},
-        )
+        # Save match result and event in one transaction
+        match_record = new_face_match_result(request.session_id, match_results)
+        await save_records([
+            match_record,
+            new_biometric_event(
+                request.session_id,
+                "face_match_completed",
+                "success",
+                {"match": match_results["overall_match"]},
+            ),
+        ])
+        logger.info(f"Saved match result: {match_record.id} (match={match_record.match})")
         
         verification_id = f"ver_{uuid.uuid4().hex[:16]}"
         
@@ -19,6 +19,7 @@ DB Modes:
 
 import os
 import logging
+from contextlib import asynccontextmanager
 from typing import Optional, AsyncGenerator, Generator
 
 from sqlalchemy.ext.asyncio import (
@@ -192,6 +193,10 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+# Context-manager form for use inside handlers and background tasks
+async_session_scope = asynccontextmanager(get_async_session)
+
+
 def get_sync_session() -> Generator[Session, None, None]:
     """
     Synchronous session for fallback or offline tools.
@@ -223,6 +228,15 @@ def execute_sync(query, params=None):
         return result
 
 
+async def copy_records_async(table: str, columns, records) -> None:
+    """Bulk-insert row tuples with asyncpg's binary COPY (async mode only)."""
+    async with _async_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table, records=records, columns=list(columns)
+        )
+
+
 # --------------------------------------------
 # MODE-BASED DISPATCH
 # --------------------------------------------
@@ -249,3 +263,28 @@ async def save_record(record):
         return await save_record_async(record)
     else:
         return save_record_sync(record)
+
+
+async def save_records_async(records):
+    async with _async_session_factory() as session:
+        async with session.begin():
+            session.add_all(records)
+        return records
+
+
+def save_records_sync(records):
+    with _sync_session_factory() as session:
+        with session.begin():
+            session.add_all(records)
+        return records
+
+
+async def save_records(records):
+    """
+    Persist several records in a single transaction. Records are not
+    refreshed, so ids and timestamps must be set client-side.
+    """
+    if DB_MODE == "async":
+        return await save_records_async(records)
+    else:
+        return save_records_sync(records)
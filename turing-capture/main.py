@@ -4,19 +4,36 @@ Bank-grade identity verification and document capture platform with dual-model b
 """
 
 import logging
+import secrets
 from datetime import datetime
 from typing import Any, Dict, Optional
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
+try:
+    import orjson  # noqa: F401 (required by ORJSONResponse)
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSONResponse = None
+    ORJSON_AVAILABLE = False
+
 # Import database
-from db import init_db, close_db
+from db import init_db, close_db, DB_MODE
 
 # Import biometrics router
-from biometrics import router as biometrics_router
+from biometrics import (
+    STORAGE_MODE,
+    USE_MOCK_EMBEDDINGS,
+    router as biometrics_router,
+    start_event_flusher,
+    start_model_warmup,
+    stop_event_flusher,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -38,14 +55,18 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events:
     - Initialize database connection
     - Register pgvector extension
+    - Start batched biometric event persistence
+    - Warm the ONNX sessions in the background
     - Close database connections on shutdown
     """
     # Startup
     logger.info("🚀 TuringCapture™ service starting...")
+    start_model_warmup()
     
     try:
         await init_db()
         logger.info("✅ Database initialized successfully")
+        start_event_flusher()
     except Exception as e:
         logger.error(f"❌ Database initialization failed: {e}")
         logger.warning("⚠️  Continuing without database (memory mode only)")
@@ -58,6 +79,7 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 TuringCapture™ service shutting down...")
     
     try:
+        await stop_event_flusher()
         await close_db()
         logger.info("✅ Database connections closed")
     except Exception as e:
@@ -68,6 +90,10 @@ async def lifespan(app: FastAPI):
 # FASTAPI APPLICATION
 # ============================================================================
 
+# orjson serializes in C; endpoints returning this class directly also skip
+# FastAPI's jsonable_encoder pass over the response
+DefaultResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
 app = FastAPI(
     title="TuringCapture™",
     description="Identity & Document Capture Service - Bank-grade identity verification platform with dual-model biometrics",
@@ -75,6 +101,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=DefaultResponse,
     lifespan=lifespan,
 )
 
@@ -119,6 +146,78 @@ class CaptureResponse(BaseModel):
     verification_url: Optional[str] = None
 
 
+# ============================================================================
+# STATIC RESPONSE BODIES
+# ============================================================================
+
+# Payloads fixed at import are serialized once. Each request still gets a
+# fresh Response around the bytes, since middleware mutates response headers.
+
+def _json_body(content: Dict[str, Any]) -> bytes:
+    return DefaultResponse(content).body
+
+
+def _cached_json(body: bytes) -> Response:
+    return Response(body, media_type="application/json")
+
+
+_ROOT_BODY = _json_body({
+    "service": "TuringCapture™",
+    "description": "Identity & Document Capture Service with Dual-Model Biometrics",
+    "version": "2.0.0",
+    "status": "operational",
+    "features": [
+        "Liveness Detection (MediaPipe FaceMesh)",
+        "Dual-Model Face Matching (MobileFaceNet + ArcFace)",
+        "Async Database Persistence (PostgreSQL + pgvector)",
+        "Flexible Storage (Memory/Local/S3)",
+    ],
+    "docs": "/docs",
+    "health": "/health",
+})
+
+_LIVE_BODY = _json_body({"alive": True})
+
+# Keyed by whether a database engine is up
+_READY_BODIES = {
+    db_ready: _json_body({
+        "ready": True,
+        "checks": {
+            "database": "ok" if db_ready else "not_initialized",
+            "storage": STORAGE_MODE,
+            "embeddings": "mock" if USE_MOCK_EMBEDDINGS else "onnx",
+        },
+    })
+    for db_ready in (True, False)
+}
+
+_METRICS_BODY = _json_body({
+    "service": "turing-capture",
+    "version": "2.0.0",
+    "storage_mode": STORAGE_MODE,
+    "db_mode": DB_MODE,
+    "mock_embeddings": USE_MOCK_EMBEDDINGS,
+    "requests_total": 0,
+    "requests_success": 0,
+    "requests_failed": 0,
+    "avg_response_time_ms": 0,
+})
+
+
+def _id_stamp(timestamp: str) -> str:
+    """YYYYmmddHHMMSS from an isoformat() timestamp (slicing; strftime is ~6x slower)"""
+    return timestamp[0:4] + timestamp[5:7] + timestamp[8:10] + timestamp[11:13] + timestamp[14:16] + timestamp[17:19]
+
+
+def _new_id(prefix: str, timestamp: str, tag: str = "") -> str:
+    """
+    Time-sortable ID: prefix, second-resolution stamp, optional tag, then 32
+    random bits so requests landing in the same second (on any worker) differ
+    """
+    tag = f"_{tag}" if tag else ""
+    return f"{prefix}_{_id_stamp(timestamp)}{tag}_{secrets.token_hex(4)}"
+
+
 # ============================================================================
 # CORE ENDPOINTS
 # ============================================================================
@@ -126,23 +225,11 @@ class CaptureResponse(BaseModel):
 @app.get("/")
 async def root():
     """Root endpoint - service information"""
-    return {
-        "service": "TuringCapture™",
-        "description": "Identity & Document Capture Service with Dual-Model Biometrics",
-        "version": "2.0.0",
-        "status": "operational",
-        "features": [
-            "Liveness Detection (MediaPipe FaceMesh)",
-            "Dual-Model Face Matching (MobileFaceNet + ArcFace)",
-            "Async Database Persistence (PostgreSQL + pgvector)",
-            "Flexible Storage (Memory/Local/S3)",
-        ],
-        "docs": "/docs",
-        "health": "/health",
-    }
-
-
-@app.get("/health", response_model=HealthResponse)
+    return _cached_json(_ROOT_BODY)
+
+
+# Models document the bodies (responses=) without FastAPI re-validating them
+@app.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """
     Health check endpoint for monitoring and load balancers
@@ -162,14 +249,14 @@ async def health_check():
     except Exception as e:
         db_status = f"error: {str(e)}"
     
-    return HealthResponse(
-        status="ok",
-        service="turing-capture",
-        version="2.0.0",
-        timestamp=datetime.utcnow().isoformat(),
-        uptime="operational",
-        database=db_status,
-    )
+    return DefaultResponse({
+        "status": "ok",
+        "service": "turing-capture",
+        "version": "2.0.0",
+        "timestamp": datetime.utcnow().isoformat(),
+        "uptime": "operational",
+        "database": db_status,
+    })
 
 
 @app.get("/ready")
@@ -179,18 +266,8 @@ async def readiness_check():
     Returns 200 when service is ready to accept traffic
     """
     from db import _async_engine, _sync_engine
-    from biometrics import STORAGE_MODE, USE_MOCK_EMBEDDINGS
     
-    checks = {
-        "database": "ok" if (_async_engine or _sync_engine) else "not_initialized",
-        "storage": STORAGE_MODE,
-        "embeddings": "mock" if USE_MOCK_EMBEDDINGS else "onnx",
-    }
-    
-    return {
-        "ready": True,
-        "checks": checks,
-    }
+    return _cached_json(_READY_BODIES[bool(_async_engine or _sync_engine)])
 
 
 @app.get("/live")
@@ -199,14 +276,14 @@ async def liveness_check():
     Liveness check endpoint for Kubernetes
     Returns 200 when service is alive
     """
-    return {"alive": True}
+    return _cached_json(_LIVE_BODY)
 
 
 # ============================================================================
 # CAPTURE ENDPOINTS (Legacy)
 # ============================================================================
 
-@app.post("/v1/capture", response_model=CaptureResponse)
+@app.post("/v1/capture", responses={200: {"model": CaptureResponse}})
 async def create_capture(request: CaptureRequest):
     """
     Create a new identity capture session
@@ -216,17 +293,17 @@ async def create_capture(request: CaptureRequest):
     logger.info(f"Creating capture session for user: {request.user_id}")
     
     # Generate capture ID
-    capture_id = (
-        f"cap_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}_{request.user_id[:8]}"
-    )
+    # One clock read, formatted once; the ID stamp is sliced from it
+    timestamp = datetime.utcnow().isoformat()
+    capture_id = _new_id("cap", timestamp, request.user_id[:8])
     
-    return CaptureResponse(
-        capture_id=capture_id,
-        status="initiated",
-        user_id=request.user_id,
-        timestamp=datetime.utcnow().isoformat(),
-        verification_url=f"/v1/capture/{capture_id}/verify",
-    )
+    return DefaultResponse({
+        "capture_id": capture_id,
+        "status": "initiated",
+        "user_id": request.user_id,
+        "timestamp": timestamp,
+        "verification_url": f"/v1/capture/{capture_id}/verify",
+    })
 
 
 @app.get("/v1/capture/{capture_id}")
@@ -234,13 +311,13 @@ async def get_capture_status(capture_id: str):
     """Get the status of a capture session"""
     logger.info(f"Fetching capture status for: {capture_id}")
     
-    return {
+    return DefaultResponse({
         "capture_id": capture_id,
         "status": "pending",
         "created_at": datetime.utcnow().isoformat(),
         "steps_completed": 0,
         "steps_total": 3,
-    }
+    })
 
 
 @app.post("/v1/capture/{capture_id}/document")
@@ -248,12 +325,13 @@ async def upload_document(capture_id: str):
     """Upload a document for verification"""
     logger.info(f"Document upload for capture: {capture_id}")
     
-    return {
+    timestamp = datetime.utcnow().isoformat()
+    return DefaultResponse({
         "capture_id": capture_id,
-        "document_id": f"doc_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
+        "document_id": _new_id("doc", timestamp),
         "status": "uploaded",
-        "timestamp": datetime.utcnow().isoformat(),
-    }
+        "timestamp": timestamp,
+    })
 
 
 @app.post("/v1/capture/{capture_id}/biometric")
@@ -261,12 +339,13 @@ async def upload_biometric(capture_id: str):
     """Upload biometric data for verification"""
     logger.info(f"Biometric upload for capture: {capture_id}")
     
-    return {
+    timestamp = datetime.utcnow().isoformat()
+    return DefaultResponse({
         "capture_id": capture_id,
-        "biometric_id": f"bio_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
+        "biometric_id": _new_id("bio", timestamp),
         "status": "uploaded",
-        "timestamp": datetime.utcnow().isoformat(),
-    }
+        "timestamp": timestamp,
+    })
 
 
 @app.post("/v1/capture/{capture_id}/verify")
@@ -274,12 +353,12 @@ async def verify_capture(capture_id: str):
     """Verify the captured identity data"""
     logger.info(f"Verifying capture: {capture_id}")
     
-    return {
+    return DefaultResponse({
         "capture_id": capture_id,
         "verification_status": "verified",
         "confidence_score": 0.95,
         "timestamp": datetime.utcnow().isoformat(),
-    }
+    })
 
 
 # ============================================================================
@@ -291,20 +370,7 @@ async def metrics():
     """
     Metrics endpoint for monitoring (Prometheus compatible)
     """
-    from biometrics import STORAGE_MODE, USE_MOCK_EMBEDDINGS
-    from db import DB_MODE
-    
-    return {
-        "service": "turing-capture",
-        "version": "2.0.0",
-        "storage_mode": STORAGE_MODE,
-        "db_mode": DB_MODE,
-        "mock_embeddings": USE_MOCK_EMBEDDINGS,
-        "requests_total": 0,
-        "requests_success": 0,
-        "requests_failed": 0,
-        "avg_response_time_ms": 0,
-    }
+    return _cached_json(_METRICS_BODY)
 
 
 # ============================================================================
@@ -312,11 +378,15 @@ async def metrics():
 # ============================================================================
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
     
+    # uvloop/httptools come with uvicorn[standard]; uvloop has no Windows build
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=8101,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
         log_level="info",
     )
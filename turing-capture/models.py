@@ -25,8 +25,10 @@ from sqlalchemy import (
     DateTime,
     Text,
     JSON,
+    Enum,
     ForeignKey,
     Index,
+    cast,
 )
 from sqlalchemy.orm import relationship
 
@@ -35,12 +37,46 @@ from db import Base
 
 # pgvector support (optional - gracefully degrades if not available)
 try:
-    from pgvector.sqlalchemy import Vector
+    from pgvector.sqlalchemy import HALFVEC
     PGVECTOR_AVAILABLE = True
 except ImportError:
     PGVECTOR_AVAILABLE = False
     # Fallback to JSON for embeddings if pgvector not available
-    Vector = lambda dim: JSON
+    HALFVEC = lambda dim=None: JSON
+
+
+# ============================================================================
+# Categorical columns (Postgres ENUM types, created by migration 003)
+# ============================================================================
+
+# 4-byte enum labels instead of repeated VARCHARs in rows and B-tree indexes.
+# Adding a value needs ALTER TYPE ... ADD VALUE (see alembic/versions/003).
+SESSION_STATUSES = ("created", "in_progress", "completed", "failed")
+RISK_LEVELS = ("low", "medium", "high", "critical")
+ARTIFACT_TYPES = ("selfie", "id_front", "id_back")
+STORAGE_MODES = ("memory", "local", "s3")
+MODEL_NAMES = ("mobilefacenet", "arcface", "fusion", "dual_fusion")
+EVENT_TYPES = (
+    "selfie_captured",
+    "liveness_detected",
+    "face_matched",
+    "session_completed",
+    "selfie_uploaded",
+    "selfie_upload_failed",
+    "face_match_completed",
+    "face_match_failed",
+    "UPLOAD",
+    "VERIFY",
+)
+EVENT_STATUSES = ("success", "failure", "warning", "error")
+
+SessionStatus = Enum(*SESSION_STATUSES, name="session_status_enum")
+RiskLevel = Enum(*RISK_LEVELS, name="risk_level_enum")
+ArtifactType = Enum(*ARTIFACT_TYPES, name="artifact_type_enum")
+StorageMode = Enum(*STORAGE_MODES, name="storage_mode_enum")
+ModelName = Enum(*MODEL_NAMES, name="model_name_enum")
+EventType = Enum(*EVENT_TYPES, name="event_type_enum")
+EventStatus = Enum(*EVENT_STATUSES, name="event_status_enum")
 
 
 # ============================================================================
@@ -67,7 +103,7 @@ class BiometricSession(Base):
     user_id = Column(String(64), nullable=True, index=True)
     
     # Status tracking
-    status = Column(String(32), nullable=False, default="created")  # created, in_progress, completed, failed
+    status = Column(SessionStatus, nullable=False, default="created")  # created, in_progress, completed, failed
     
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -77,7 +113,7 @@ class BiometricSession(Base):
     # Results summary
     liveness_passed = Column(Boolean, nullable=True)
     face_match_passed = Column(Boolean, nullable=True)
-    overall_risk_level = Column(String(16), nullable=True)  # low, medium, high, critical
+    overall_risk_level = Column(RiskLevel, nullable=True)  # low, medium, high, critical
     
     # Metadata
     extra_metadata = Column(JSON, nullable=True)
@@ -118,8 +154,8 @@ class BiometricArtifact(Base):
     session_id = Column(String(64), ForeignKey("biometric_sessions.id"), nullable=False, index=True)
     
     # Artifact metadata
-    artifact_type = Column(String(32), nullable=False)  # selfie, id_front, id_back
-    storage_mode = Column(String(16), nullable=False)  # memory, local, s3
+    artifact_type = Column(ArtifactType, nullable=False)  # selfie, id_front, id_back
+    storage_mode = Column(StorageMode, nullable=False)  # memory, local, s3
     storage_path = Column(Text, nullable=True)  # S3 key or local path
     
     # Image properties
@@ -179,7 +215,7 @@ class LivenessResult(Base):
     
     # Result
     passed = Column(Boolean, nullable=False)
-    risk_level = Column(String(16), nullable=True)  # low, medium, high, critical
+    risk_level = Column(RiskLevel, nullable=True)  # low, medium, high, critical
     
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -201,6 +237,35 @@ class LivenessResult(Base):
 # FaceEmbedding
 # ============================================================================
 
+EMBEDDING_DIMS = {"mobilefacenet": 128, "arcface": 512}
+
+# HNSW build parameters (pgvector defaults)
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+
+
+def _ann_vector(column, model_name: str):
+    """``column`` cast to ``model_name``'s dimension; HNSW can't index a dimensionless vector."""
+    return cast(column, HALFVEC(EMBEDDING_DIMS[model_name]))
+
+
+def _ann_index(vector_column, model_column, model_name: str) -> Index:
+    """
+    Partial HNSW cosine index over one model's rows. Queries must order by
+    the same cast (FaceEmbedding.ann_vector) and filter on the model name
+    as a literal for the planner to use it.
+    """
+    label = f"{model_name}_vector"
+    return Index(
+        f"idx_embedding_{model_name}_hnsw",
+        _ann_vector(vector_column, model_name).label(label),
+        postgresql_using="hnsw",
+        postgresql_with={"m": HNSW_M, "ef_construction": HNSW_EF_CONSTRUCTION},
+        postgresql_ops={label: "halfvec_cosine_ops"},
+        postgresql_where=model_column == model_name,
+    )
+
+
 class FaceEmbedding(Base):
     """
     Stores face embeddings using pgvector for similarity search
@@ -220,12 +285,15 @@ class FaceEmbedding(Base):
     
     # Embedding metadata
     embedding_type = Column(String(32), nullable=False)  # selfie, id_photo
-    model_name = Column(String(32), nullable=False)  # mobilefacenet, arcface
+    model_name = Column(ModelName, nullable=False)  # mobilefacenet, arcface
     embedding_size = Column(Integer, nullable=False)  # 128, 512
     
     # Embedding vector (pgvector or JSON fallback)
     if PGVECTOR_AVAILABLE:
-        embedding_vector = Column(Vector(512), nullable=False)  # Max size, will work for 128D too
+        # Dimensionless: a halfvec(512) column rejects the 128D MobileFaceNet rows.
+        # FP16 (pgvector >= 0.7.0) halves row and HNSW index size; distances are
+        # still accumulated in float32, and unit-norm embeddings move by ~1e-3.
+        embedding_vector = Column(HALFVEC(), nullable=False)
     else:
         embedding_vector = Column(JSON, nullable=False)  # Fallback to JSON array
     
@@ -242,8 +310,18 @@ class FaceEmbedding(Base):
     __table_args__ = (
         Index("idx_embedding_session", "session_id"),
         Index("idx_embedding_type_model", "embedding_type", "model_name"),
+        # 1:N search: one ANN index per model (see migrations 004, 005)
+        *((
+            _ann_index(embedding_vector, model_name, "mobilefacenet"),
+            _ann_index(embedding_vector, model_name, "arcface"),
+        ) if PGVECTOR_AVAILABLE else ()),
     )
 
+    @classmethod
+    def ann_vector(cls, model_name: str):
+        """The embedding column as indexed for ``model_name`` (pgvector only)."""
+        return _ann_vector(cls.embedding_vector, model_name)
+
 
 # ============================================================================
 # FaceMatchResult
@@ -264,7 +342,7 @@ class FaceMatchResult(Base):
     selfie_embedding_id = Column(String(64), ForeignKey("face_embeddings.id"), nullable=True)
     
     # Match results
-    model_name = Column(String(32), nullable=False)  # mobilefacenet, arcface, fusion
+    model_name = Column(ModelName, nullable=False)  # mobilefacenet, arcface, fusion
     similarity_score = Column(Float, nullable=False)
     distance_score = Column(Float, nullable=True)
     threshold = Column(Float, nullable=False)
@@ -272,7 +350,7 @@ class FaceMatchResult(Base):
     # Result
     match = Column(Boolean, nullable=False)
     confidence = Column(Float, nullable=False)
-    risk_level = Column(String(16), nullable=True)  # low, medium, high, critical
+    risk_level = Column(RiskLevel, nullable=True)  # low, medium, high, critical
     
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -313,8 +391,8 @@ class BiometricEvent(Base):
     session_id = Column(String(64), ForeignKey("biometric_sessions.id"), nullable=False, index=True)
     
     # Event metadata
-    event_type = Column(String(64), nullable=False)  # selfie_captured, liveness_detected, face_matched
-    event_status = Column(String(32), nullable=False)  # success, failure, warning
+    event_type = Column(EventType, nullable=False)  # selfie_captured, liveness_detected, face_matched
+    event_status = Column(EventStatus, nullable=False)  # success, failure, warning
     
     # Event data
     event_data = Column(JSON, nullable=True)
@@ -0,0 +1,163 @@
+"""
+TuringCapture™ ONNX Model Quantization
+=======================================
+
+Produces INT8 (QDQ, per-channel) variants of the face embedding models
+with ONNX Runtime static quantization. biometrics.py loads
+``<model>.int8.onnx`` in place of the FP32 model when it exists
+(disable with BIOMETRIC_USE_INT8=false).
+
+Usage:
+    python quantize_models.py --images ./calibration_faces [--calibration 200]
+
+Calibration images are face photos (JPEG/PNG). The first ``--calibration``
+images calibrate activation ranges; the remainder are held out to check
+that pairwise cosine similarity moves by less than ``--max-delta``, and
+to suggest match thresholds shifted by the median score change.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+import onnxruntime as ort
+from onnxruntime.quantization import (
+    CalibrationDataReader,
+    QuantFormat,
+    QuantType,
+    quantize_static,
+)
+
+from biometrics import (
+    ARCFACE_PATH,
+    ARCFACE_THRESHOLD,
+    MOBILEFACENET_PATH,
+    MOBILEFACENET_THRESHOLD,
+    detect_face_simple,
+    load_image_from_bytes,
+    preprocess_face_image,
+)
+
+logger = logging.getLogger("turing.quantize")
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png"}
+
+
+def load_faces(image_dir: Path) -> List[np.ndarray]:
+    """Load, detect and preprocess every face image in ``image_dir``."""
+    faces = []
+    for path in sorted(image_dir.iterdir()):
+        if path.suffix.lower() not in IMAGE_SUFFIXES:
+            continue
+        try:
+            face = detect_face_simple(load_image_from_bytes(path.read_bytes()))
+        except Exception as e:
+            logger.warning(f"Skipping {path.name}: {e}")
+            continue
+        if face is not None:
+            faces.append(preprocess_face_image(face))
+    return faces
+
+
+class FaceCalibrationReader(CalibrationDataReader):
+    """Feeds preprocessed [1,3,112,112] face tensors to the calibrator."""
+
+    def __init__(self, input_name: str, faces: List[np.ndarray]):
+        self.input_name = input_name
+        self.faces = faces
+        self._iter: Optional[Iterator[np.ndarray]] = None
+        self.rewind()
+
+    def get_next(self):
+        face = next(self._iter, None)
+        return None if face is None else {self.input_name: face}
+
+    def rewind(self):
+        self._iter = iter(self.faces)
+
+
+def _embed(session: ort.InferenceSession, faces: List[np.ndarray]) -> np.ndarray:
+    input_name = session.get_inputs()[0].name
+    out = np.stack([session.run(None, {input_name: f})[0].reshape(-1) for f in faces])
+    return out / np.linalg.norm(out, axis=1, keepdims=True)
+
+
+def cosine_drift(fp32_path: Path, int8_path: Path, faces: List[np.ndarray]) -> Tuple[float, float]:
+    """
+    Change in pairwise cosine similarity between the FP32 and INT8 models.
+    Returns (largest absolute change, median signed change INT8 - FP32).
+    """
+    providers = ["CPUExecutionProvider"]
+    ref = _embed(ort.InferenceSession(str(fp32_path), providers=providers), faces)
+    quant = _embed(ort.InferenceSession(str(int8_path), providers=providers), faces)
+    pairs = np.triu_indices(len(faces), k=1)
+    shift = (quant @ quant.T - ref @ ref.T)[pairs]
+    return float(np.abs(shift).max()), float(np.median(shift))
+
+
+def quantize_model(model_path: Path, calibration: List[np.ndarray]) -> Path:
+    """Statically quantize ``model_path`` to ``<model>.int8.onnx``."""
+    output_path = model_path.with_suffix(".int8.onnx")
+    input_name = ort.InferenceSession(
+        str(model_path), providers=["CPUExecutionProvider"]
+    ).get_inputs()[0].name
+    quantize_static(
+        str(model_path),
+        str(output_path),
+        FaceCalibrationReader(input_name, calibration),
+        quant_format=QuantFormat.QDQ,
+        per_channel=True,
+        weight_type=QuantType.QInt8,
+        activation_type=QuantType.QUInt8,
+    )
+    return output_path
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Quantize face embedding models to INT8")
+    parser.add_argument("--images", type=Path, required=True, help="Directory of face images")
+    parser.add_argument("--calibration", type=int, default=200, help="Images used for calibration")
+    parser.add_argument("--max-delta", type=float, default=0.02, help="Allowed cosine similarity drift")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    faces = load_faces(args.images)
+    calibration, held_out = faces[:args.calibration], faces[args.calibration:]
+    if not calibration:
+        logger.error(f"No usable faces found in {args.images}")
+        return 1
+
+    ok = True
+    models = (
+        (MOBILEFACENET_PATH, "MOBILEFACENET_THRESHOLD", MOBILEFACENET_THRESHOLD),
+        (ARCFACE_PATH, "ARCFACE_THRESHOLD", ARCFACE_THRESHOLD),
+    )
+    for model_path, threshold_name, threshold in models:
+        if not model_path.exists():
+            logger.warning(f"⚠️  {model_path} not found - skipping")
+            continue
+        int8_path = quantize_model(model_path, calibration)
+        logger.info(f"✅ Wrote {int8_path}")
+
+        if len(held_out) < 2:
+            logger.warning("   Not enough held-out faces to verify similarity drift")
+            continue
+        delta, shift = cosine_drift(model_path, int8_path, held_out)
+        if delta > args.max_delta:
+            logger.error(f"❌ {int8_path.name}: cosine drift {delta:.4f} exceeds {args.max_delta} - removed")
+            int8_path.unlink()
+            ok = False
+        else:
+            logger.info(f"   Cosine drift {delta:.4f} (limit {args.max_delta}), median shift {shift:+.4f}")
+            # Scores move by ~shift under INT8; move the threshold with them
+            logger.info(f"   Suggested {threshold_name}={threshold + shift:.4f} (currently {threshold})")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Test suite for the dynamic ONNX batcher
+"""
+import asyncio
+import threading
+
+import numpy as np
+from biometrics import OnnxBatcher
+
+
+class RecordingModel:
+    """Batch function that tags each row with its input and records batch sizes"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sizes = []
+        self.lock = threading.Lock()
+
+    def __call__(self, batch):
+        with self.lock:
+            self.sizes.append(len(batch))
+        if self.fail:
+            raise RuntimeError("inference failed")
+        # One output row per face: its fill value, so results can be matched to inputs
+        return batch.reshape(len(batch), -1)[:, :4].copy()
+
+
+def _face(value):
+    return np.full((1, 3, 112, 112), value, dtype=np.float32)
+
+
+async def _submit_all(batcher, values):
+    return await asyncio.gather(*(batcher.submit(_face(v)) for v in values))
+
+
+def test_concurrent_submits_share_one_run():
+    """Test that concurrent submits are coalesced into a single batch run"""
+    model = RecordingModel()
+    batcher = OnnxBatcher(model, max_batch=8, max_wait=0.05)
+    rows = asyncio.run(_submit_all(batcher, range(5)))
+    assert model.sizes == [5]
+    assert batcher.batches == 1
+    assert batcher.items == 5
+    for value, row in zip(range(5), rows):
+        assert np.all(row == value)
+
+
+def test_batches_are_capped_at_max_batch():
+    """Test that a burst larger than max_batch is split in arrival order"""
+    model = RecordingModel()
+    batcher = OnnxBatcher(model, max_batch=2, max_wait=0.05)
+    rows = asyncio.run(_submit_all(batcher, range(5)))
+    assert model.sizes == [2, 2, 1]
+    assert [float(row[0]) for row in rows] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_lone_request_flushes_after_max_wait():
+    """Test that a single request runs once max_wait elapses instead of waiting for a full batch"""
+    model = RecordingModel()
+    batcher = OnnxBatcher(model, max_batch=64, max_wait=0.01)
+
+    async def run():
+        return await asyncio.wait_for(batcher.submit(_face(3)), timeout=1.0)
+
+    row = asyncio.run(run())
+    assert model.sizes == [1]
+    assert np.all(row == 3)
+
+
+def test_failure_reaches_every_waiter():
+    """Test that a failed run raises in every request of the batch, and the batcher recovers"""
+    model = RecordingModel(fail=True)
+    batcher = OnnxBatcher(model, max_batch=8, max_wait=0.05)
+
+    async def run():
+        results = await asyncio.gather(
+            *(batcher.submit(_face(v)) for v in range(3)), return_exceptions=True
+        )
+        model.fail = False
+        after = await batcher.submit(_face(7))
+        return results, after
+
+    results, after = asyncio.run(run())
+    assert model.sizes == [3, 1]
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert np.all(after == 7)
+    assert batcher.batches == 1  # only the successful run is counted
+
+
+def test_batcher_survives_event_loop_change():
+    """Test that a batcher used under one loop keeps working under a new one"""
+    model = RecordingModel()
+    batcher = OnnxBatcher(model, max_batch=8, max_wait=0.01)
+    first = asyncio.run(_submit_all(batcher, [1, 2]))
+    first_task = batcher._task
+    second = asyncio.run(_submit_all(batcher, [3, 4]))
+    assert batcher._task is not first_task
+    assert model.sizes == [2, 2]
+    assert [float(r[0]) for r in first + second] == [1.0, 2.0, 3.0, 4.0]
@@ -0,0 +1,89 @@
+"""
+Test suite for the v1 IO-bound model wrapper
+"""
+import ctypes
+
+import numpy as np
+import pytest
+
+from biometrics_v1_backup import _BoundModel
+
+
+class _Arg:
+    def __init__(self, name, shape):
+        self.name = name
+        self.shape = shape
+
+
+class _Binding:
+    def __init__(self):
+        self.input = None
+        self.output = None
+        self.result = None
+
+    def bind_input(self, name, device, device_id, dtype, shape, ptr):
+        self.input = (tuple(shape), ptr)
+
+    def bind_output(self, name, device, device_id=0, dtype=None, shape=None, ptr=None):
+        self.output = (tuple(shape), ptr) if shape is not None else None
+
+    def copy_outputs_to_cpu(self):
+        return [self.result.copy()]
+
+
+def _view(shape, ptr):
+    return np.ctypeslib.as_array(ctypes.cast(ptr, ctypes.POINTER(ctypes.c_float)), shape)
+
+
+class StubSession:
+    """Session whose output row is the input face's fill value, repeated 4 times"""
+
+    def __init__(self, batch, static_output=True):
+        self.batch = batch
+        self.static_output = static_output
+        self.run_shapes = []
+
+    def get_inputs(self):
+        return [_Arg("input", [self.batch, 3, 112, 112])]
+
+    def get_outputs(self):
+        return [_Arg("output", [self.batch, 4] if self.static_output else [self.batch, "dim"])]
+
+    def io_binding(self):
+        return _Binding()
+
+    def run_with_iobinding(self, binding):
+        shape, ptr = binding.input
+        assert shape[0] == self.batch, "fixed-batch graph run with the wrong batch size"
+        self.run_shapes.append(shape)
+        faces = _view(shape, ptr)
+        result = np.repeat(faces[:, 0, 0, :1], 4, axis=1)
+        if binding.output is not None:
+            _view(*binding.output)[...] = result
+        else:
+            binding.result = result
+
+
+def _faces(n):
+    return np.arange(1, n + 1, dtype=np.float32)[:, None, None, None] * np.ones((1, 3, 112, 112), np.float32)
+
+
+@pytest.mark.parametrize("static_output", [True, False])
+@pytest.mark.parametrize("batch, n, runs", [(1, 3, 3), (4, 4, 1), (4, 6, 2), (4, 2, 1)])
+def test_fixed_batch_is_chunked_and_trimmed(batch, n, runs, static_output):
+    """Test that a fixed batch graph is run in padded chunks and the padding rows dropped"""
+    session = StubSession(batch, static_output)
+    out = _BoundModel(session).run(_faces(n))
+    assert out.shape == (n, 4)
+    assert out[:, 0].tolist() == list(range(1, n + 1))
+    assert len(session.run_shapes) == runs
+
+
+def test_padding_is_zeroed_between_runs():
+    """Test that rows left over from a previous full chunk don't leak into the padding"""
+    session = StubSession(4)
+    model = _BoundModel(session)
+    model.run(_faces(4))
+    in_buf = model._bindings[4][1]
+    model.run(_faces(1))
+    assert not in_buf[1:].any()
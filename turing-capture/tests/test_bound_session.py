@@ -0,0 +1,89 @@
+"""
+Test suite for the IO-bound ONNX session wrapper
+"""
+import ctypes
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from biometrics import _BoundSession
+
+
+class _Arg:
+    def __init__(self, name, shape):
+        self.name = name
+        self.shape = shape
+
+
+class _Binding:
+    def __init__(self):
+        self.input = None
+        self.output = None
+        self.result = None
+
+    def bind_cpu_input(self, name, arr):
+        self.input = arr
+
+    def bind_output(self, name, device, device_id=0, dtype=None, shape=None, ptr=None):
+        self.output = (tuple(shape), ptr) if shape is not None else None
+
+    def copy_outputs_to_cpu(self):
+        return [self.result]
+
+
+class StubSession:
+    """Dynamic-batch session whose output row is each face's fill value, repeated 4 times"""
+
+    def __init__(self, barrier=None):
+        self.barrier = barrier
+        self.bindings = []
+
+    def get_inputs(self):
+        return [_Arg("input", ["batch", 3, 112, 112])]
+
+    def get_outputs(self):
+        return [_Arg("output", ["batch", 4])]
+
+    def get_providers(self):
+        return ["CPUExecutionProvider"]
+
+    def io_binding(self):
+        binding = _Binding()
+        self.bindings.append(binding)
+        return binding
+
+    def run_with_iobinding(self, binding):
+        if self.barrier is not None:
+            # Both threads must be inside a run at once, or this times out
+            self.barrier.wait(timeout=5)
+        result = np.repeat(binding.input[:, 0, 0, :1], 4, axis=1)
+        if binding.output is None:
+            binding.result = result
+        else:
+            shape, ptr = binding.output
+            view = np.ctypeslib.as_array(ctypes.cast(ptr, ctypes.POINTER(ctypes.c_float)), shape)
+            view[...] = result
+
+
+def _faces(*values):
+    return np.array(values, dtype=np.float32)[:, None, None, None] * np.ones((1, 3, 112, 112), np.float32)
+
+
+def test_output_buffer_reused_across_batch_sizes():
+    """Test that results stay correct when one thread alternates batch sizes"""
+    io = _BoundSession(StubSession())
+    for values in [(1,), (2, 3), (4,), (5, 6)]:
+        assert io.run(_faces(*values))[:, 0].tolist() == list(values)
+    assert len(io._session.bindings) == 1
+
+
+def test_threads_run_concurrently_on_own_bindings():
+    """Test that two threads run the same session at once, each with its own binding"""
+    session = StubSession(barrier=threading.Barrier(2))
+    io = _BoundSession(session)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(io.run, _faces(v, v)) for v in (1, 2)]
+        results = [f.result() for f in futures]
+    assert [r[:, 0].tolist() for r in results] == [[1, 1], [2, 2]]
+    assert len(session.bindings) == 2
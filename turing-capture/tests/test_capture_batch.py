@@ -0,0 +1,67 @@
+"""
+Test suite for TuringCapture.capture_batch
+"""
+from dataclasses import asdict, fields
+
+import pytest
+from app import CaptureResult, TuringCapture, VerificationStatus
+
+
+@pytest.fixture
+def capture():
+    return TuringCapture()
+
+
+BATCH = [
+    {"capture_id": "cap-1", "name": "Ada Lovelace", "dob": "1815-12-10", "device_id": "ios-1"},
+    {"capture_id": "cap-2", "name": "No Dob", "device_id": "android-7"},
+    {"capture_id": "cap-3", "name": "", "dob": "1990-01-01"},
+    {"name": "Grace Hopper", "dob": "1906-12-09", "device_id": "ios-1"},
+    {},
+]
+
+
+def test_capture_batch_mixed_records(capture):
+    """Test valid and invalid records in one batch, reported per record in order"""
+    results = capture.capture_batch(BATCH)
+
+    assert [r.capture_id for r in results] == ["cap-1", "cap-2", "cap-3", "unknown", "unknown"]
+    assert [r.identity_verified for r in results] == [True, False, False, True, False]
+    assert [r.verification_status for r in results] == [
+        VerificationStatus.VERIFIED,
+        VerificationStatus.FAILED,
+        VerificationStatus.FAILED,
+        VerificationStatus.VERIFIED,
+        VerificationStatus.FAILED,
+    ]
+    assert [r.confidence_score for r in results] == [0.85, 0.3, 0.3, 0.85, 0.3]
+
+
+def test_capture_batch_result_shape(capture):
+    """Test that every item is a complete CaptureResult"""
+    for result in capture.capture_batch(BATCH):
+        assert isinstance(result, CaptureResult)
+        assert set(asdict(result)) == {f.name for f in fields(CaptureResult)}
+        assert result.document_verified is False
+        assert result.biometric_verified is False
+        assert result.message == "Identity verification completed"
+        assert result.device_fingerprint.startswith("fp_")
+        assert len(result.device_fingerprint) == len("fp_") + 12
+
+
+def test_capture_batch_matches_single_capture(capture):
+    """Test that a batch gives the same results as capturing each record alone"""
+    assert capture.capture_batch(BATCH) == [capture.capture_identity(d) for d in BATCH]
+
+
+def test_capture_batch_fingerprints(capture):
+    """Test that fingerprints depend only on the device id"""
+    results = capture.capture_batch(BATCH)
+    assert results[0].device_fingerprint == results[3].device_fingerprint  # same device
+    assert results[0].device_fingerprint != results[1].device_fingerprint
+    assert results[2].device_fingerprint == results[4].device_fingerprint  # both "unknown"
+
+
+def test_capture_batch_empty(capture):
+    """Test that an empty batch returns no results"""
+    assert capture.capture_batch([]) == []
@@ -1,9 +1,12 @@
 """
 Test suite for embedding generation and normalization
 """
+import asyncio
+
 import numpy as np
 import pytest
-from biometrics import _mock_embedding, _normalize, _cosine
+import biometrics
+from biometrics import _EmbeddingCache, _mock_embedding, _normalize, _cosine
 
 
 def test_mock_embedding_dimensions_128():
@@ -72,3 +75,34 @@ def test_cosine_range():
     v2 = _mock_embedding(128)
     similarity = _cosine(v1, v2)
     assert -1.0 <= similarity <= 1.0
+
+
+def _embed_cached_with(monkeypatch, embeddings):
+    """Run embed_image_cached against a fresh cache with a stubbed model output"""
+    cache = _EmbeddingCache(8)
+    monkeypatch.setattr(biometrics, "_embedding_cache", cache)
+
+    async def fake_embed(img):
+        return embeddings
+
+    monkeypatch.setattr(biometrics, "embed_face_async", fake_embed)
+    asyncio.run(biometrics.embed_image_cached(b"image-bytes", None))
+    return cache
+
+
+def test_embedding_cache_skips_mock_fallback(monkeypatch):
+    """Test that mock fallback vectors are never cached under the image hash"""
+    mock = {
+        "mobile": biometrics._mock_rows(128, 2)[0],
+        "arcface": biometrics._mock_rows(512, 2)[0],
+    }
+    assert len(_embed_cached_with(monkeypatch, mock)) == 0
+
+
+def test_embedding_cache_keeps_model_output(monkeypatch):
+    """Test that real model output is cached"""
+    real = {
+        "mobile": _normalize(np.ones(128, dtype="float32")),
+        "arcface": _normalize(np.ones(512, dtype="float32")),
+    }
+    assert len(_embed_cached_with(monkeypatch, real)) == 1
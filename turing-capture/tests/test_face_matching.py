@@ -1,9 +1,21 @@
 """
 Test suite for face matching and comparison
 """
+import asyncio
+from types import SimpleNamespace
+
 import numpy as np
 import pytest
-from biometrics import compare_embeddings, explain_match, MOBILEFACENET_THRESHOLD, ARCFACE_THRESHOLD
+import biometrics
+from biometrics import (
+    compare_batch,
+    compare_embeddings,
+    explain_match,
+    search_embeddings,
+    _normalize,
+    MOBILEFACENET_THRESHOLD,
+    ARCFACE_THRESHOLD,
+)
 
 
 def test_matching_identical_vectors():
@@ -135,3 +147,104 @@ def test_explain_match_failure_both():
     explanation = explain_match(result)
     assert explanation["summary"] == "no_match"
     assert len(explanation["reasons"]) == 2  # Both should fail
+
+
+def _candidates(n, seed=0):
+    """Query vectors plus N candidates whose similarity sweeps across the thresholds"""
+    rng = np.random.default_rng(seed)
+    mobile_q = rng.standard_normal(128).astype("float32")
+    arc_q = rng.standard_normal(512).astype("float32")
+    # Mix the query with noise in varying proportions (and unnormalized scales)
+    mix = np.linspace(0.0, 1.0, n, dtype="float32")[:, None]
+    mobile_db = (mix * mobile_q + (1 - mix) * rng.standard_normal((n, 128))).astype("float32")
+    arc_db = (mix[::-1] * arc_q + (1 - mix[::-1]) * rng.standard_normal((n, 512))).astype("float32")
+    mobile_db *= rng.uniform(0.5, 3.0, (n, 1)).astype("float32")
+    return mobile_q * 2.5, mobile_db, arc_q, arc_db
+
+
+def test_compare_batch_matches_scalar_compare():
+    """Test that every compare_batch row equals the scalar compare_embeddings result"""
+    mobile_q, mobile_db, arc_q, arc_db = _candidates(64)
+    batch = compare_batch(mobile_q, mobile_db, arc_q, arc_db, assume_normalized=False)
+
+    # The sweep crosses both thresholds, so both is_match outcomes are exercised
+    assert batch["is_match"].any() and not batch["is_match"].all()
+    for i in range(len(mobile_db)):
+        scalar = compare_embeddings(mobile_q, mobile_db[i], arc_q, arc_db[i])
+        for key in ("mobile_score", "arcface_score", "fused_score"):
+            assert batch[key][i] == pytest.approx(scalar[key], abs=1e-5)
+        assert bool(batch["is_match"][i]) == scalar["is_match"]
+
+
+def test_compare_batch_on_normalized_inputs():
+    """Test the dot-product fast path against normalizing first"""
+    mobile_q, mobile_db, arc_q, arc_db = _candidates(32, seed=1)
+    mobile_q, arc_q = _normalize(mobile_q), _normalize(arc_q)
+    mobile_db = mobile_db / np.linalg.norm(mobile_db, axis=1, keepdims=True)
+    arc_db = arc_db / np.linalg.norm(arc_db, axis=1, keepdims=True)
+
+    fast = compare_batch(mobile_q, mobile_db, arc_q, arc_db)
+    slow = compare_batch(mobile_q, mobile_db, arc_q, arc_db, assume_normalized=False)
+    for key in ("mobile_score", "arcface_score", "fused_score"):
+        assert np.allclose(fast[key], slow[key], atol=1e-5)
+    assert np.array_equal(fast["is_match"], slow["is_match"])
+
+
+def test_compare_embeddings_assume_normalized():
+    """Test that assume_normalized=True gives the same result as full cosine on unit vectors"""
+    mobile_q, mobile_db, arc_q, arc_db = _candidates(16, seed=2)
+    mobile_q, arc_q = _normalize(mobile_q), _normalize(arc_q)
+    for m, a in zip(mobile_db, arc_db):
+        m, a = _normalize(m), _normalize(a)
+        fast = compare_embeddings(mobile_q, m, arc_q, a, assume_normalized=True)
+        full = compare_embeddings(mobile_q, m, arc_q, a)
+        for key in ("mobile_score", "arcface_score", "fused_score"):
+            assert fast[key] == pytest.approx(full[key], abs=1e-5)
+            assert isinstance(fast[key], float)
+        assert fast["is_match"] == full["is_match"]
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class _FakeSession:
+    """Stands in for AsyncSession on the JSON (no pgvector) search path"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def execute(self, statement):
+        return _FakeResult(self.rows)
+
+
+@pytest.mark.parametrize("k", [1, 5, 100])
+def test_search_embeddings_matches_scalar_ranking(monkeypatch, k):
+    """Test that 1:N search ranks and scores like pairwise cosine"""
+    monkeypatch.setattr(biometrics, "PGVECTOR_AVAILABLE", False)
+    _, _, arc_q, arc_db = _candidates(40, seed=3)
+    rows = [SimpleNamespace(id=f"emb_{i}", embedding_vector=v.tolist()) for i, v in enumerate(arc_db)]
+
+    found = asyncio.run(search_embeddings(_FakeSession(rows), arc_q, k=k))
+
+    expected = sorted(
+        ((row.id, biometrics._cosine(arc_q, np.asarray(row.embedding_vector, dtype="float32")))
+         for row in rows),
+        key=lambda item: -item[1],
+    )[:k]
+    assert [emb.id for emb, _ in found] == [emb_id for emb_id, _ in expected]
+    for (_, score), (_, ref) in zip(found, expected):
+        assert score == pytest.approx(ref, abs=1e-5)
+
+
+def test_search_embeddings_no_candidates(monkeypatch):
+    """Test that an empty table gives no matches"""
+    monkeypatch.setattr(biometrics, "PGVECTOR_AVAILABLE", False)
+    assert asyncio.run(search_embeddings(_FakeSession([]), np.ones(512, dtype="float32"))) == []
@@ -0,0 +1,119 @@
+"""
+Test suite for the bounded in-memory image store
+"""
+import pytest
+import biometrics
+from biometrics import _BoundedImageStore
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(biometrics.time, "monotonic", clock)
+    return clock
+
+
+def test_put_get_and_byte_accounting(clock):
+    """Test that stored images are returned and their sizes tracked"""
+    store = _BoundedImageStore(max_bytes=100, ttl_seconds=60)
+    store.put("a", b"x" * 10)
+    store.put("b", b"y" * 20)
+    assert store.get("a") == b"x" * 10
+    assert store.get("missing") is None
+    assert len(store) == 2
+    assert store.nbytes == 30
+
+    # Overwriting replaces the old bytes in the total
+    store.put("a", b"z" * 5)
+    assert store.get("a") == b"z" * 5
+    assert store.nbytes == 25
+
+
+def test_capacity_evicts_least_recently_used(clock):
+    """Test that the byte cap evicts from the LRU end"""
+    store = _BoundedImageStore(max_bytes=30, ttl_seconds=60)
+    store.put("a", b"a" * 10)
+    store.put("b", b"b" * 10)
+    store.put("c", b"c" * 10)
+    assert store.nbytes == 30
+
+    store.put("d", b"d" * 10)
+    assert store.get("a") is None
+    assert [store.get(k) is not None for k in ("b", "c", "d")] == [True, True, True]
+    assert store.nbytes == 30
+
+    # A large image evicts as many entries as it needs
+    store.put("e", b"e" * 25)
+    assert len(store) == 1
+    assert store.get("e") == b"e" * 25
+
+
+def test_get_refreshes_recency(clock):
+    """Test that reading an entry moves it away from the eviction end"""
+    store = _BoundedImageStore(max_bytes=30, ttl_seconds=60)
+    store.put("a", b"a" * 10)
+    store.put("b", b"b" * 10)
+    store.put("c", b"c" * 10)
+
+    assert store.get("a") is not None
+    store.put("d", b"d" * 10)
+    assert store.get("b") is None
+    assert store.get("a") == b"a" * 10
+
+
+def test_oversized_image_is_not_cached(clock):
+    """Test that an image larger than the cap is skipped without evicting others"""
+    store = _BoundedImageStore(max_bytes=30, ttl_seconds=60)
+    store.put("a", b"a" * 10)
+    store.put("huge", b"h" * 31)
+    assert store.get("huge") is None
+    assert store.get("a") == b"a" * 10
+    assert store.nbytes == 10
+
+
+def test_idle_entries_expire(clock):
+    """Test that entries idle longer than the TTL are dropped"""
+    store = _BoundedImageStore(max_bytes=100, ttl_seconds=60)
+    store.put("a", b"a" * 10)
+    clock.now += 30
+    store.put("b", b"b" * 10)
+
+    clock.now += 31  # a idle for 61s, b for 31s
+    assert store.get("a") is None
+    assert store.get("b") == b"b" * 10
+    assert len(store) == 1
+    assert store.nbytes == 10
+
+
+def test_get_refreshes_ttl(clock):
+    """Test that reading an entry restarts its idle timer"""
+    store = _BoundedImageStore(max_bytes=100, ttl_seconds=60)
+    store.put("a", b"a" * 10)
+    store.put("b", b"b" * 10)
+
+    clock.now += 50
+    assert store.get("a") is not None
+    clock.now += 50  # a idle for 50s, b for 100s
+    assert store.get("b") is None
+    assert store.get("a") == b"a" * 10
+
+
+def test_put_sweeps_expired_entries(clock):
+    """Test that writes also reclaim the bytes of expired entries"""
+    store = _BoundedImageStore(max_bytes=100, ttl_seconds=60)
+    store.put("a", b"a" * 40)
+    store.put("b", b"b" * 40)
+    clock.now += 61
+    store.put("c", b"c" * 10)
+    assert len(store) == 1
+    assert store.nbytes == 10
@@ -0,0 +1,77 @@
+"""
+Test suite for ONNX session loading and the optimized graph cache
+"""
+import os
+import types
+
+import pytest
+
+from biometrics import _open_session
+
+
+class FakeOrt:
+    """Stands in for onnxruntime: records each session load and what it was given"""
+
+    GraphOptimizationLevel = types.SimpleNamespace(ORT_ENABLE_ALL="all", ORT_DISABLE_ALL="none")
+    ExecutionMode = types.SimpleNamespace(ORT_PARALLEL="parallel")
+
+    class SessionOptions:
+        def __init__(self):
+            self.optimized_model_filepath = ""
+
+        def add_session_config_entry(self, key, value):
+            pass
+
+    def __init__(self, save_fails=False):
+        self.save_fails = save_fails
+        self.loads = []
+
+    def InferenceSession(self, path, sess_options, providers):
+        self.loads.append((os.path.basename(path), sess_options.graph_optimization_level,
+                           sess_options.optimized_model_filepath))
+        if sess_options.optimized_model_filepath:
+            if self.save_fails:
+                raise RuntimeError("read-only file system")
+            with open(sess_options.optimized_model_filepath, "wb") as f:
+                f.write(b"optimized")
+        return object()
+
+
+@pytest.fixture
+def model(tmp_path):
+    path = tmp_path / "arcface.onnx"
+    path.write_bytes(b"model")
+    return path
+
+
+def test_first_load_saves_optimized_graph(model):
+    """Test that a model without a cached graph is optimized and saved"""
+    ort = FakeOrt()
+    _open_session(ort, model)
+    assert ort.loads == [("arcface.onnx", "all", str(model.with_suffix(".opt.onnx")))]
+    assert model.with_suffix(".opt.onnx").exists()
+
+
+def test_cached_graph_is_reused_unoptimized(model):
+    """Test that a fresh .opt.onnx is loaded with graph optimization off and not re-saved"""
+    _open_session(FakeOrt(), model)
+    ort = FakeOrt()
+    _open_session(ort, model)
+    assert ort.loads == [("arcface.opt.onnx", "none", "")]
+
+
+def test_stale_cached_graph_is_rebuilt(model):
+    """Test that a model newer than its cached graph is optimized again"""
+    _open_session(FakeOrt(), model)
+    opt = model.with_suffix(".opt.onnx")
+    os.utime(opt, (opt.stat().st_mtime - 10,) * 2)
+    ort = FakeOrt()
+    _open_session(ort, model)
+    assert ort.loads[0][0] == "arcface.onnx"
+
+
+def test_save_failure_still_loads_model(model):
+    """Test that failing to write the cached graph loads the original model instead of raising"""
+    ort = FakeOrt(save_fails=True)
+    assert _open_session(ort, model) is not None
+    assert ort.loads[-1] == ("arcface.onnx", "all", "")
@@ -58,4 +58,14 @@ async def health():
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8102, reload=True)
+    import importlib.util
+
+    # uvloop/httptools come with uvicorn[standard]; uvloop has no Windows build
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8102,
+        reload=True,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+    )